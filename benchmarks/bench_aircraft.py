@@ -0,0 +1,232 @@
+"""
+Micro-benchmark de la représentation des avions : mémoire par avion et coût d'un tick.
+
+    python benchmarks/bench_aircraft.py [--sizes 100 1000 5000] [--ticks 50]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.settings import LEVELS
+from src.model.simulation import SimulationModel
+from src.model.aircraft import CommercialAircraft
+
+
+class DictAircraft:
+    """Représentation d'origine, pour comparaison : attributs dans un __dict__, état et incident en chaînes."""
+
+    def __init__(self, uid, x, y, heading, altitude):
+        self.id = uid
+        self.x = x
+        self.y = y
+        self.heading = float(heading)
+        self.target_heading = float(heading)
+        self.altitude = altitude
+        self.speed = 250
+        self.base_score = 100
+        self.fuel = 100.0
+        self.consumption = 0.4
+        self.type_label = "COMMERCIAL"
+        self.despawn_timer = 0.0
+        self.state = "FLYING"
+        self.score_counted = False
+        self.event = None
+
+    def update_position(self, dt):
+        if self.state in ["CRASHED", "LANDED"]:
+            return
+        if self.event == "MAYDAY" and self.state != "LANDING":
+            self.altitude -= 120 * dt
+            if self.speed > 220: self.speed -= 15 * dt
+            if self.state == "HOLDING": self.state = "FLYING"
+        if self.state == "LANDING":
+            self._handle_landing(dt)
+        elif self.state == "HOLDING":
+            self.heading = (self.heading + 3.0) % 360
+            self.fuel -= self.consumption * dt
+        else:
+            self._handle_flying(dt)
+        if self.speed > 0:
+            px_speed = self.speed * 0.1
+            rad = math.radians(self.heading - 90)
+            self.x += px_speed * dt * math.cos(rad)
+            self.y += px_speed * dt * math.sin(rad)
+        if self.state != "LANDING":
+            if math.sqrt((self.x - 500) ** 2 + (self.y - 500) ** 2) > 510:
+                self.state = "OUT_OF_BOUNDS"
+
+    def _handle_flying(self, dt):
+        diff = self.target_heading - self.heading
+        diff = (diff + 180) % 360 - 180
+        if abs(diff) < 3.0:
+            self.heading = self.target_heading
+        else:
+            self.heading += 3.0 if diff > 0 else -3.0
+        self.heading %= 360
+        self.fuel -= self.consumption * dt
+
+    def _handle_landing(self, dt):
+        dx, dy = 500 - self.x, 900 - self.y
+        dist = math.sqrt(dx ** 2 + dy ** 2)
+        if dist > 10:
+            self.heading = (math.degrees(math.atan2(dy, dx)) + 90) % 360
+        if dist > 300:
+            if self.event != "MAYDAY" and self.altitude > 1500: self.altitude -= 30 * dt
+            if self.speed > 300: self.speed -= 20 * dt
+        elif dist > 10:
+            min_safe = dist * 2.0
+            pot_alt = self.altitude - (400 * dt)
+            self.altitude = pot_alt if pot_alt > min_safe else max(self.altitude, min_safe)
+            if self.speed > 160: self.speed -= 100 * dt
+        else:
+            self.altitude = 0
+            self.speed = max(0, self.speed - 150 * dt)
+
+
+class DictModel:
+    """Boucle de tick d'origine sur des DictAircraft : états en chaînes, collisions par paires."""
+
+    def __init__(self, aircrafts, seed=0):
+        self.aircrafts = aircrafts
+        self.rng = random.Random(seed)
+        self.score = 0
+        self.stats = {"landed": 0, "crashed": 0, "out": 0}
+        self.spawn_timer = 0
+        self.current_level = 1
+        self.landing_zone = (450, 850, 100, 100)
+
+    def update(self, dt):
+        self.spawn_timer += dt
+        self._trigger_events()
+        self._update_aircrafts(dt)
+        self._check_collisions()
+
+    def _trigger_events(self):
+        prob = 0.0002 * self.current_level
+        for ac in self.aircrafts:
+            if ac.state in ["FLYING", "HOLDING"] and ac.event is None:
+                if self.rng.random() < prob:
+                    ac.event = "MAYDAY" if self.rng.randint(1, 3) == 1 else "URGENCY"
+
+    def _update_aircrafts(self, dt):
+        keep = []
+        lx, ly, lw, lh = self.landing_zone
+        for ac in self.aircrafts:
+            if not ac.score_counted:
+                if ac.state == "LANDED":
+                    self.score += ac.base_score
+                    self.stats["landed"] += 1
+                    ac.score_counted = True
+                elif ac.state == "CRASHED":
+                    self.score -= 50
+                    self.stats["crashed"] += 1
+                    ac.score_counted = True
+                elif ac.state == "OUT_OF_BOUNDS":
+                    self.score -= 20
+                    self.stats["out"] += 1
+                    ac.score_counted = True
+            if ac.state in ["CRASHED", "OUT_OF_BOUNDS"]:
+                ac.despawn_timer += dt
+                if ac.despawn_timer < 2.0: keep.append(ac)
+                continue
+            if ac.state == "LANDED": continue
+            if ac.fuel <= 0 and ac.state != "LANDING":
+                ac.state = "CRASHED"
+                keep.append(ac)
+                continue
+            ac.update_position(dt)
+            if ac.altitude <= 0:
+                ac.altitude = 0
+                on_rw = (lx - 20 <= ac.x <= lx + lw + 20) and (ly - 20 <= ac.y <= ly + lh + 20)
+                if ac.state == "LANDING" and on_rw and ac.speed <= 1:
+                    ac.state = "LANDED"
+                elif ac.state != "LANDING" or not on_rw:
+                    ac.state = "CRASHED"
+            keep.append(ac)
+        self.aircrafts = [a for a in keep if not (a.state == "OUT_OF_BOUNDS" and math.sqrt(
+            (a.x - 500) ** 2 + (a.y - 500) ** 2) > 700)]
+
+    def _check_collisions(self):
+        for i, a1 in enumerate(self.aircrafts):
+            for a2 in self.aircrafts[i + 1:]:
+                valid = ["FLYING", "LANDING", "HOLDING"]
+                if a1.state in valid and a2.state in valid:
+                    d = math.sqrt((a1.x - a2.x) ** 2 + (a1.y - a2.y) ** 2)
+                    if d < 30 and abs(a1.altitude - a2.altitude) < 100:
+                        a1.state = "CRASHED"
+                        a2.state = "CRASHED"
+
+
+def memory_per_aircraft(cls, n=10000):
+    """Octets alloués par avion (objet + attributs), mesurés avec tracemalloc."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    fleet = [cls(f"AF{i:05d}", 500.0, 500.0, 90, 3000) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del fleet
+    return (after - before) / n
+
+
+PHASES = ("update", "_trigger_events", "_update_aircrafts", "_check_collisions")
+
+
+def _time_phases(model, ticks, dt):
+    """Durée moyenne (ms) de chaque phase ; chaque phase repart du même trafic."""
+    timings = {}
+    for phase in PHASES:
+        fn = getattr(model, phase)
+        args = (dt,) if phase in ("update", "_update_aircrafts") else ()
+        snapshot = [(ac, ac.x, ac.y, ac.heading, ac.altitude, ac.fuel, ac.state) for ac in model.aircrafts]
+        start = time.perf_counter()
+        for _ in range(ticks):
+            fn(*args)
+        timings[phase] = (time.perf_counter() - start) / ticks * 1000
+        for ac, x, y, heading, alt, fuel, state in snapshot:
+            ac.x, ac.y, ac.heading, ac.altitude, ac.fuel, ac.state = x, y, heading, alt, fuel, state
+        model.aircrafts = [s[0] for s in snapshot]
+    return timings
+
+
+def tick_time(n, ticks, dt=0.03):
+    """Durées (ms) d'un tick et de ses phases avec n avions en vol : {phase: (origine, actuel)}."""
+    levels = dict(LEVELS)
+    levels[1] = dict(LEVELS[1], total=n, rate=1e9)
+    model = SimulationModel(1000, 1000, seed=0, levels=levels)
+    model.reset_game()
+    for _ in range(n):
+        model.spawn_aircraft()
+    # Trafic réparti sur tout le scope (sinon l'anneau d'apparition finit en collisions en chaîne)
+    rng = random.Random(1)
+    for ac in model.aircrafts:
+        r, a = 400 * rng.random() ** 0.5, rng.uniform(0, 2 * math.pi)
+        ac.x, ac.y = 500 + r * math.cos(a), 500 + r * math.sin(a)
+        ac.altitude = rng.uniform(1000, 20000)
+    # Même trafic dans la représentation d'origine
+    replica = DictModel([DictAircraft(ac.id, ac.x, ac.y, ac.heading, ac.altitude) for ac in model.aircrafts])
+    old, new = _time_phases(replica, ticks, dt), _time_phases(model, ticks, dt)
+    return {phase: (old[phase], new[phase]) for phase in PHASES}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--ticks", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    before, after = memory_per_aircraft(DictAircraft), memory_per_aircraft(CommercialAircraft)
+    print(f"Mémoire par avion : {before:.0f} octets (__dict__, chaînes) -> {after:.0f} octets (__slots__)")
+    print(f"{'avions':>7} " + " ".join(f"{p:>21}" for p in PHASES) + "   (ms, origine -> actuel)")
+    for n in args.sizes:
+        t = tick_time(n, args.ticks)
+        print(f"{n:>7} " + " ".join(f"{t[p][0]:9.3f} ->{t[p][1]:9.3f}" for p in PHASES))
+
+
+if __name__ == "__main__":
+    main()
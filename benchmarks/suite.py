@@ -0,0 +1,243 @@
+"""
+Suite de benchmarks de montée en charge : coût d'un tick, des collisions, des points de reprise
+et de l'affichage.
+
+    python benchmarks/suite.py                              # 10 à 10 000 avions, résultats JSON sur stdout
+    python benchmarks/suite.py --output bench.json          # enregistre les résultats
+    python benchmarks/suite.py --compare baseline.json      # compare à une référence (code 1 si régression)
+
+Multi-cadence : mesurer les deux modes après le même échauffement (virages initiaux terminés),
+puis comparer ; en multi-cadence chaque mesure couvre LOD_PERIOD ticks et donne la moyenne par tick.
+
+    python benchmarks/suite.py --no-qt --warmup 40 --output plein.json
+    python benchmarks/suite.py --no-qt --warmup 40 --multi-rate --compare plein.json
+
+Altitudes : 500 à 20 000 ft par défaut ; --altitudes 2000 4000 reprend la tranche des apparitions
+en jeu, où collisions et prédiction de conflits élaguent beaucoup moins par l'altitude.
+
+Points de reprise (save_state / load_state, pris dans le thread de simulation) : --state-budget
+signale (code 1) ceux qui dépassent une durée donnée, par exemple une frame à 60 Hz.
+
+    python benchmarks/suite.py --no-qt --sizes 1000 5000 --state-budget 16
+
+Les mesures Qt (RadarWidget.paintEvent, StatusPanel.update_stats) utilisent la plateforme
+"offscreen" : elles tournent sur une machine Linux sans écran. Sans PySide6 elles sont ignorées.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from src.settings import SIM_DT, LOD_PERIOD
+from src.model.simulation import SimulationModel
+from src.model.aircraft import CommercialAircraft, PrivateJet, FighterJet
+from src.model.aircraft.states import State, Event
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_ALTITUDES = (500, 20000)
+MODEL_PHASES = ("update", "_update_aircrafts", "_check_collisions", "_trigger_events", "_predict_conflicts")
+STATE_PHASES = ("save_state", "load_state")
+# Répartition du trafic : surtout des avions en vol, quelques-uns dans chaque autre état
+STATE_MIX = [(State.FLYING, 0.55), (State.HOLDING, 0.15), (State.LANDING, 0.15),
+             (State.CRASHED, 0.05), (State.OUT_OF_BOUNDS, 0.05), (State.LANDED, 0.05)]
+
+
+def build_model(n, seed=0, backend="python", multi_rate=False, warmup=0, altitudes=DEFAULT_ALTITUDES):
+    """
+    SimulationModel peuplé de n avions mixtes (types, états, incidents), répartis sur le scope
+    entre les altitudes données, puis avancé de `warmup` ticks. Prédiction de conflits active, comme en jeu.
+    """
+    rng = random.Random(seed)
+    model = SimulationModel(1000, 1000, backend=backend, seed=seed, multi_rate=multi_rate, predict_conflicts=True)
+    model.reset_game()
+    states, weights = zip(*STATE_MIX)
+    for i in range(n):
+        r, a = 450 * math.sqrt(rng.random()), rng.uniform(0, 2 * math.pi)
+        x, y = 500 + r * math.cos(a), 500 + r * math.sin(a)
+        heading = rng.uniform(0, 360)
+        alt = rng.uniform(*altitudes)
+        kind = rng.random()
+        if kind < 0.6:
+            ac = CommercialAircraft(f"AF{i:05d}", x, y, heading, alt, rng)
+        elif kind < 0.9:
+            ac = PrivateJet(f"PJ{i:05d}", x, y, heading, alt, rng)
+        else:
+            ac = FighterJet(f"MIL{i:05d}", x, y, heading, alt, rng)
+        ac.target_heading = (heading + rng.uniform(-90, 90)) % 360
+        ac.state = rng.choices(states, weights)[0]
+        if rng.random() < 0.1:
+            ac.event = rng.choice([Event.MAYDAY, Event.URGENCY])
+        model.add_aircraft(ac)
+    model.planes_spawned = n
+    model.next_id = n + 1
+    for _ in range(warmup):
+        model.update(SIM_DT)
+    return model
+
+
+def measure(fn, setup=None, min_time=0.2, min_runs=3, max_runs=50):
+    """Durée médiane (ms) d'un appel ; setup() est exécuté avant chaque appel, hors chronomètre."""
+    samples = []
+    total = 0.0
+    while len(samples) < min_runs or (total < min_time and len(samples) < max_runs):
+        if setup: setup()
+        start = time.perf_counter()
+        fn()
+        d = time.perf_counter() - start
+        samples.append(d)
+        total += d
+    return statistics.median(samples) * 1000
+
+
+def bench_model(n, backend, multi_rate=False, warmup=0, altitudes=DEFAULT_ALTITUDES):
+    results = {}
+    # Multi-cadence : le coût varie d'un tick à l'autre, on mesure une fenêtre complète
+    repeat = LOD_PERIOD if multi_rate else 1
+    for phase in MODEL_PHASES:
+        state = {}
+
+        def setup():
+            # Trafic reconstruit à l'identique avant chaque mesure : tous les appels voient la même charge
+            state["model"] = build_model(n, backend=backend, multi_rate=multi_rate, warmup=warmup,
+                                         altitudes=altitudes)
+
+        def run():
+            m = state["model"]
+            for _ in range(repeat):
+                if phase in ("update", "_update_aircrafts"):
+                    getattr(m, phase)(SIM_DT)
+                else:
+                    getattr(m, phase)()
+
+        results[phase] = measure(run, setup) / repeat
+    return results
+
+
+def bench_savestate(n, backend, multi_rate=False, warmup=0, altitudes=DEFAULT_ALTITUDES):
+    model = build_model(n, backend=backend, multi_rate=multi_rate, warmup=warmup, altitudes=altitudes)
+    data = model.save_state()
+    return {"save_state": measure(model.save_state), "load_state": measure(lambda: model.load_state(data))}
+
+
+def bench_qt(n, backend):
+    try:
+        from PySide6.QtWidgets import QApplication
+    except ImportError:
+        return {}
+    from src.view.radar_widget import RadarWidget
+    from src.view.panels import StatusPanel
+
+    app = QApplication.instance() or QApplication([])
+    model = build_model(n, backend=backend)
+
+    radar = RadarWidget()
+    radar.resize(1000, 1000)
+    radar.update_data(model.aircrafts, model.landing_zone)
+    radar.grab()  # premier rendu : caches du fond et des sprites
+
+    panel = StatusPanel()
+    for ac in model.aircrafts:
+        panel.model.add(ac)
+    cfg = model.get_level_cfg()
+    info = {"current": 1, "spawned": n, "total": cfg["total"], "min": cfg["score_min"], "next": 0}
+
+    return {
+        "RadarWidget.paintEvent": measure(radar.grab),
+        # Entre deux mesures le modèle avance d'un tick : les lignes changent comme en jeu
+        "StatusPanel.update_stats": measure(lambda: panel.update_stats(model.score, model.stats, info, model.aircrafts),
+                                            setup=lambda: model._update_aircrafts(SIM_DT)),
+    }
+
+
+def run_suite(sizes, backend="python", qt=True, multi_rate=False, warmup=0, altitudes=DEFAULT_ALTITUDES):
+    results = {}
+    for n in sizes:
+        timings = bench_model(n, backend, multi_rate, warmup, altitudes)
+        timings.update(bench_savestate(n, backend, multi_rate, warmup, altitudes))
+        if qt:
+            timings.update(bench_qt(n, backend))
+        for name, ms in timings.items():
+            results.setdefault(name, {})[str(n)] = round(ms, 4)
+        print(f"  {n:>6} avions : " + ", ".join(f"{k}={v:.3f} ms" for k, v in timings.items()), file=sys.stderr)
+    return {
+        "meta": {
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "backend": backend,
+            "multi_rate": multi_rate,
+            "warmup": warmup,
+            "altitudes": list(altitudes),
+            "sizes": sizes,
+            "unit": "ms (médiane par appel)",
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Affiche les rapports courant/référence ; renvoie la liste des régressions."""
+    regressions = []
+    print(f"{'mesure':<28} {'avions':>7} {'réf.':>10} {'actuel':>10} {'ratio':>7}")
+    for name, by_size in current["results"].items():
+        for n, ms in by_size.items():
+            ref = baseline.get("results", {}).get(name, {}).get(n)
+            if ref is None: continue
+            ratio = ms / ref if ref > 0 else float("inf")
+            flag = ""
+            if ratio > threshold:
+                flag = "  << RÉGRESSION"
+                regressions.append((name, n, ratio))
+            print(f"{name:<28} {n:>7} {ref:>10.3f} {ms:>10.3f} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def over_budget(report, budget):
+    """Affiche les points de reprise plus longs que `budget` ms ; renvoie leur liste."""
+    slow = [(name, n, ms) for name in STATE_PHASES for n, ms in report["results"].get(name, {}).items() if ms > budget]
+    for name, n, ms in slow:
+        print(f"{name} ({n} avions) : {ms:.3f} ms > {budget} ms  << HORS BUDGET", file=sys.stderr)
+    return slow
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de montée en charge du simulateur")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--backend", choices=["python", "numpy"], default="python")
+    parser.add_argument("--multi-rate", action="store_true", help="modèle en multi-cadence (moteur python)")
+    parser.add_argument("--warmup", type=int, default=0, help="ticks simulés avant chaque mesure du modèle")
+    parser.add_argument("--altitudes", type=float, nargs=2, metavar=("BAS", "HAUT"), default=DEFAULT_ALTITUDES,
+                        help="tranche d'altitude des avions (ft)")
+    parser.add_argument("--no-qt", action="store_true", help="ne mesure que le modèle")
+    parser.add_argument("--output", metavar="FICHIER", help="écrit les résultats JSON dans ce fichier")
+    parser.add_argument("--compare", metavar="REFERENCE", help="compare à un fichier de résultats précédent")
+    parser.add_argument("--threshold", type=float, default=1.25, help="ratio au-delà duquel on signale une régression")
+    parser.add_argument("--state-budget", type=float, metavar="MS",
+                        help="durée maximale d'un save_state / load_state (code 1 si dépassée)")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.backend, qt=not args.no_qt, multi_rate=args.multi_rate, warmup=args.warmup,
+                       altitudes=tuple(args.altitudes))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    failed = args.state_budget is not None and bool(over_budget(report, args.state_budget))
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        failed = bool(compare(report, baseline, args.threshold)) or failed
+    elif not args.output:
+        print(json.dumps(report, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Partie sans interface graphique, simulée aussi vite que le CPU le permet.
+N'importe jamais PySide6 : utilisable sur un serveur sans écran.
+
+    python headless.py                       # aucun ordre donné
+    python headless.py --script ordres.csv   # ordres scriptés (voir ScriptedPolicy)
+    python headless.py --multi-rate          # trafic à faible risque intégré moins souvent
+    python headless.py --replay partie.jsonl # rejoue une partie enregistrée et la vérifie
+    python headless.py --telemetry 8765      # diffuse l'état à chaque tick (voir src/net/telemetry.py)
+    python headless.py --commands 8766       # ordres envoyés par lots sur une socket (voir src/net/commands.py)
+"""
+import argparse
+import json
+import random
+import sys
+import time
+
+from src.settings import SIM_DT
+from src.model.simulation import SimulationModel
+from src.model.policies import NoopPolicy, ScriptedPolicy
+from src.model.recorder import CommandRecorder, replay
+from src.model.snapshot import take_snapshot
+from src.net.commands import CommandServer
+from src.net.server import parse_address
+from src.net.telemetry import TelemetryServer
+from src.profiler import TickProfiler, profile_model
+
+
+def run_session(model, policy, max_ticks=None, profiler=None, telemetry=None, commands=None):
+    """Enchaîne les niveaux jusqu'au game over (ou max_ticks) et renvoie le bilan."""
+    model.reset_game()
+    ticks = 0
+    refused = 0
+    start = time.perf_counter()
+
+    while not model.game_over:
+        if max_ticks is not None and ticks >= max_ticks: break
+        if model.level_complete:
+            model.start_next_level()
+            continue
+
+        for ac_id, cmd_type, value in policy(model, ticks):
+            if model.apply_command(ac_id, cmd_type, value) == "REFUSED":
+                refused += 1
+        if commands is not None:
+            commands.apply_pending(model)  # lots reçus à distance, chacun d'un bloc
+        model.update(SIM_DT)
+        ticks += 1
+        if profiler is not None: profiler.end_frame(model.tick)
+        if telemetry is not None: telemetry.publish(take_snapshot(model))
+
+    elapsed = time.perf_counter() - start
+    if model.recorder is not None:
+        model.recorder.checkpoint(model)
+    return {
+        "ticks": ticks,
+        "sim_time": round(ticks * SIM_DT, 2),
+        "wall_time": round(elapsed, 4),
+        "ticks_per_second": round(ticks / elapsed, 1) if elapsed > 0 else None,
+        "score": model.score,
+        "level": model.current_level,
+        "game_over": model.game_over,
+        "stats": dict(model.stats),
+        "refused": refused,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulation ATC sans interface")
+    parser.add_argument("--script", help="fichier CSV d'ordres (tick,id,commande,valeur)")
+    parser.add_argument("--max-ticks", type=int, default=None, help="arrêt forcé après N ticks")
+    parser.add_argument("--backend", choices=["python", "numpy"], default="python")
+    parser.add_argument("--multi-rate", action="store_true",
+                        help="avions à faible risque intégrés moins souvent (moteur python)")
+    parser.add_argument("--seed", type=int, default=None, help="graine de la partie")
+    parser.add_argument("--record", metavar="FICHIER", help="enregistre la partie jouée")
+    parser.add_argument("--replay", metavar="FICHIER", help="rejoue un enregistrement et vérifie l'état final")
+    parser.add_argument("--profile", metavar="CSV", help="temps par phase et par tick exportés dans ce fichier")
+    parser.add_argument("--telemetry", metavar="ADRESSE", help="diffuse l'état à chaque tick (port, hôte:port ou socket Unix)")
+    parser.add_argument("--commands", metavar="ADRESSE", help="accepte des lots d'ordres à distance (port, hôte:port ou socket Unix)")
+    parser.add_argument("--json", action="store_true", help="bilan au format JSON")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        report = replay(args.replay)
+        if args.json:
+            print(json.dumps(report))
+        else:
+            print(f"Rejeu : {report['ticks']} ticks en {report['wall_time']} s ({report['ticks_per_second']} ticks/s)")
+            print(f"Score final : {report['score']} - Vérifications : {report['checks']}, écarts : {report['mismatches']}")
+        return 1 if report["mismatches"] else 0
+
+    policy = ScriptedPolicy(args.script) if args.script else NoopPolicy()
+    seed = args.seed
+    if args.record and seed is None:
+        seed = random.randrange(2 ** 32)
+    model = SimulationModel(1000, 1000, backend=args.backend, seed=seed, multi_rate=args.multi_rate)
+    if args.record:
+        model.recorder = CommandRecorder(args.record, seed, args.backend, SIM_DT, args.multi_rate)
+    profiler = None
+    if args.profile:
+        profiler = TickProfiler()
+        profile_model(profiler, model)
+        profiler.enable()
+    telemetry = None
+    if args.telemetry:
+        telemetry = TelemetryServer(**parse_address(args.telemetry))
+        telemetry.start()
+    commands = None
+    if args.commands:
+        commands = CommandServer(**parse_address(args.commands))
+        commands.start()
+    report = run_session(model, policy, args.max_ticks, profiler, telemetry, commands)
+    for server in (telemetry, commands):
+        if server is not None: server.close()
+    if profiler is not None:
+        profiler.export_csv(args.profile)
+    if model.recorder is not None:
+        model.recorder.close()
+
+    if args.json:
+        print(json.dumps(report))
+    else:
+        print(f"Ticks : {report['ticks']} ({report['sim_time']} s simulées en {report['wall_time']} s)")
+        print(f"Vitesse : {report['ticks_per_second']} ticks/s")
+        print(f"Niveau atteint : {report['level']} - Score final : {report['score']}")
+        s = report["stats"]
+        print(f"Posés : {s['landed']} - Crashs : {s['crashed']} - Sortis : {s['out']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
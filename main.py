@@ -1,11 +1,22 @@
 import sys
+import argparse
 from PySide6.QtWidgets import QApplication
 from src.controller.game_controller import GameController
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=int, default=None, help="graine de la partie (reproductible)")
+    parser.add_argument("--record", metavar="FICHIER", help="enregistre la partie (rejouable avec headless.py --replay)")
+    parser.add_argument("--profile", action="store_true", help="profilage par phase dès le lancement (F3 pour basculer)")
+    parser.add_argument("--telemetry", metavar="ADRESSE", help="diffuse l'état à chaque tick (port, hôte:port ou socket Unix)")
+    parser.add_argument("--commands", metavar="ADRESSE", help="accepte des lots d'ordres à distance (port, hôte:port ou socket Unix)")
+    args, qt_args = parser.parse_known_args()
 
-    controller = GameController()
+    app = QApplication(sys.argv[:1] + qt_args)
+
+    controller = GameController(seed=args.seed, record_path=args.record, profile=args.profile,
+                                telemetry=args.telemetry, commands=args.commands)
+    app.aboutToQuit.connect(controller.close)
     controller.start()
 
     sys.exit(app.exec())
\ No newline at end of file
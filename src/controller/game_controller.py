@@ -1,91 +1,182 @@
+import random
+import time
 from PySide6.QtCore import QTimer
 from src.model.simulation import SimulationModel
+from src.model.recorder import CommandRecorder
+from src.profiler import TickProfiler, profile_model
+from src.controller.sim_worker import SimulationWorker
+from src.net.commands import CommandServer
+from src.net.server import parse_address
+from src.net.telemetry import TelemetryServer
 from src.view.main_window import MainWindow
+from src.settings import SIM_DT, FRAME_MS, QUICKSAVE_PATH
 
 class GameController:
-    def __init__(self):
+    def __init__(self, seed=None, record_path=None, profile=False, telemetry=None, commands=None):
         self.view = MainWindow()
-        self.model = SimulationModel(1000, 1000)
+        # Une partie enregistrée doit avoir une graine connue pour pouvoir être rejouée
+        if record_path and seed is None:
+            seed = random.randrange(2 ** 32)
+        self.model = SimulationModel(1000, 1000, seed=seed, predict_conflicts=True)
+        if record_path:
+            self.model.recorder = CommandRecorder(record_path, seed, dt=SIM_DT)
+
+        # La simulation avance dans son propre thread ; l'interface ne lit que ses instantanés
+        self.worker = SimulationWorker(self.model)
+        self.worker.fleet_event.connect(self.view.on_fleet_event)
+        self.worker.command_result.connect(self.on_command_result)
+        self.worker.state_result.connect(self.on_state_result)
+
+        # Télémétrie : diffusion des instantanés depuis le thread de simulation, rien côté affichage
+        self.telemetry = None
+        if telemetry:
+            self.telemetry = TelemetryServer(**parse_address(telemetry))
+            print(f"Télémétrie : {self.telemetry.start()}")
+            self.worker.telemetry = self.telemetry
+
+        # Ordres à distance : chaque lot passe par la file du thread de simulation
+        self.commands = None
+        if commands:
+            self.commands = CommandServer(**parse_address(commands), submit=self.worker.command_batch)
+            print(f"Ordres à distance : {self.commands.start()}")
+
+        # Rafraîchissement de l'affichage : dernier instantané + interpolation depuis le précédent
         self.timer = QTimer()
         self.timer.timeout.connect(self.game_loop)
+        self.snapshot = None
+        self.prev_positions = {}
+
+        # Profilage par phase (F3 : activer/couper, F4 : export CSV)
+        self.profiler = TickProfiler()
+        profile_model(self.profiler, self.model)
+        self.profiler.add_target(self, "update_view", "ui.update_view")
+        self.profiler.add_target(self.view.status_panel, "update_stats", "ui.status_panel")
+        self.profiler.add_target(self.view, "refresh_control_panel", "ui.control_panel")
+        self.profiler.add_target(self.view.radar, "paintEvent", "ui.radar_paint")
+        self.view.radar.profiler = self.profiler
+        if profile: self.profiler.enable()
 
         self.view.command_signal.connect(self.handle_command)
         self.view.start_game_signal.connect(self.start_game)
         self.view.next_level_signal.connect(self.start_next_level)
         self.view.restart_game_signal.connect(self.restart_game)
         self.view.surrender_signal.connect(self.surrender_game)
+        self.view.toggle_profiler_signal.connect(self.toggle_profiler)
+        self.view.export_profile_signal.connect(self.export_profile)
+        self.view.quick_save_signal.connect(lambda: self.worker.quick_save(QUICKSAVE_PATH))
+        self.view.quick_load_signal.connect(lambda: self.worker.quick_load(QUICKSAVE_PATH))
+        self.view.rewind_signal.connect(self.worker.rewind)
+
+        self.worker.start()
 
     def start(self):
         self.view.show()
-        self.update_view()
+        self.timer.start(FRAME_MS)
+        self.game_loop()
 
     def start_game(self):
-        self.model.is_running = True
+        self.worker.post(self.model.start)
         self.view.set_playing_state()
-        self.timer.start(30)
+        self.start_clock()
 
     def start_next_level(self):
-        self.model.start_next_level()
-        self.timer.start(30)
+        self.worker.post(self.model.start_next_level)
+        self.start_clock()
+
+    def start_clock(self):
+        self.prev_positions = {}
+        self.worker.resume()
 
     def restart_game(self):
-        self.model.reset_game()
+        self.worker.post(self.model.reset_game)
         self.view.reset_ui_state()
         self.view.radar.update_data([], self.model.landing_zone)
-        self.update_view()
 
     def surrender_game(self):
-        self.timer.stop()
-        self.model.reset_game()
-        self.model.is_running = False
+        self.worker.pause()
+        self.checkpoint()
+        self.worker.post(self.model.reset_game)
+        self.worker.post(self.model.stop)
         self.view.reset_ui_state()
         self.view.radar.update_data([], self.model.landing_zone)
-        self.update_view()
 
     def game_loop(self):
-        dt = 0.03 #temps de rafraichissement
-        if self.model.level_complete:
-            self.timer.stop()
-            self.view.show_level_popup(self.model.current_level, self.model.score)
-            return
-        if self.model.game_over:
-            self.timer.stop()
-            self.view.show_game_over_popup(self.model.current_level, self.model.score)
-            return
-
-        self.model.update(dt)
-        self.view.radar.update_data(self.model.aircrafts, self.model.landing_zone)
-        self.update_view()
+        prev, snap, published = self.worker.buffer.read()
+        fresh = snap is not self.snapshot
+        if fresh:
+            self.snapshot = snap
+            # Interpolation seulement entre deux ticks consécutifs
+            if prev is not None and prev.tick == snap.tick - 1:
+                self.prev_positions = {ac.id: (ac.x, ac.y, ac.heading) for ac in prev.aircrafts}
+            else:
+                self.prev_positions = {}
+            if self.check_end_of_level(): return
+            self.update_view()
+
+        alpha = min(1.0, (time.perf_counter() - published) / SIM_DT) if self.prev_positions else 1.0
+        if fresh or alpha < 1.0:
+            self.view.radar.update_data(snap.aircrafts, snap.landing_zone, self.prev_positions, alpha, snap.conflicts,
+                                        snap.index)
+        if self.profiler.enabled: self.profiler.end_frame(snap.tick)
+
+    def check_end_of_level(self):
+        snap = self.snapshot
+        if not (snap.level_complete or snap.game_over): return False
+        self.worker.pause()
+        self.timer.stop()  # pas de rafraîchissement pendant la fenêtre modale
+        if snap.level_complete:
+            self.view.show_level_popup(snap.current_level, snap.score)
+        else:
+            self.checkpoint()
+            self.view.show_game_over_popup(snap.current_level, snap.score)
+        self.timer.start(FRAME_MS)
+        return True
+
+    def checkpoint(self):
+        """Note l'empreinte de l'état courant dans l'enregistrement (vérifiée au rejeu)."""
+        self.worker.post_quiet(self._checkpoint)
+
+    def _checkpoint(self):
+        if self.model.recorder is not None:
+            self.model.recorder.checkpoint(self.model)
+
+    def close(self):
+        self.timer.stop()
+        self.worker.shutdown()
+        if self.telemetry is not None:
+            self.telemetry.close()
+        if self.commands is not None:
+            self.commands.close()
+        # Thread de simulation arrêté : on peut toucher au modèle directement
+        self._checkpoint()
+        if self.model.recorder is not None:
+            self.model.recorder.close()
+
+    def toggle_profiler(self):
+        self.profiler.toggle()
+        self.view.radar.update()
+
+    def export_profile(self):
+        path = time.strftime("profil_%Y%m%d_%H%M%S.csv")
+        n = self.profiler.export_csv(path)
+        print(f"Profil : {n} frames exportées dans {path}")
 
     def update_view(self):
-        cfg = self.model.get_level_cfg()
-        info = {
-            "current": self.model.current_level,
-            "spawned": self.model.planes_spawned,
-            "total": cfg["total"],
-            "min": cfg["score_min"],
-            "next": self.model.get_time_before_next_spawn()
-        }
-        self.view.update_ui(self.model.score, self.model.stats, info, self.model.aircrafts)
+        snap = self.snapshot
+        self.view.set_registry(snap.by_id)
+        self.view.update_ui(snap.score, snap.stats, snap.info, snap.aircrafts, snap.conflict_ids)
 
     def handle_command(self, ac_id, cmd_type, value):
-        target = next((a for a in self.model.aircrafts if a.id == ac_id), None)
-        if target:
-            if target.event == "MAYDAY" and cmd_type in ["ALTITUDE", "SPEED", "HOLD"]:
-                print("REFUS : Panne moteur.")
-                return
-
-            if cmd_type == "HEADING":
-                target.target_heading = value
-                if target.state == "HOLDING": target.state = "FLYING"
-            elif cmd_type == "ALTITUDE":
-                target.altitude += value
-                target.altitude = max(0, target.altitude)
-            elif cmd_type == "SPEED":
-                target.speed += value
-                target.speed = max(150, min(800, target.speed))
-            elif cmd_type == "HOLD":
-                if target.state == "FLYING": target.state = "HOLDING"
-                else: target.state = "FLYING"
-            elif cmd_type == "LAND":
-                target.state = "LANDING"
\ No newline at end of file
+        self.worker.command(ac_id, cmd_type, value)
+
+    def on_command_result(self, ac_id, cmd_type, status):
+        if status == "REFUSED":
+            print("REFUS : Panne moteur.")
+
+    def on_state_result(self, kind, tick):
+        if tick is None:
+            print({"SAVE": "Sauvegarde impossible.", "LOAD": "Chargement impossible.",
+                   "REWIND": "Aucun point de reprise plus ancien."}[kind])
+        else:
+            print({"SAVE": "Partie sauvegardée", "LOAD": "Partie chargée",
+                   "REWIND": "Retour arrière"}[kind] + f" (tick {tick}).")
@@ -0,0 +1,159 @@
+import queue
+import threading
+import time
+from PySide6.QtCore import QObject, Signal
+from src.model.savestate import CheckpointRing
+from src.model.snapshot import SnapshotBuffer, take_snapshot, snapshot_aircraft
+from src.settings import SIM_DT, MAX_SIM_STEPS, CHECKPOINT_PERIOD, CHECKPOINT_CAPACITY
+
+
+class SimulationWorker(QObject):
+    """
+    Fait tourner le SimulationModel dans son propre thread, à cadence fixe (SIM_DT).
+
+    - Seul ce thread touche au modèle : ordres et changements d'étape (start, reset...)
+      passent par une file et sont appliqués entre deux ticks.
+    - Chaque tick publie un instantané immuable dans `buffer` (double tampon).
+    - Les notifications du registre sont relayées par signal : Qt les remet
+      au thread graphique (connexion en file d'attente).
+    - Des points de reprise sont pris à intervalle régulier (retour arrière).
+    - Si `telemetry` est fourni (TelemetryServer), chaque instantané lui est aussi confié.
+    """
+    fleet_event = Signal(str, object, object, object)  # type, avion (instantané), ancienne, nouvelle valeur
+    command_result = Signal(str, str, str)             # id, commande, "OK" / "REFUSED" / "UNKNOWN"
+    state_result = Signal(str, object)                 # "SAVE" / "LOAD" / "REWIND", tick ou None (échec)
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+        self.buffer = SnapshotBuffer()
+        self.inbox = queue.SimpleQueue()
+        self.running = False  # horloge de simulation (arrêtée entre les niveaux)
+        self.checkpoints = CheckpointRing(CHECKPOINT_CAPACITY, CHECKPOINT_PERIOD)
+        self.telemetry = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        model.registry.subscribe(self._relay)
+        self._publish()
+
+    # --- Côté thread graphique ---
+    def start(self):
+        self._thread.start()
+
+    def shutdown(self):
+        self._stop.set()
+        self.inbox.put(None)  # réveille la boucle
+        if self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+
+    def post(self, fn, *args):
+        """Exécute fn(*args) dans le thread de simulation, à la prochaine frontière de tick, puis publie."""
+        self.inbox.put((fn, args, True))
+
+    def post_quiet(self, fn, *args):
+        """Comme post, sans nouvel instantané (fn ne modifie pas l'état visible)."""
+        self.inbox.put((fn, args, False))
+
+    def command(self, ac_id, cmd_type, value):
+        self.post(self._apply_command, ac_id, cmd_type, value)
+
+    def command_batch(self, batch):
+        """Lot d'ordres à distance (src/net/commands.py), appliqué d'un bloc entre deux ticks."""
+        self.post(self._apply_batch, batch)
+
+    def resume(self):
+        self.post_quiet(self._set_running, True)
+
+    def pause(self):
+        self.post_quiet(self._set_running, False)
+
+    def quick_save(self, path):
+        self.post_quiet(self._save, path)
+
+    def quick_load(self, path):
+        self.post(self._load, path)
+
+    def rewind(self, steps=1):
+        self.post(self._rewind, steps)
+
+    # --- Côté thread de simulation ---
+    def _set_running(self, running):
+        self.running = running
+
+    def _apply_command(self, ac_id, cmd_type, value):
+        self.command_result.emit(ac_id, cmd_type, self.model.apply_command(ac_id, cmd_type, value))
+
+    def _apply_batch(self, batch):
+        batch.apply(self.model, self.command_result.emit)
+
+    def _save(self, path):
+        try:
+            with open(path, "wb") as f:
+                f.write(self.model.save_state())
+        except OSError:
+            self.state_result.emit("SAVE", None)
+        else:
+            self.state_result.emit("SAVE", self.model.tick)
+
+    def _load(self, path):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            self.model.load_state(data)
+        except (OSError, ValueError):
+            self.state_result.emit("LOAD", None)
+        else:
+            self.state_result.emit("LOAD", self.model.tick)
+
+    def _rewind(self, steps):
+        self.state_result.emit("REWIND", self.checkpoints.rewind(self.model, steps))
+
+    def _publish(self):
+        snap = take_snapshot(self.model)
+        self.buffer.publish(snap)
+        if self.telemetry is not None:
+            self.telemetry.publish(snap)
+
+    def _relay(self, kind, ac, old, new):
+        self.fleet_event.emit(kind, snapshot_aircraft(ac), old, new)
+
+    def _drain(self, timeout):
+        """Applique les ordres en attente ; attend au plus `timeout` s le premier."""
+        changed = False
+        try:
+            item = self.inbox.get(timeout=timeout) if timeout > 0 else self.inbox.get_nowait()
+            while True:
+                if item is not None:
+                    fn, args, publish = item
+                    fn(*args)
+                    changed |= publish
+                item = self.inbox.get_nowait()
+        except queue.Empty:
+            pass
+        return changed
+
+    def _run(self):
+        model = self.model
+        next_tick = time.perf_counter()
+        while not self._stop.is_set():
+            # Attente jusqu'au prochain tick, interrompue par les ordres qui arrivent
+            changed = self._drain(next_tick - time.perf_counter() if self.running else SIM_DT)
+            if self._stop.is_set(): break
+
+            now = time.perf_counter()
+            if not self.running:
+                next_tick = now
+            else:
+                steps = 0
+                while now >= next_tick and steps < MAX_SIM_STEPS:
+                    model.update(SIM_DT)
+                    self.checkpoints.maybe_push(model)
+                    self._publish()
+                    next_tick += SIM_DT
+                    steps += 1
+                    changed = False
+                if now >= next_tick:
+                    # Trop de retard : on abandonne le reste plutôt que de partir en spirale
+                    next_tick = now + SIM_DT
+            if changed:
+                self._publish()
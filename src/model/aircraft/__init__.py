@@ -1,4 +1,5 @@
 from .base import Aircraft
 from .commercial import CommercialAircraft
 from .private import PrivateJet
-from .fighter import FighterJet
\ No newline at end of file
+from .fighter import FighterJet
+from .states import State, Event
\ No newline at end of file
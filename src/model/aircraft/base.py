@@ -1,9 +1,14 @@
 import math
+from .states import FLYING, HOLDING, LANDING, OUT_OF_BOUNDS, NO_EVENT, MAYDAY, FROZEN
 
 
 class Aircraft:
     """Classe de base : gère la physique, le mouvement et les états."""
 
+    # Pas de __dict__ : attributs compacts et accès plus rapide
+    __slots__ = ("id", "x", "y", "heading", "target_heading", "altitude", "speed", "base_score",
+                 "fuel", "consumption", "type_label", "state", "score_counted", "event")
+
     def __init__(self, uid, x, y, heading, altitude):
         self.id = uid
         self.x = x
@@ -20,25 +25,24 @@ class Aircraft:
         self.type_label = "GENERIC"
 
         # États
-        self.despawn_timer = 0.0
-        self.state = "FLYING"
+        self.state = FLYING
         self.score_counted = False
-        self.event = None  # None, "MAYDAY", "URGENCY"
+        self.event = NO_EVENT  # NO_EVENT, MAYDAY, URGENCY
 
     def update_position(self, dt):
-        if self.state in ["CRASHED", "LANDED"]:
+        if self.state in FROZEN:
             return
 
         # Gestion Panne
-        if self.event == "MAYDAY" and self.state != "LANDING":
+        if self.event == MAYDAY and self.state != LANDING:
             self.altitude -= 120 * dt
             if self.speed > 220: self.speed -= 15 * dt
-            if self.state == "HOLDING": self.state = "FLYING"
+            if self.state == HOLDING: self.state = FLYING
 
         # Logique d'état
-        if self.state == "LANDING":
+        if self.state == LANDING:
             self._handle_landing(dt)
-        elif self.state == "HOLDING":
+        elif self.state == HOLDING:
             self.heading = (self.heading + 3.0) % 360
             self.fuel -= self.consumption * dt
         else:
@@ -52,9 +56,9 @@ class Aircraft:
             self.y += px_speed * dt * math.sin(rad)
 
         # Limites de zone
-        if self.state != "LANDING":
+        if self.state != LANDING:
             if math.sqrt((self.x - 500) ** 2 + (self.y - 500) ** 2) > 510:
-                self.state = "OUT_OF_BOUNDS"
+                self.state = OUT_OF_BOUNDS
 
     def _handle_flying(self, dt):
         diff = self.target_heading - self.heading
@@ -76,7 +80,7 @@ class Aircraft:
         if dist > 300:  # Approche
             tgt = math.degrees(math.atan2(dy, dx))
             self.heading = (tgt + 90) % 360
-            if self.event != "MAYDAY" and self.altitude > 1500:
+            if self.event != MAYDAY and self.altitude > 1500:
                 self.altitude -= 30 * dt
             if self.speed > 300:
                 self.speed -= 20 * dt
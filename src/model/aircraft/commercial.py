@@ -2,10 +2,12 @@ import random
 from .base import Aircraft
 
 class CommercialAircraft(Aircraft):
-    def __init__(self, uid, x, y, heading, altitude):
+    __slots__ = ()
+
+    def __init__(self, uid, x, y, heading, altitude, rng=random):
         super().__init__(uid, x, y, heading, altitude)
         self.type_label = "COMMERCIAL"
-        self.speed = random.randint(240, 360)
+        self.speed = rng.randint(240, 360)
         self.base_score = 100
         self.fuel = 100.0
         self.consumption = 0.4
\ No newline at end of file
@@ -2,10 +2,12 @@ import random
 from .base import Aircraft
 
 class FighterJet(Aircraft):
-    def __init__(self, uid, x, y, heading, altitude):
+    __slots__ = ()
+
+    def __init__(self, uid, x, y, heading, altitude, rng=random):
         super().__init__(uid, x, y, heading, altitude)
         self.type_label = "FIGHTER"
-        self.speed = random.randint(600, 850)
+        self.speed = rng.randint(600, 850)
         self.base_score = 300
         self.fuel = 60.0
         self.consumption = 0.8
\ No newline at end of file
@@ -0,0 +1,29 @@
+from enum import IntEnum
+
+
+class State(IntEnum):
+    """État d'un avion (State.X.name donne le libellé pour l'affichage)."""
+    FLYING = 0
+    HOLDING = 1
+    LANDING = 2
+    LANDED = 3
+    CRASHED = 4
+    OUT_OF_BOUNDS = 5
+
+
+class Event(IntEnum):
+    """Incident en cours à bord (Event.NONE vaut 0, donc faux dans un test)."""
+    NONE = 0
+    MAYDAY = 1
+    URGENCY = 2
+
+
+# Alias de module : une comparaison "ac.state == LANDED" évite la recherche d'attribut sur l'enum
+FLYING, HOLDING, LANDING, LANDED, CRASHED, OUT_OF_BOUNDS = State
+NO_EVENT, MAYDAY, URGENCY = Event
+
+# Ensembles d'appartenance précalculés
+AIRBORNE = frozenset({FLYING, LANDING, HOLDING})     # peuvent entrer en collision
+CRUISING = frozenset({FLYING, HOLDING})              # peuvent subir une panne / demander l'atterrissage
+FROZEN = frozenset({CRASHED, LANDED})                # plus de mouvement
+WRECKED = frozenset({CRASHED, OUT_OF_BOUNDS})        # restent affichés 2 s avant de disparaître
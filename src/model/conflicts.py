@@ -0,0 +1,99 @@
+# src/model/conflicts.py
+"""
+Prédiction des conflits (nécessite NumPy) : point de rapprochement maximal (CPA)
+de chaque paire d'avions en vol, en supposant cap, vitesse et altitude constants
+sur l'horizon de prédiction (les virages en cours et l'attente ne sont pas extrapolés).
+
+1. Index : avions triés par altitude ; seules les paires à moins de `alt` ft
+   l'une de l'autre sont générées (fenêtre glissante, searchsorted).
+2. Filtre horizontal : paires trop éloignées pour se rejoindre dans l'horizon,
+   même en fonçant l'une vers l'autre.
+   Sur le scope (1000 px, jusqu'à 80 px/s, horizon 20 s) cette portée couvre presque tout :
+   aucun index spatial n'élague davantage, le coût reste quadratique dans une tranche d'altitude
+   (apparitions entre 2000 et 4000 ft : 1 à 3 ms à 300 avions, 20 à 30 ms à 1000). D'où une prédiction
+   réservée à l'interface (predict_conflicts=True), dont les niveaux comptent au plus 20 avions.
+3. CPA vectorisé sur les paires restantes :
+   t* = -(dp . dv) / |dv|², borné à [0, horizon] ; d* = |dp + dv t*|
+"""
+import numpy as np
+from src.settings import CONFLICT_LOOKAHEAD, CONFLICT_DIST, CONFLICT_ALT
+from src.model.aircraft.states import AIRBORNE
+
+_AIRBORNE_CODES = np.array(sorted(int(s) for s in AIRBORNE), dtype=np.int8)
+
+
+class ConflictPredictor:
+    def __init__(self, lookahead=CONFLICT_LOOKAHEAD, dist=CONFLICT_DIST, alt=CONFLICT_ALT):
+        self.lookahead = lookahead
+        self.dist = dist
+        self.alt = alt
+        self.pairs = []          # [(id_a, id_b, t_cpa en s, d_cpa en px)], les plus proches d'abord
+        self.ids = frozenset()   # avions impliqués dans au moins un conflit
+
+    def clear(self):
+        self.pairs = []
+        self.ids = frozenset()
+
+    def update(self, aircrafts, fleet=None):
+        if fleet is not None:
+            # Moteur numpy : lecture directe des tableaux de la flotte
+            n = len(fleet)
+            m = np.isin(fleet.state[:n], _AIRBORNE_CODES)
+            idx = np.flatnonzero(m)
+            ids = [fleet.views[i].id for i in idx.tolist()]
+            x, y = fleet.x[:n][m], fleet.y[:n][m]
+            heading, speed, alt = fleet.heading[:n][m], fleet.speed[:n][m], fleet.altitude[:n][m]
+        else:
+            flying = [ac for ac in aircrafts if ac.state in AIRBORNE]
+            ids = [ac.id for ac in flying]
+            data = np.fromiter((v for ac in flying for v in (ac.x, ac.y, ac.heading, ac.speed, ac.altitude)),
+                               dtype=np.float64, count=5 * len(flying)).reshape(-1, 5)
+            x, y, heading, speed, alt = data.T
+        self._predict(ids, x, y, heading, speed, alt)
+
+    def _predict(self, ids, x, y, heading, speed, alt):
+        n = len(ids)
+        if n < 2:
+            self.clear()
+            return
+
+        # 1. Paires proches en altitude (fenêtre sur les altitudes triées)
+        order = np.argsort(alt, kind="stable")
+        sorted_alt = alt[order]
+        hi = np.searchsorted(sorted_alt, sorted_alt + self.alt, side="left")
+        counts = np.maximum(hi - np.arange(n) - 1, 0)
+        total = int(counts.sum())
+        if total == 0:
+            self.clear()
+            return
+        first = np.repeat(np.arange(n), counts)
+        starts = np.cumsum(counts) - counts
+        second = first + 1 + (np.arange(total) - np.repeat(starts, counts))
+        i, j = order[first], order[second]
+
+        # 2. Portée maximale sur l'horizon (même formule de vitesse que Aircraft.update_position)
+        v = speed * 0.1
+        dx, dy = x[j] - x[i], y[j] - y[i]
+        reach = (v[i] + v[j]) * self.lookahead + self.dist
+        near = dx * dx + dy * dy < reach * reach
+        if not near.any():
+            self.clear()
+            return
+        i, j, dx, dy = i[near], j[near], dx[near], dy[near]
+
+        # 3. Point de rapprochement maximal
+        rad = np.radians(heading - 90)
+        vx, vy = v * np.cos(rad), v * np.sin(rad)
+        dvx, dvy = vx[j] - vx[i], vy[j] - vy[i]
+        vv = dvx * dvx + dvy * dvy
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(vv > 1e-9, -(dx * dvx + dy * dvy) / vv, 0.0)
+        t = np.clip(t, 0.0, self.lookahead)
+        d = np.hypot(dx + dvx * t, dy + dvy * t)
+
+        hit = np.flatnonzero(d < self.dist)
+        hit = hit[np.argsort(t[hit], kind="stable")]
+        pairs = [(ids[a], ids[b], tc, dc) for a, b, tc, dc in
+                 zip(i[hit].tolist(), j[hit].tolist(), t[hit].tolist(), d[hit].tolist())]
+        self.pairs = pairs
+        self.ids = frozenset(p[0] for p in pairs) | frozenset(p[1] for p in pairs)
@@ -0,0 +1,293 @@
+# src/model/fleet.py
+"""
+Moteur de flotte "structure de tableaux" (optionnel, nécessite NumPy).
+
+Toutes les données qui bougent à chaque tick sont rangées dans des tableaux
+contigus et la flotte entière avance en une seule passe vectorisée.
+Les objets Aircraft deviennent de simples vues sur une ligne des tableaux :
+le contrôleur et les vues continuent de lire/écrire ac.x, ac.state, etc.
+"""
+import numpy as np
+from src.model.aircraft.states import State, Event
+
+# Les tableaux stockent directement les valeurs entières de State / Event
+STATES = tuple(State)
+EVENTS = tuple(Event)
+FLYING, HOLDING, LANDING, LANDED, CRASHED, OUT_OF_BOUNDS = (int(s) for s in State)
+NO_EVENT, MAYDAY, URGENCY = (int(e) for e in Event)
+
+COLUMNS = ("x", "y", "heading", "target_heading", "altitude", "speed", "fuel", "consumption",
+           "base_score")
+
+ARRAYS = tuple((c, np.float64) for c in COLUMNS) + (("state", np.int8), ("event", np.int8),
+                                                   ("score_counted", np.bool_))
+
+RUNWAY_X, RUNWAY_Y = 500, 900
+CENTER = 500
+
+
+def _column(name):
+    def get(self):
+        return float(getattr(self._fleet, name)[self._slot])
+
+    def set(self, value):
+        getattr(self._fleet, name)[self._slot] = value
+
+    return property(get, set)
+
+
+class FleetView:
+    """Propriétés qui redirigent les attributs d'un avion vers sa ligne dans la flotte."""
+    __slots__ = ()
+
+    @property
+    def state(self):
+        return STATES[self._fleet.state[self._slot]]
+
+    @state.setter
+    def state(self, value):
+        self._fleet.state[self._slot] = value
+
+    @property
+    def event(self):
+        return EVENTS[self._fleet.event[self._slot]]
+
+    @event.setter
+    def event(self, value):
+        self._fleet.event[self._slot] = value
+
+    @property
+    def score_counted(self):
+        return bool(self._fleet.score_counted[self._slot])
+
+    @score_counted.setter
+    def score_counted(self, value):
+        self._fleet.score_counted[self._slot] = value
+
+
+for _name in COLUMNS:
+    setattr(FleetView, _name, _column(_name))
+
+_VIEW_CLASSES = {}
+_ARRAY_NAMES = frozenset(c for c, _ in ARRAYS)
+
+
+def _plain_slots(cls):
+    """Attributs qui restent stockés dans l'objet (id, type_label...)."""
+    return [s for k in cls.__mro__ for s in getattr(k, "__slots__", ()) if s not in _ARRAY_NAMES]
+
+
+def view_class(cls):
+    """Sous-classe "vue" d'une classe d'avion (isinstance et type_label sont conservés)."""
+    vc = _VIEW_CLASSES.get(cls)
+    if vc is None:
+        vc = _VIEW_CLASSES[cls] = type(f"Fleet{cls.__name__}", (FleetView, cls), {"__slots__": ("_fleet", "_slot"),
+                                                                                    "_plain": _plain_slots(cls)})
+    return vc
+
+
+class Fleet:
+    def __init__(self, capacity=64):
+        self.views = []
+        self._alloc(capacity)
+
+    def _alloc(self, capacity):
+        # (Ré)alloue les tableaux en recopiant les lignes déjà occupées
+        n = len(self.views)
+        self.capacity = capacity
+        for c, dtype in ARRAYS:
+            arr = np.zeros(capacity, dtype=dtype)
+            if n: arr[:n] = getattr(self, c)[:n]
+            setattr(self, c, arr)
+
+    def __len__(self):
+        return len(self.views)
+
+    def clear(self):
+        # Une seule copie figée pour toute la flotte (chaque vue garde son numéro de ligne)
+        n = len(self.views)
+        if n:
+            frozen = Fleet(n)
+            for c, _ in ARRAYS:
+                getattr(frozen, c)[:n] = getattr(self, c)[:n]
+            for v in self.views:
+                v._fleet = frozen
+            frozen.views = self.views
+        self.views = []
+
+    def _detach(self, view):
+        # L'avion retiré garde une copie privée de sa ligne, figée sur ses dernières valeurs,
+        # au cas où une vue Qt en garderait encore une référence.
+        frozen = Fleet(1)
+        for c, _ in ARRAYS:
+            getattr(frozen, c)[0] = getattr(self, c)[view._slot]
+        frozen.views.append(view)
+        view._fleet = frozen
+        view._slot = 0
+
+    def add(self, ac):
+        """Range un avion fraîchement créé dans les tableaux et renvoie sa vue."""
+        n = len(self.views)
+        if n == self.capacity:
+            self._alloc(self.capacity * 2)
+
+        view = object.__new__(view_class(type(ac)))
+        view._fleet = self
+        view._slot = n
+        for c, _ in ARRAYS:
+            getattr(self, c)[n] = getattr(ac, c)
+        for name in view._plain:
+            setattr(view, name, getattr(ac, name))
+        self.views.append(view)
+        return view
+
+    def extend_columns(self, classes, plain, columns):
+        """
+        Ajoute m avions donnés en colonnes (rechargement d'une sauvegarde) et renvoie leurs vues :
+        classes d'avion, attributs propres aux vues {nom: valeurs}, tableaux {colonne: valeurs}.
+        Une copie par colonne, aucun objet Aircraft intermédiaire.
+        """
+        n, m = len(self.views), len(classes)
+        capacity = self.capacity
+        while capacity < n + m:
+            capacity *= 2
+        if capacity != self.capacity:
+            self._alloc(capacity)
+        for c, _ in ARRAYS:
+            getattr(self, c)[n:n + m] = np.asarray(columns[c])
+        vcs = {cls: view_class(cls) for cls in set(classes)}
+        views = list(map(object.__new__, map(vcs.__getitem__, classes)))
+        for slot, view in enumerate(views, n):
+            view._fleet = self
+            view._slot = slot
+        for name, values in plain.items():
+            for view, value in zip(views, values):
+                setattr(view, name, value)
+        self.views.extend(views)
+        return views
+
+    def remove(self, ids):
+        """Retire les avions dont l'identifiant est dans `ids` (épaves arrivées à échéance)."""
+        keep = np.array([v.id not in ids for v in self.views], dtype=np.bool_)
+        if not keep.all():
+            self._compact(keep)
+
+    def _compact(self, keep):
+        views = self.views
+        for i in np.flatnonzero(~keep).tolist():
+            self._detach(views[i])
+        idx = np.flatnonzero(keep)
+        m = len(idx)
+        for c, _ in ARRAYS:
+            arr = getattr(self, c)
+            arr[:m] = arr[idx]
+        kept = []
+        for slot, i in enumerate(idx.tolist()):
+            v = views[i]
+            v._slot = slot
+            kept.append(v)
+        self.views = kept
+
+    def step(self, dt, landing_zone):
+        """
+        Équivalent vectorisé de SimulationModel._update_aircrafts + Aircraft.update_position.
+        Renvoie (variation de score, posés, crashés, sortis).
+        Panne sèche et disparition des épaves sont gérées par l'échéancier du modèle.
+        """
+        n = len(self.views)
+        if n == 0:
+            return 0, 0, 0, 0
+        x, y = self.x[:n], self.y[:n]
+        heading, target = self.heading[:n], self.target_heading[:n]
+        alt, speed = self.altitude[:n], self.speed[:n]
+        fuel, cons = self.fuel[:n], self.consumption[:n]
+        counted = self.score_counted[:n]
+        state, event = self.state[:n], self.event[:n]
+
+        # --- Comptage des points (état en début de tick) ---
+        pending = ~counted
+        landed = pending & (state == LANDED)
+        crashed = pending & (state == CRASHED)
+        out = pending & (state == OUT_OF_BOUNDS)
+        bonus = np.where(event == MAYDAY, 300, np.where(event == URGENCY, 150, 0))
+        score = int((self.base_score[:n][landed] + bonus[landed]).sum())
+        score -= 50 * int(crashed.sum()) + 20 * int(out.sum())
+        counted |= landed | crashed | out
+
+        # --- Épaves / sorties : figées jusqu'à leur retrait par l'échéancier ---
+        dead = (state == CRASHED) | (state == OUT_OF_BOUNDS)
+        keep = state != LANDED
+        act = ~dead & keep
+
+        # --- Panne moteur ---
+        may = act & (event == MAYDAY) & (state != LANDING)
+        alt[may] -= 120 * dt
+        slow = may & (speed > 220)
+        speed[slow] -= 15 * dt
+        state[may & (state == HOLDING)] = FLYING
+
+        # --- Attente : virage continu ---
+        hold = act & (state == HOLDING)
+        heading[hold] = (heading[hold] + 3.0) % 360
+
+        # --- Vol : virage vers le cap demandé ---
+        fly = act & (state != LANDING) & (state != HOLDING)
+        diff = (target - heading + 180) % 360 - 180
+        turned = np.where(np.abs(diff) < 3.0, target, heading + np.where(diff > 0, 3.0, -3.0)) % 360
+        heading[fly] = turned[fly]
+        burn = hold | fly
+        fuel[burn] -= cons[burn] * dt
+
+        # --- Atterrissage ---
+        land = act & (state == LANDING)
+        if land.any():
+            dx = RUNWAY_X - x
+            dy = RUNWAY_Y - y
+            dist = np.sqrt(dx ** 2 + dy ** 2)
+            tgt = (np.degrees(np.arctan2(dy, dx)) + 90) % 360
+            approach = land & (dist > 300)
+            final = land & (dist <= 300) & (dist > 10)
+            touch = land & (dist <= 10)
+            heading[approach | final] = tgt[approach | final]
+
+            m = approach & (event != MAYDAY) & (alt > 1500)
+            alt[m] -= 30 * dt
+            m = approach & (speed > 300)
+            speed[m] -= 20 * dt
+
+            min_safe = dist * 2.0
+            pot = alt - 400 * dt
+            alt[final] = np.where(pot > min_safe, pot, np.maximum(alt, min_safe))[final]
+            m = final & (speed > 160)
+            speed[m] -= 100 * dt
+
+            alt[touch] = 0
+            speed[touch] = np.maximum(0, speed[touch] - 150 * dt)
+
+        # --- Mouvement physique ---
+        mv = act & (speed > 0)
+        rad = np.radians(heading[mv] - 90)
+        px = speed[mv] * 0.1 * dt
+        x[mv] += px * np.cos(rad)
+        y[mv] += px * np.sin(rad)
+
+        # --- Limites de zone ---
+        far = act & (state != LANDING) & (np.sqrt((x - CENTER) ** 2 + (y - CENTER) ** 2) > 510)
+        state[far] = OUT_OF_BOUNDS
+
+        # --- Contact avec le sol ---
+        ground = act & (alt <= 0)
+        if ground.any():
+            alt[ground] = 0
+            lx, ly, lw, lh = landing_zone
+            on_rw = (lx - 20 <= x) & (x <= lx + lw + 20) & (ly - 20 <= y) & (y <= ly + lh + 20)
+            landing = state == LANDING
+            state[ground & on_rw & landing & (speed <= 1)] = LANDED
+            state[ground & ~(on_rw & landing)] = CRASHED
+
+        # --- Filtre distance par rapport au centre ---
+        keep &= ~((state == OUT_OF_BOUNDS) & (np.sqrt((x - CENTER) ** 2 + (y - CENTER) ** 2) > 700))
+        if not keep.all():
+            self._compact(keep)
+
+        return score, int(landed.sum()), int(crashed.sum()), int(out.sum())
@@ -0,0 +1,72 @@
+# src/model/policies.py
+"""
+Politiques de commande pour les parties sans interface.
+Une politique est appelée avant chaque tick et renvoie la liste des ordres
+à transmettre : [(id_avion, type_commande, valeur), ...]
+"""
+import csv
+import math
+
+from src.model.aircraft.states import CRUISING, MAYDAY
+
+
+class NoopPolicy:
+    """Ne donne aucun ordre : les avions suivent leur cap jusqu'à sortir ou s'écraser."""
+
+    def __call__(self, model, tick):
+        return []
+
+
+class ScriptedPolicy:
+    """
+    Rejoue un script CSV : une ligne par ordre "tick,id_avion,commande,valeur".
+    Exemple : 120,AF001,HEADING,270
+    """
+
+    def __init__(self, path):
+        self.orders = {}
+        with open(path, newline="") as f:
+            for row in csv.reader(f):
+                if not row or row[0].startswith("#"): continue
+                tick, ac_id, cmd, value = row
+                self.orders.setdefault(int(tick), []).append((ac_id.strip(), cmd.strip().upper(), float(value)))
+
+    def __call__(self, model, tick):
+        return self.orders.get(tick, [])
+
+
+class AutopilotPolicy:
+    """
+    Contrôleur automatique simple : toutes les `period` ticks, chaque avion en vol
+    est mis en cap vers la piste, descendu sous 1000 ft, ralenti sous 300 kt,
+    puis autorisé à atterrir quand les mêmes conditions que dans l'interface sont remplies.
+    Ne gère pas les conflits entre avions.
+    """
+
+    RUNWAY = (500, 900)
+
+    def __init__(self, period=10):
+        self.period = period
+
+    def __call__(self, model, tick):
+        if tick % self.period: return []
+        orders = []
+        rx, ry = self.RUNWAY
+        for ac in model.aircrafts:
+            if ac.state not in CRUISING: continue
+            x, y = model.position(ac)  # à jour même en multi-cadence
+            tgt = (math.degrees(math.atan2(ry - y, rx - x)) + 90) % 360
+            diff = abs(ac.heading - tgt)
+            if diff > 180: diff = 360 - diff
+
+            if diff < 20 and ac.altitude < 1000 and ac.speed < 300:
+                orders.append((ac.id, "LAND", 0))
+                continue
+            if abs((ac.target_heading - tgt + 180) % 360 - 180) > 5:
+                orders.append((ac.id, "HEADING", round(tgt)))
+            if ac.event == MAYDAY: continue  # altitude et vitesse refusées
+            if ac.altitude >= 1000:
+                orders.append((ac.id, "ALTITUDE", -500))
+            if ac.speed >= 300:
+                orders.append((ac.id, "SPEED", -50))
+        return orders
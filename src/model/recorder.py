@@ -0,0 +1,109 @@
+# src/model/recorder.py
+"""
+Enregistrement compact d'une partie et rejeu sans interface.
+
+Le fichier est au format JSON Lines :
+  - 1re ligne : en-tête {"seed", "backend", "dt", "multi_rate"}
+  - puis une ligne par étape : [tick, type, ...arguments]
+    types : START, STOP, RESET (niveau de départ s'il n'est pas 1), NEXT_LEVEL, CMD (id, commande, valeur),
+            LOAD (sauvegarde rechargée, en base64), CHECK (empreinte de l'état, pour vérifier le rejeu)
+Avec la même graine et les mêmes ordres appliqués aux mêmes ticks,
+le rejeu reproduit exactement la partie.
+"""
+import base64
+import hashlib
+import json
+import time
+
+
+def state_digest(model):
+    """Empreinte de l'état complet : score, niveau, stats et tous les avions."""
+    parts = [model.tick, model.score, model.current_level, model.planes_spawned,
+             sorted(model.stats.items()), model.level_complete, model.game_over]
+    for ac in model.aircrafts:
+        parts.append((ac.id, int(ac.state), int(ac.event), ac.x, ac.y, ac.heading, ac.target_heading,
+                      ac.altitude, ac.speed, ac.fuel))
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+
+
+class CommandRecorder:
+    def __init__(self, path, seed, backend="python", dt=0.03, multi_rate=False):
+        self.path = path
+        self.file = open(path, "w")
+        self._write({"seed": seed, "backend": backend, "dt": dt, "multi_rate": multi_rate})
+
+    def _write(self, obj):
+        self.file.write(json.dumps(obj, separators=(",", ":")) + "\n")
+        self.file.flush()  # rien n'est perdu si le jeu est fermé brutalement
+
+    def log(self, tick, kind, *args):
+        self._write([tick, kind, *args])
+
+    def checkpoint(self, model):
+        self.log(model.tick, "CHECK", state_digest(model))
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def load_recording(path):
+    with open(path) as f:
+        header = json.loads(f.readline())
+        entries = [json.loads(line) for line in f if line.strip()]
+    return header, entries
+
+
+def replay(path, backend=None):
+    """
+    Rejoue un enregistrement aussi vite que possible et vérifie chaque CHECK.
+    Renvoie le bilan (ticks, durée, score, nombre d'écarts...).
+    """
+    from src.model.simulation import SimulationModel
+
+    header, entries = load_recording(path)
+    model = SimulationModel(1000, 1000, backend=backend or header["backend"], seed=header["seed"],
+                            multi_rate=header.get("multi_rate", False))
+    dt = header["dt"]
+    checks = mismatches = 0
+    first_mismatch = None
+    start = time.perf_counter()
+
+    for entry in entries:
+        tick, kind, args = entry[0], entry[1], entry[2:]
+        while model.tick < tick:
+            before = model.tick
+            model.update(dt)
+            if model.tick == before:
+                raise RuntimeError(f"Rejeu désynchronisé : la simulation est bloquée au tick {before}")
+
+        if kind == "CMD":
+            model.apply_command(*args)
+        elif kind == "START":
+            model.start()
+        elif kind == "STOP":
+            model.stop()
+        elif kind == "RESET":
+            model.reset_game(*args)
+        elif kind == "NEXT_LEVEL":
+            model.start_next_level()
+        elif kind == "LOAD":
+            model.load_state(base64.b64decode(args[0]))
+        elif kind == "CHECK":
+            checks += 1
+            if state_digest(model) != args[0]:
+                mismatches += 1
+                if first_mismatch is None: first_mismatch = tick
+
+    elapsed = time.perf_counter() - start
+    return {
+        "ticks": model.tick,
+        "wall_time": round(elapsed, 4),
+        "ticks_per_second": round(model.tick / elapsed, 1) if elapsed > 0 else None,
+        "score": model.score,
+        "level": model.current_level,
+        "stats": dict(model.stats),
+        "checks": checks,
+        "mismatches": mismatches,
+        "first_mismatch_tick": first_mismatch,
+    }
@@ -0,0 +1,91 @@
+# src/model/registry.py
+
+# Types de notifications
+SPAWNED = "spawned"
+DESPAWNED = "despawned"
+STATE_CHANGED = "state_changed"
+EVENT_RAISED = "event_raised"
+
+
+class AircraftRegistry:
+    """
+    Index id -> avion tenu par le SimulationModel.
+    Les abonnés reçoivent callback(type, avion, ancienne_valeur, nouvelle_valeur)
+    à chaque apparition, disparition, changement d'état ou incident,
+    au lieu de re-parcourir toute la flotte à chaque tick.
+    """
+
+    def __init__(self):
+        self.by_id = {}
+        self.seen = {}  # uid -> (état, incident) connus au dernier passage
+        self.listeners = []
+
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.listeners: self.listeners.remove(callback)
+
+    def _notify(self, kind, ac, old=None, new=None):
+        for cb in self.listeners:
+            cb(kind, ac, old, new)
+
+    # --- Accès ---
+    def get(self, uid, default=None):
+        return self.by_id.get(uid, default)
+
+    def __getitem__(self, uid):
+        return self.by_id[uid]
+
+    def __contains__(self, uid):
+        return uid in self.by_id
+
+    def __len__(self):
+        return len(self.by_id)
+
+    # --- Mises à jour ---
+    def add(self, ac):
+        self.by_id[ac.id] = ac
+        self.seen[ac.id] = (ac.state, ac.event)
+        self._notify(SPAWNED, ac)
+
+    def extend(self, acs, seen):
+        """Comme add pour toute une liste (rechargement) ; seen : couples (état, incident) de chaque avion."""
+        ids = [ac.id for ac in acs]
+        self.by_id.update(zip(ids, acs))
+        self.seen.update(zip(ids, seen))
+        listeners = self.listeners
+        for ac in acs:
+            for cb in listeners:
+                cb(SPAWNED, ac, None, None)
+
+    def clear(self):
+        gone = list(self.by_id.values())
+        self.by_id.clear()
+        self.seen.clear()
+        for ac in gone:
+            self._notify(DESPAWNED, ac)
+
+    def touch(self, ac):
+        """Signale tout de suite un changement fait hors du tick (ordre de la tour)."""
+        old_state, old_event = self.seen[ac.id]
+        self.seen[ac.id] = (ac.state, ac.event)
+        if ac.state != old_state:
+            self._notify(STATE_CHANGED, ac, old_state, ac.state)
+        if ac.event != old_event:
+            self._notify(EVENT_RAISED, ac, old_event, ac.event)
+
+    def sync(self, aircrafts):
+        """Fin de tick : publie les disparitions et les changements d'état/incident."""
+        if len(aircrafts) != len(self.by_id):
+            alive = {ac.id for ac in aircrafts}
+            for uid in [u for u in self.by_id if u not in alive]:
+                ac = self.by_id.pop(uid)
+                del self.seen[uid]
+                self._notify(DESPAWNED, ac)
+
+        seen = self.seen
+        for ac in aircrafts:
+            s = (ac.state, ac.event)
+            if seen[ac.id] != s:
+                self.touch(ac)
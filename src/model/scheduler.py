@@ -0,0 +1,41 @@
+# src/model/scheduler.py
+"""
+Échéancier d'événements datés en temps de simulation (secondes).
+Ce qui est prévisible (prochaine apparition, panne sèche, disparition d'une épave)
+est rangé une seule fois ici au lieu d'être re-testé à chaque tick pour chaque avion.
+"""
+import heapq
+
+# Types d'événements
+SPAWN = "spawn"
+FUEL_OUT = "fuel_out"
+DESPAWN = "despawn"
+
+EPSILON = 1e-9  # tolérance sur le cumul des dt
+
+
+class EventScheduler:
+    def __init__(self):
+        self.queue = []   # tas de (date, n° d'ordre, type, donnée)
+        self.seq = 0      # départage les événements simultanés : ordre d'insertion
+
+    def __len__(self):
+        return len(self.queue)
+
+    def schedule(self, time, kind, payload=None):
+        heapq.heappush(self.queue, (time, self.seq, kind, payload))
+        self.seq += 1
+
+    def due(self, now):
+        """
+        Retire un à un les événements arrivés à échéance, dans l'ordre chronologique.
+        Un événement programmé pendant le parcours est pris s'il est lui aussi échu.
+        """
+        q = self.queue
+        limit = now + EPSILON
+        while q and q[0][0] <= limit:
+            _, _, kind, payload = heapq.heappop(q)
+            yield kind, payload
+
+    def clear(self):
+        self.queue.clear()
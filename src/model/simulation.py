@@ -1,12 +1,34 @@
 # src/model/simulation.py
+import base64
+import heapq
 import math
 import random
-from src.settings import LEVELS, MODEL_CENTER
+from src.settings import LEVELS, MODEL_CENTER, LOD_PERIOD, LOD_CLEARANCE, LOD_RUNWAY_DIST
 from src.model.aircraft import CommercialAircraft, PrivateJet, FighterJet
+from src.model.aircraft.states import (FLYING, HOLDING, LANDING, LANDED, CRASHED, OUT_OF_BOUNDS,
+                                       NO_EVENT, MAYDAY, URGENCY, AIRBORNE, CRUISING, WRECKED)
+from src.model.spatial import SpatialGrid
+from src.model.registry import AircraftRegistry, STATE_CHANGED
+from src.model.scheduler import EventScheduler, SPAWN, FUEL_OUT, DESPAWN, EPSILON
+from src.model import savestate
+
+try:
+    from src.model.conflicts import ConflictPredictor
+except ImportError:  # NumPy absent : pas de prédiction de conflits
+    ConflictPredictor = None
+
+# Séparation minimale : en dessous, les deux avions entrent en collision
+COLLISION_DIST = 30
+COLLISION_ALT = 100
+# Probabilité de panne par tick et par niveau pour un avion en vol sans incident
+FAILURE_RATE = 0.0002
+# Durée d'affichage d'une épave (crash ou sortie) avant sa disparition (s)
+DESPAWN_DELAY = 2.0
 
 
 class SimulationModel:
-    def __init__(self, width, height):
+    def __init__(self, width, height, backend="python", seed=None, levels=None, predict_conflicts=False,
+                 multi_rate=False):
         self.width = width
         self.height = height
         self.aircrafts = []
@@ -17,45 +39,136 @@ class SimulationModel:
         self.is_running = False
         self.game_over = False
         self.stats = {"landed": 0, "crashed": 0, "out": 0}
-        self.spawn_timer = 0
         self.next_id = 1
+        # Paramètres des niveaux (LEVELS par défaut ; remplaçables pour les balayages de réglage)
+        self.levels = levels or LEVELS
+        self.last_level = max(self.levels)
+        self.tick = 0  # nombre de pas de simulation effectués (sert de référence aux enregistrements)
+        self.time = 0.0  # temps de simulation écoulé (s)
+
+        # Échéancier : apparitions, pannes sèches et disparitions des épaves (voir _fire_events)
+        self.scheduler = EventScheduler()
+        self.fuel_watch = set()  # avions dont la panne sèche est déjà programmée
+        self.next_spawn = None
+
+        # Pannes planifiées : tas de (tick d'échéance, id) + échéance en vigueur par avion
+        self.failures = []
+        self.failure_due = {}
+        self.events_tick = 0  # dernier tick dont les pannes ont été traitées
+
+        # Aléatoire injectable : même graine + mêmes ordres = même partie
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # Enregistreur des ordres et des étapes de la partie (voir src/model/recorder.py)
+        self.recorder = None
+
+        # Index id -> avion + notifications (apparition, disparition, état, incident)
+        self.registry = AircraftRegistry()
+        self.registry.subscribe(self._on_registry_event)
+        # Cases de 30 px x 100 ft : seules les cases voisines peuvent entrer en collision
+        self.grid = SpatialGrid(COLLISION_DIST, COLLISION_ALT)
+
+        # Moteur "numpy" : physique de toute la flotte en une passe vectorisée (optionnel)
+        self.fleet = None
+        if backend == "numpy":
+            from src.model.fleet import Fleet
+            self.fleet = Fleet()
+        elif backend != "python":
+            raise ValueError(f"Moteur inconnu : {backend}")
+
+        # Alerte anticipée : paires qui vont perdre la séparation dans l'horizon de prédiction.
+        # Coût quadratique dans une même tranche d'altitude : activée par l'interface, pas par défaut
+        self.conflicts = ConflictPredictor() if predict_conflicts and ConflictPredictor is not None else None
+
+        # Multi-cadence : avions à faible risque intégrés moins souvent (voir _low_risk)
+        # id -> [tick de la prochaine intégration, temps pas encore intégré (s)]
+        self.lod = None
+        self._lod_turn = 0  # étale les premières échéances sur LOD_PERIOD ticks
+        self._lod_traffic = None  # (tick de construction, cases) : voir _traffic_cells
+        if multi_rate:
+            if self.fleet is not None:
+                raise ValueError("Multi-cadence : moteur python uniquement")
+            self.lod = {}
 
         # PISTE : Centrée horizontalement par rapport à MODEL_CENTER si besoin,
         # mais ici on utilise width/height passés en arguments (1000x1000)
         self.landing_zone = (width / 2 - 50, height - 150, 100, 100)
+        self._schedule_spawn()
 
     def get_level_cfg(self):
-        lvl = self.current_level if self.current_level <= 5 else 5
-        return LEVELS[lvl]
+        lvl = self.current_level if self.current_level <= self.last_level else self.last_level
+        return self.levels[lvl]
 
     def get_time_before_next_spawn(self):
         cfg = self.get_level_cfg()
-        if self.planes_spawned >= cfg["total"]: return 0
-        return max(0, int(cfg["rate"] - self.spawn_timer))
+        if self.planes_spawned >= cfg["total"] or self.next_spawn is None: return 0
+        return max(0, int(self.next_spawn - self.time))
 
-    def reset_game(self):
-        self.current_level = 1
+    def _record(self, kind, *args):
+        if self.recorder is not None:
+            self.recorder.log(self.tick, kind, *args)
+
+    def start(self):
+        self._record("START")
+        self.is_running = True
+
+    def stop(self):
+        self._record("STOP")
+        self.is_running = False
+
+    def reset_game(self, level=1):
+        self._record("RESET", *([level] if level != 1 else []))
+        self.current_level = level
         self.planes_spawned = 0
         self.score = 0
         self.stats = {"landed": 0, "crashed": 0, "out": 0}
-        self.spawn_timer = 0
-        self.aircrafts = []
+        self._clear_aircrafts()
+        self._schedule_spawn()
         self.is_running = True
         self.level_complete = False
         self.game_over = False
         self.next_id = 1
 
     def start_next_level(self):
-        if self.current_level < 5:
+        self._record("NEXT_LEVEL")
+        if self.current_level < self.last_level:
             self.current_level += 1
             self.planes_spawned = 0
-            self.spawn_timer = 0
-            self.aircrafts = []
+            self._clear_aircrafts()
+            self._schedule_spawn()
             self.level_complete = False
             self.is_running = True
         else:
             self.game_over = True
 
+    def save_state(self):
+        """État complet en binaire compact (voir src/model/savestate.py), entre deux ticks."""
+        return savestate.save_state(self)
+
+    def load_state(self, data):
+        """Reprend l'état produit par save_state ; la sauvegarde est enregistrée pour le rejeu."""
+        tick = self.tick
+        savestate.load_state(self, data)
+        if self.recorder is not None:
+            self.recorder.log(tick, "LOAD", base64.b64encode(data).decode())
+
+    def _clear_aircrafts(self):
+        self.aircrafts = []
+        self.failures = []
+        self.failure_due = {}
+        self.scheduler.clear()
+        self.fuel_watch.clear()
+        if self.lod is not None:
+            self.lod.clear()
+            self._lod_traffic = None
+        self.next_spawn = None
+        self.grid.clear()
+        if self.fleet is not None:
+            self.fleet.clear()
+        if self.conflicts is not None:
+            self.conflicts.clear()
+        self.registry.clear()
+
     def spawn_aircraft(self):
         cfg = self.get_level_cfg()
         if self.planes_spawned >= cfg["total"]: return
@@ -64,109 +177,334 @@ class SimulationModel:
         # CORRECTION MAJEURE : On utilise MODEL_CENTER pour être synchro avec le Radar
         cx, cy = MODEL_CENTER, MODEL_CENTER
 
-        angle = random.randint(0, 359)
+        angle = self.rng.randint(0, 359)
         rad = math.radians(angle - 90)
         x = cx + radius * math.cos(rad)
         y = cy + radius * math.sin(rad)
-        heading = (angle + 180 + random.randint(-45, 45)) % 360
-        alt = random.randint(2000, 4000)
+        heading = (angle + 180 + self.rng.randint(-45, 45)) % 360
+        alt = self.rng.randint(2000, 4000)
 
-        rand_val = random.random()
+        rand_val = self.rng.random()
         if rand_val < 0.6:
-            ac = CommercialAircraft(f"AF{self.next_id:03d}", x, y, heading, alt)
+            ac = CommercialAircraft(f"AF{self.next_id:03d}", x, y, heading, alt, self.rng)
         elif rand_val < 0.9:
-            ac = PrivateJet(f"PJ{self.next_id:03d}", x, y, heading, alt)
+            ac = PrivateJet(f"PJ{self.next_id:03d}", x, y, heading, alt, self.rng)
         else:
-            ac = FighterJet(f"MIL{self.next_id:03d}", x, y, heading, alt)
+            ac = FighterJet(f"MIL{self.next_id:03d}", x, y, heading, alt, self.rng)
 
-        self.aircrafts.append(ac)
+        self.add_aircraft(ac)
         self.next_id += 1
         self.planes_spawned += 1
 
+    def add_aircraft(self, ac):
+        """Insère un avion dans la simulation (et dans la flotte vectorisée si elle est active)."""
+        if self.fleet is not None:
+            ac = self.fleet.add(ac)
+            self.aircrafts = self.fleet.views
+        else:
+            self.aircrafts.append(ac)
+        if self.lod:
+            # Multi-cadence : un avion à cadence réduite trop proche du nouveau venu repasse à pleine cadence
+            c2 = LOD_CLEARANCE * LOD_CLEARANCE
+            for other in [self.registry.get(uid) for uid in self.lod]:
+                if other is None: continue
+                ox, oy = self.position(other)
+                if (ox - ac.x) ** 2 + (oy - ac.y) ** 2 < c2:
+                    self._catch_up(other)
+            self._lod_traffic = None  # le nouveau venu compte pour les prochains _low_risk
+        self.registry.add(ac)
+        self._on_state(ac)
+        return ac
+
+    def apply_command(self, ac_id, cmd_type, value):
+        """
+        Applique un ordre de la tour à un avion.
+        Renvoie "OK", "REFUSED" (panne moteur) ou "UNKNOWN" (avion introuvable).
+        """
+        self._record("CMD", ac_id, cmd_type, value)
+        target = self.registry.get(ac_id)
+        if not target: return "UNKNOWN"
+        self._catch_up(target)
+        if target.event == MAYDAY and cmd_type in ("ALTITUDE", "SPEED", "HOLD"):
+            return "REFUSED"
+
+        if cmd_type == "HEADING":
+            target.target_heading = value
+            if target.state == HOLDING: target.state = FLYING
+        elif cmd_type == "ALTITUDE":
+            target.altitude += value
+            target.altitude = max(0, target.altitude)
+        elif cmd_type == "SPEED":
+            target.speed += value
+            target.speed = max(150, min(800, target.speed))
+        elif cmd_type == "HOLD":
+            if target.state == FLYING: target.state = HOLDING
+            else: target.state = FLYING
+        elif cmd_type == "LAND":
+            target.state = LANDING
+        self.registry.touch(target)
+        return "OK"
+
     def update(self, dt):
         if not self.is_running or self.game_over or self.level_complete: return
+        self.tick += 1
+        self.time += dt
 
         cfg = self.get_level_cfg()
-        self.spawn_timer += dt
-        if self.spawn_timer > cfg["rate"]:
-            self.spawn_aircraft()
-            self.spawn_timer = 0
-
+        self._fire_events()
         self._trigger_events()
         self._update_aircrafts(dt)
         self._check_collisions()
+        if self.conflicts is not None:
+            self._predict_conflicts()
+        self.registry.sync(self.aircrafts)
         self._check_progression(cfg)
 
+    # --- Échéancier ---
+    def _schedule_spawn(self):
+        """Apparitions aux multiples exacts de la cadence, comptés depuis le début du niveau."""
+        self.next_spawn = self.time + self.get_level_cfg()["rate"]
+        self.scheduler.schedule(self.next_spawn, SPAWN)
+
+    def _on_registry_event(self, kind, ac, old, new):
+        if kind == STATE_CHANGED:
+            self._on_state(ac)
+
+    def _on_state(self, ac):
+        """Nouvel avion ou changement d'état publié : (re)programme ce qui en découle."""
+        self._schedule_failure(ac)
+        if ac.state in WRECKED:
+            self.scheduler.schedule(self.time + DESPAWN_DELAY, DESPAWN, ac)
+        elif ac.state in CRUISING and ac.id not in self.fuel_watch and ac.consumption > 0:
+            # Au plus tôt : la consommation s'arrête en approche, la panne ne peut qu'être plus tardive
+            self.fuel_watch.add(ac.id)
+            self.scheduler.schedule(self.time + max(0.0, ac.fuel) / ac.consumption, FUEL_OUT, ac)
+
+    def _fire_events(self):
+        despawned = set()
+        for kind, payload in self.scheduler.due(self.time):
+            if kind == SPAWN:
+                self.spawn_aircraft()
+                cfg = self.get_level_cfg()
+                if self.planes_spawned < cfg["total"]:
+                    self.next_spawn += cfg["rate"]
+                    self.scheduler.schedule(self.next_spawn, SPAWN)
+            elif kind == FUEL_OUT:
+                ac = payload
+                self.fuel_watch.discard(ac.id)
+                if self.registry.get(ac.id) is not ac or ac.state not in CRUISING: continue
+                self._catch_up(ac)
+                if ac.fuel <= 0:
+                    ac.state = CRASHED  # en approche on plane : pas de crash (état LANDING)
+                else:
+                    # Pas encore vide (arrondis) : nouvelle échéance, au plus tôt au tick suivant,
+                    # sinon un reste infime la ferait retomber dans ce même parcours indéfiniment
+                    self.fuel_watch.add(ac.id)
+                    self.scheduler.schedule(self.time + max(ac.fuel / ac.consumption, 2 * EPSILON), FUEL_OUT, ac)
+            elif kind == DESPAWN:
+                despawned.add(payload.id)
+
+        if despawned:
+            if self.fleet is not None:
+                self.fleet.remove(despawned)
+                self.aircrafts = self.fleet.views
+            else:
+                self.aircrafts = [a for a in self.aircrafts if a.id not in despawned]
+
+    def _schedule_failure(self, ac):
+        """
+        Tire l'échéance de la prochaine panne d'un avion qui devient éligible (en vol, sans incident),
+        ou l'annule s'il ne l'est plus (approche). Un tirage par tick de probabilité p donne
+        une attente géométrique : on la tire d'un coup, P(k > m) = (1 - p)^m.
+        Sans mémoire : reprendre un nouveau tirage après une interruption ne change pas la loi.
+        """
+        eligible = ac.state in CRUISING and ac.event == NO_EVENT
+        if not eligible:
+            self.failure_due.pop(ac.id, None)
+            return
+        if ac.id in self.failure_due: return
+        p = FAILURE_RATE * self.current_level
+        u = 1.0 - self.rng.random()  # dans ]0, 1]
+        k = int(math.log(u) / math.log(1.0 - p)) + 1
+        due = self.events_tick + k  # le 1er tirage aurait eu lieu au prochain tick traité
+        self.failure_due[ac.id] = due
+        heapq.heappush(self.failures, (due, ac.id))
+
     def _trigger_events(self):
-        prob = 0.0002 * self.current_level
-        for ac in self.aircrafts:
-            if ac.state in ["FLYING", "HOLDING"] and ac.event is None:
-                if random.random() < prob:
-                    if random.randint(1, 3) == 1:
-                        ac.event = "MAYDAY"
-                    else:
-                        ac.event = "URGENCY"
+        """Déclenche les pannes arrivées à échéance (seules les échéances du tick sont lues)."""
+        self.events_tick = self.tick
+        heap = self.failures
+        while heap and heap[0][0] <= self.tick:
+            due, uid = heapq.heappop(heap)
+            if self.failure_due.get(uid) != due: continue  # échéance annulée ou remplacée
+            del self.failure_due[uid]
+            ac = self.registry.get(uid)
+            if ac is None or ac.state not in CRUISING or ac.event != NO_EVENT: continue
+            self._catch_up(ac)
+            if self.rng.randint(1, 3) == 1:
+                ac.event = MAYDAY
+            else:
+                ac.event = URGENCY
 
     def _update_aircrafts(self, dt):
+        if self.fleet is not None:
+            score, landed, crashed, out = self.fleet.step(dt, self.landing_zone)
+            self.score += score
+            self.stats["landed"] += landed
+            self.stats["crashed"] += crashed
+            self.stats["out"] += out
+            self.aircrafts = self.fleet.views
+            return
+
         keep = []
         lx, ly, lw, lh = self.landing_zone
+        lod = self.lod
+        if lod is not None:
+            traffic = None  # au premier besoin
+            window = LOD_PERIOD * dt
+
+        for i, ac in enumerate(self.aircrafts):
+            slot = None
+            if lod:
+                slot = lod.get(ac.id)
+                if slot is not None:
+                    slot[1] += dt
+                    if self.tick < slot[0]:
+                        keep.append(ac)  # vol rectiligne : intégré d'un bloc à la prochaine échéance
+                        continue
 
-        for ac in self.aircrafts:
             if not ac.score_counted:
-                if ac.state == "LANDED":
-                    bonus = 300 if ac.event == "MAYDAY" else (150 if ac.event == "URGENCY" else 0)
+                if ac.state == LANDED:
+                    bonus = 300 if ac.event == MAYDAY else (150 if ac.event == URGENCY else 0)
                     self.score += ac.base_score + bonus
                     self.stats["landed"] += 1
                     ac.score_counted = True #donc ton score a bien été compter donc l'ignorer la prochaine fois
-                elif ac.state == "CRASHED":
+                elif ac.state == CRASHED:
                     self.score -= 50
                     self.stats["crashed"] += 1
                     ac.score_counted = True
-                elif ac.state == "OUT_OF_BOUNDS":
+                elif ac.state == OUT_OF_BOUNDS:
                     self.score -= 20
                     self.stats["out"] += 1
                     ac.score_counted = True
 
-            if ac.state in ["CRASHED", "OUT_OF_BOUNDS"]:
-                ac.despawn_timer += dt
-                if ac.despawn_timer < 2.0: keep.append(ac)
+            if ac.state in WRECKED:
+                keep.append(ac)  # retirée par l'échéancier (DESPAWN)
                 continue # donc pas prendre en compte le reste de la définition
 
-            if ac.state == "LANDED": continue
-
-            if ac.fuel <= 0 and ac.state != "LANDING": #!= n'est pas en train d'attérrir (continue de planer meme avec 0 de fuel)
-                ac.state = "CRASHED"
-                keep.append(ac)
-                continue
+            if ac.state == LANDED: continue
 
-            ac.update_position(dt)
+            # Panne sèche : voir l'événement FUEL_OUT de l'échéancier
+            if slot is None:
+                ac.update_position(dt)
+                # Multi-cadence : candidats examinés une fois par fenêtre, en quinconce
+                if lod is not None and (self.tick + i) % LOD_PERIOD == 0 and ac.state == FLYING \
+                        and ac.event == NO_EVENT:
+                    if traffic is None: traffic = self._traffic_cells()
+                    if self._low_risk(ac, traffic, window):
+                        self._lod_turn += 1
+                        lod[ac.id] = [self.tick + 1 + self._lod_turn % LOD_PERIOD, 0.0]
+            else:
+                ac.update_position(slot[1])
+                slot[0] += LOD_PERIOD
+                slot[1] = 0.0
+                if traffic is None: traffic = self._traffic_cells()
+                if not self._low_risk(ac, traffic, window):
+                    del lod[ac.id]
 
             if ac.altitude <= 0:
                 ac.altitude = 0
                 on_rw = (lx - 20 <= ac.x <= lx + lw + 20) and (ly - 20 <= ac.y <= ly + lh + 20)
                 if on_rw:
-                    if ac.state == "LANDING" and ac.speed <= 1:
-                        ac.state = "LANDED"
-                    elif ac.state != "LANDING":
-                        ac.state = "CRASHED"
+                    if ac.state == LANDING and ac.speed <= 1:
+                        ac.state = LANDED
+                    elif ac.state != LANDING:
+                        ac.state = CRASHED
                 else:
-                    ac.state = "CRASHED"
+                    ac.state = CRASHED
             keep.append(ac)
 
         # Filtre distance par rapport au MODEL_CENTER
-        self.aircrafts = [a for a in keep if not (a.state == "OUT_OF_BOUNDS" and math.sqrt(
+        self.aircrafts = [a for a in keep if not (a.state == OUT_OF_BOUNDS and math.sqrt(
             (a.x - MODEL_CENTER) ** 2 + (a.y - MODEL_CENTER) ** 2) > 700)]
 
+    # --- Multi-cadence ---
+    def _traffic_cells(self):
+        """
+        Positions des avions en vol rangées par cases de LOD_CLEARANCE px.
+        Reconstruit une fois par fenêtre de LOD_PERIOD ticks (retard pris en compte dans _low_risk).
+        """
+        cached = self._lod_traffic
+        if cached is not None and self.tick - cached[0] < LOD_PERIOD:
+            return cached[1]
+        c = LOD_CLEARANCE
+        cells = {}
+        for ac in self.aircrafts:
+            if ac.state in AIRBORNE:
+                cells.setdefault((int(ac.x // c), int(ac.y // c)), []).append((ac.id, ac.x, ac.y))
+        self._lod_traffic = (self.tick, cells)
+        return cells
+
+    def _low_risk(self, ac, traffic, window):
+        """Vol rectiligne loin de la piste, du bord et du trafic : intégrable une fois par fenêtre."""
+        if ac.state != FLYING or ac.event != NO_EVENT or ac.heading != ac.target_heading:
+            return False
+        x, y = ac.x, ac.y
+        lx, ly, lw, lh = self.landing_zone
+        if math.hypot(x - (lx + lw / 2), y - (ly + lh / 2)) < LOD_RUNWAY_DIST:
+            return False
+        if math.hypot(x - MODEL_CENTER, y - MODEL_CENTER) > 510 - ac.speed * 0.1 * window - 1:
+            return False
+        c = LOD_CLEARANCE
+        cx, cy = int(x // c), int(y // c)
+        for i in (cx - 1, cx, cx + 1):
+            for j in (cy - 1, cy, cy + 1):
+                for uid, ox, oy in traffic.get((i, j), ()):
+                    if uid != ac.id and (ox - x) ** 2 + (oy - y) ** 2 < c * c:
+                        return False
+        return True
+
+    def position(self, ac):
+        """Position à jour d'un avion, y compris le vol rectiligne pas encore intégré (multi-cadence)."""
+        slot = self.lod.get(ac.id) if self.lod else None
+        if slot is None or slot[1] <= 0:
+            return ac.x, ac.y
+        d = ac.speed * 0.1 * slot[1]
+        rad = math.radians(ac.heading - 90)
+        return ac.x + d * math.cos(rad), ac.y + d * math.sin(rad)
+
+    def _catch_up(self, ac):
+        """Intègre le temps de retard d'un avion à cadence réduite et le repasse à pleine cadence."""
+        if self.lod:
+            slot = self.lod.pop(ac.id, None)
+            if slot is not None and slot[1] > 0:
+                ac.update_position(slot[1])
+
     def _check_collisions(self):
-        for i, a1 in enumerate(self.aircrafts):
-            for a2 in self.aircrafts[i + 1:]:
-                valid = ["FLYING", "LANDING", "HOLDING"]
-                if a1.state in valid and a2.state in valid:
+        # Même résultat que la comparaison de toutes les paires (i < j) dans l'ordre
+        # de la liste, mais on ne teste que les avions des cases voisines.
+        aircrafts = self.aircrafts
+        if self.lod:
+            # Avions à cadence réduite : aucune collision possible d'ici leur prochaine intégration (_low_risk)
+            lod = self.lod
+            aircrafts = [ac for ac in aircrafts if ac.id not in lod]
+        order = self.grid.sync(aircrafts, AIRBORNE)
+        for i, a1 in enumerate(aircrafts):
+            if a1.id not in order: continue
+            cands = [(order[a2.id], a2) for a2 in self.grid.neighbours(a1) if order[a2.id] > i]
+            if not cands: continue
+            cands.sort(key=lambda c: c[0])
+            for _, a2 in cands:
+                if a1.state not in AIRBORNE: break
+                if a2.state in AIRBORNE:
                     d = math.sqrt((a1.x - a2.x) ** 2 + (a1.y - a2.y) ** 2)
                     adh = abs(a1.altitude - a2.altitude)
-                    if d < 30 and adh < 100:
-                        a1.state = "CRASHED"
-                        a2.state = "CRASHED"
+                    if d < COLLISION_DIST and adh < COLLISION_ALT:
+                        a1.state = CRASHED
+                        a2.state = CRASHED
+
+    def _predict_conflicts(self):
+        self.conflicts.update(self.aircrafts, self.fleet)
 
     def _check_progression(self, cfg):
         if self.game_over or self.level_complete: return
@@ -0,0 +1,75 @@
+# src/model/snapshot.py
+"""
+Instantanés immuables de la simulation, publiés à chaque tick pour l'affichage.
+
+Le thread de simulation construit un Snapshot complet puis le publie dans un
+SnapshotBuffer ; les vues ne lisent que ces copies, jamais les objets du modèle.
+Les enregistrements portent les mêmes noms d'attributs que les avions :
+le radar et les panneaux les lisent sans changement.
+"""
+import math
+import time
+from collections import namedtuple
+from src.model.spatial import AircraftIndex
+
+AircraftSnapshot = namedtuple("AircraftSnapshot", ("id", "type_label", "x", "y", "heading", "target_heading",
+                                                   "altitude", "speed", "fuel", "state", "event"))
+
+# by_id, stats et info sont des copies propres à l'instantané : à lire seulement
+# index : requêtes de position sur les avions du tick (grille construite à la première requête)
+Snapshot = namedtuple("Snapshot", ("tick", "time", "score", "stats", "info", "level_complete", "game_over",
+                                   "current_level", "aircrafts", "by_id", "conflicts", "conflict_ids",
+                                   "landing_zone", "index"))
+
+
+def snapshot_aircraft(ac):
+    return AircraftSnapshot(ac.id, ac.type_label, ac.x, ac.y, ac.heading, ac.target_heading,
+                            ac.altitude, ac.speed, ac.fuel, ac.state, ac.event)
+
+
+def snapshot_lagging(ac, lag):
+    """Avion intégré à cadence réduite : vol rectiligne prolongé du temps pas encore intégré."""
+    d = ac.speed * 0.1 * lag
+    rad = math.radians(ac.heading - 90)
+    return AircraftSnapshot(ac.id, ac.type_label, ac.x + d * math.cos(rad), ac.y + d * math.sin(rad), ac.heading,
+                            ac.target_heading, ac.altitude, ac.speed, ac.fuel - ac.consumption * lag, ac.state,
+                            ac.event)
+
+
+def take_snapshot(model):
+    lod = model.lod
+    if lod:
+        aircrafts = tuple(snapshot_lagging(ac, lod[ac.id][1]) if ac.id in lod else snapshot_aircraft(ac)
+                          for ac in model.aircrafts)
+    else:
+        aircrafts = tuple(map(snapshot_aircraft, model.aircrafts))
+    cfg = model.get_level_cfg()
+    info = {
+        "current": model.current_level,
+        "spawned": model.planes_spawned,
+        "total": cfg["total"],
+        "min": cfg["score_min"],
+        "next": model.get_time_before_next_spawn()
+    }
+    conflicts = model.conflicts
+    return Snapshot(model.tick, model.time, model.score, dict(model.stats), info, model.level_complete,
+                    model.game_over, model.current_level, aircrafts, {ac.id: ac for ac in aircrafts},
+                    tuple(conflicts.pairs) if conflicts is not None else (),
+                    conflicts.ids if conflicts is not None else frozenset(),
+                    model.landing_zone, AircraftIndex(aircrafts))
+
+
+class SnapshotBuffer:
+    """
+    Double tampon : (précédent, courant, date de publication) remplacés d'une seule affectation.
+    Sous le GIL, un lecteur obtient toujours une paire cohérente, sans verrou.
+    """
+
+    def __init__(self):
+        self.front = (None, None, 0.0)
+
+    def publish(self, snapshot):
+        self.front = (self.front[1], snapshot, time.perf_counter())
+
+    def read(self):
+        return self.front
@@ -0,0 +1,152 @@
+# src/model/spatial.py
+
+
+class SpatialGrid:
+    """
+    Hachage spatial uniforme (x, y, tranche d'altitude).
+    Les avions ne changent de case que lorsqu'ils franchissent une frontière,
+    la grille est donc entretenue de manière incrémentale d'un tick à l'autre.
+    """
+
+    def __init__(self, cell=30, band=100):
+        self.cell = cell
+        self.band = band
+        self.cells = {}  # clé de case -> {uid: avion}
+        self.where = {}  # uid -> clé de case actuelle
+
+    def key(self, ac):
+        # // sur des flottants donne le plancher exact du quotient :
+        # deux avions à moins d'une case d'écart sont forcément voisins
+        return int(ac.x // self.cell), int(ac.y // self.cell), int(ac.altitude // self.band)
+
+    def clear(self):
+        self.cells.clear()
+        self.where.clear()
+
+    def move(self, ac):
+        k = self.key(ac)
+        old = self.where.get(ac.id)
+        if old == k and self.cells[k][ac.id] is ac:
+            return
+        if old is not None:
+            self._drop(ac.id, old)
+        self.cells.setdefault(k, {})[ac.id] = ac
+        self.where[ac.id] = k
+
+    def remove(self, uid):
+        old = self.where.pop(uid, None)
+        if old is not None:
+            self._drop(uid, old)
+
+    def _drop(self, uid, k):
+        bucket = self.cells[k]
+        del bucket[uid]
+        if not bucket: del self.cells[k]
+
+    def sync(self, aircrafts, states):
+        """
+        Met la grille à jour pour les avions dont l'état est dans `states`
+        et renvoie leur rang dans la liste (uid -> index).
+        """
+        order = {}
+        for i, ac in enumerate(aircrafts):
+            if ac.state in states:
+                order[ac.id] = i
+                self.move(ac)
+        if len(self.where) != len(order):
+            for uid in [u for u in self.where if u not in order]:
+                self.remove(uid)
+        return order
+
+    def neighbours(self, ac):
+        """Avions des 27 cases voisines (case de l'avion comprise)."""
+        cx, cy, cz = self.where[ac.id]
+        cells = self.cells
+        for x in (cx - 1, cx, cx + 1):
+            for y in (cy - 1, cy, cy + 1):
+                for z in (cz - 1, cz, cz + 1):
+                    bucket = cells.get((x, y, z))
+                    if bucket:
+                        yield from bucket.values()
+
+
+class AircraftIndex:
+    """
+    Index 2D en lecture seule pour les requêtes de position (clic radar, sélection par zone,
+    survol) : plus proche voisin dans un rayon, k plus proches, avions dans un rectangle.
+    Construit sur l'état d'un tick (un instantané par tick) ; la grille n'est remplie
+    qu'à la première requête, un tick sans requête ne coûte donc rien.
+    Les requêtes ne visitent que les cases utiles : coût indépendant du trafic lointain.
+    """
+
+    def __init__(self, aircrafts, cell=64):
+        self.aircrafts = aircrafts
+        self.cell = cell
+        self.cells = None  # (cx, cy) -> [(rang, avion)]
+
+    def _build(self):
+        c = self.cell
+        cells = {}
+        for i, ac in enumerate(self.aircrafts):
+            cells.setdefault((int(ac.x // c), int(ac.y // c)), []).append((i, ac))
+        self.cells = cells
+        if cells:
+            xs = [k[0] for k in cells]
+            ys = [k[1] for k in cells]
+            self._extent = (min(xs), min(ys), max(xs), max(ys))
+
+    def _rings(self, x, y):
+        """Cases par anneaux concentriques autour de (x, y) : (distance minimale possible, cases de l'anneau)."""
+        c = self.cell
+        cx, cy = int(x // c), int(y // c)
+        x0, y0, x1, y1 = self._extent
+        r_max = max(cx - x0, x1 - cx, cy - y0, y1 - cy)
+        cells = self.cells
+        for r in range(max(0, r_max) + 1):
+            if r == 0:
+                keys = ((cx, cy),)
+            else:
+                keys = [(cx + i, cy - r) for i in range(-r, r + 1)] + [(cx + i, cy + r) for i in range(-r, r + 1)] \
+                       + [(cx - r, cy + j) for j in range(-r + 1, r)] + [(cx + r, cy + j) for j in range(-r + 1, r)]
+            yield (r - 1) * c, [cells[k] for k in keys if k in cells]
+
+    def k_nearest(self, x, y, k, radius=None):
+        """Les k avions les plus proches de (x, y), du plus proche au plus lointain (rayon optionnel)."""
+        if self.cells is None: self._build()
+        if not self.cells or k <= 0: return []
+        limit = radius * radius if radius is not None else float("inf")
+        best = []  # (d², rang, avion), trié
+        for reach, buckets in self._rings(x, y):
+            if reach > 0 and (reach * reach > limit or (len(best) == k and reach * reach > best[-1][0])):
+                break
+            for bucket in buckets:
+                for i, ac in bucket:
+                    d2 = (ac.x - x) ** 2 + (ac.y - y) ** 2
+                    if d2 > limit: continue
+                    if len(best) < k or (d2, i) < best[-1][:2]:
+                        best.append((d2, i, ac))
+                        best.sort(key=lambda b: b[:2])
+                        del best[k:]
+        return [ac for _, _, ac in best]
+
+    def nearest(self, x, y, radius=None):
+        """Avion le plus proche de (x, y), à `radius` au plus ; None s'il n'y en a pas."""
+        found = self.k_nearest(x, y, 1, radius)
+        return found[0] if found else None
+
+    def in_rect(self, x0, y0, x1, y1):
+        """Avions dont la position est dans le rectangle (bornes incluses), dans l'ordre de la liste."""
+        if self.cells is None: self._build()
+        if not self.cells: return []
+        x0, x1 = min(x0, x1), max(x0, x1)
+        y0, y1 = min(y0, y1), max(y0, y1)
+        c = self.cell
+        ex0, ey0, ex1, ey1 = self._extent
+        found = []
+        for cx in range(max(int(x0 // c), ex0), min(int(x1 // c), ex1) + 1):
+            for cy in range(max(int(y0 // c), ey0), min(int(y1 // c), ey1) + 1):
+                for i, ac in self.cells.get((cx, cy), ()):
+                    if x0 <= ac.x <= x1 and y0 <= ac.y <= y1:
+                        found.append((i, ac))
+        found.sort(key=lambda f: f[0])
+        return [ac for _, ac in found]
@@ -0,0 +1,193 @@
+# src/net/commands.py
+"""
+Ordres envoyés par des contrôleurs externes (bots, scénarios de charge) sur une socket locale.
+
+Protocole JSON Lines, une ligne par lot :
+    {"seq": 12, "commands": [["AF123", "HEADING", 90], ["BA7", "LAND", 0], ...]}
+Réponse, une ligne par lot, dans l'ordre d'arrivée :
+    {"seq": 12, "tick": 4051, "results": ["OK", "REFUSED", ...]}
+Résultats : ceux de SimulationModel.apply_command ("OK", "REFUSED" en MAYDAY, "UNKNOWN"),
+ou "INVALID" pour un ordre mal formé (jamais appliqué ni enregistré).
+Valeurs admises, comme depuis le panneau de contrôle : cap absolu dans [0, 360[, variation
+d'altitude ou de vitesse bornée (MAX_ALTITUDE_STEP, MAX_SPEED_STEP), 0 pour HOLD / LAND.
+
+Un lot est appliqué d'un seul bloc, à la frontière de tick suivante, par le thread qui possède
+le modèle : soit via `submit` (le SimulationWorker de l'interface), soit en appelant
+apply_pending() entre deux ticks (boucle sans interface). Chaque connexion a un nombre borné
+de lots en attente ; au-delà, la lecture de la socket est suspendue.
+"""
+import asyncio
+import json
+import math
+import queue
+from src.net.server import LocalServer
+
+COMMANDS = ("HEADING", "ALTITUDE", "SPEED", "HOLD", "LAND")
+MAX_ALTITUDE_STEP = 10000  # ft par ordre
+MAX_SPEED_STEP = 650       # kt par ordre : toute la plage 150-800
+
+
+def _in_range(cmd_type, value):
+    if cmd_type == "HEADING": return 0 <= value < 360
+    if cmd_type == "ALTITUDE": return -MAX_ALTITUDE_STEP <= value <= MAX_ALTITUDE_STEP
+    if cmd_type == "SPEED": return -MAX_SPEED_STEP <= value <= MAX_SPEED_STEP
+    return value == 0
+
+
+def _parse(cmd):
+    """[id, commande, valeur] (valeur facultative pour HOLD / LAND) -> tuple, ou None si mal formé."""
+    if not isinstance(cmd, (list, tuple)) or not 2 <= len(cmd) <= 3: return None
+    ac_id, cmd_type = cmd[0], cmd[1]
+    value = cmd[2] if len(cmd) == 3 else 0
+    if not isinstance(ac_id, str) or cmd_type not in COMMANDS: return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)): return None
+    if isinstance(value, float) and not math.isfinite(value): return None  # NaN, ±inf
+    if not _in_range(cmd_type, value): return None
+    return ac_id, cmd_type, value
+
+
+class CommandBatch:
+    """Lot d'ordres reçu ; apply() l'applique au modèle et renvoie la réponse au client."""
+
+    def __init__(self, seq, commands, future):
+        self.seq = seq
+        self.commands = commands  # tuples (id, commande, valeur) ou None si mal formé
+        self.future = future
+        self.results = None
+
+    def apply(self, model, on_result=None):
+        """À appeler dans le thread du modèle, entre deux ticks."""
+        results = []
+        for cmd in self.commands:
+            if cmd is None:
+                results.append("INVALID")
+                continue
+            status = model.apply_command(*cmd)
+            results.append(status)
+            if on_result is not None: on_result(cmd[0], cmd[1], status)
+        self.results = results
+        reply = {"seq": self.seq, "tick": model.tick, "results": results}
+        self.future.get_loop().call_soon_threadsafe(_resolve, self.future, reply)
+        return results
+
+
+def _resolve(future, reply):
+    if not future.done(): future.set_result(reply)
+
+
+class CommandServer(LocalServer):
+    """
+    Reçoit des lots d'ordres. Sans `submit`, ils attendent dans `pending` jusqu'à apply_pending(model).
+    """
+    thread_name = "commands"
+    stream_limit = 2 ** 22  # longueur maximale d'une ligne (un lot)
+
+    def __init__(self, host="127.0.0.1", port=0, path=None, submit=None, max_inflight=16, max_batch=10000):
+        super().__init__(host, port, path)
+        self.pending = queue.SimpleQueue()
+        self.submit = submit or self.pending.put
+        self.max_inflight = max_inflight
+        self.max_batch = max_batch
+        self.batches = 0
+
+    # --- Côté thread du modèle ---
+    def apply_pending(self, model, on_result=None):
+        """Applique les lots reçus depuis le dernier appel ; renvoie leur nombre."""
+        n = 0
+        while True:
+            try:
+                batch = self.pending.get_nowait()
+            except queue.Empty:
+                return n
+            batch.apply(model, on_result)
+            n += 1
+
+    # --- Côté boucle asyncio ---
+    async def _serve(self, reader, writer):
+        inflight = asyncio.Semaphore(self.max_inflight)
+        replies = asyncio.Queue()
+        sender = asyncio.create_task(self._send(writer, replies, inflight))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line: break
+                if not line.strip(): continue
+                await inflight.acquire()  # trop de lots en attente : on cesse de lire
+                await replies.put(self._receive(line))
+        except (ConnectionError, ValueError):
+            pass  # client parti, ou ligne plus longue que la limite du lecteur
+        finally:
+            await replies.put(None)
+            await sender
+
+    def _receive(self, line):
+        """Lot soumis au modèle (future de sa réponse), ou réponse d'erreur immédiate."""
+        future = self.loop.create_future()
+        try:
+            msg = json.loads(line)
+        except ValueError:
+            msg = None
+        if not isinstance(msg, dict):
+            msg = {}
+        commands = msg.get("commands")
+        if not isinstance(commands, list) or len(commands) > self.max_batch:
+            future.set_result({"seq": msg.get("seq"), "error": "lot mal formé"})
+            return future
+        self.batches += 1
+        self.submit(CommandBatch(msg.get("seq"), [_parse(c) for c in commands], future))
+        return future
+
+    async def _send(self, writer, replies, inflight):
+        # Les lots sont appliqués dans l'ordre de soumission : les réponses suivent le même ordre
+        alive = True
+        while True:
+            future = await replies.get()
+            if future is None: return
+            reply = await future
+            inflight.release()
+            if not alive: continue
+            try:
+                writer.write(json.dumps(reply, separators=(",", ":")).encode() + b"\n")
+                await writer.drain()
+            except ConnectionError:
+                alive = False
+
+
+class CommandClient:
+    """Client asyncio minimal (bots, tests) : envoie des lots et attend leurs accusés."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.seq = 0
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=None, path=None):
+        if path is not None:
+            return cls(*await asyncio.open_unix_connection(path))
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def send(self, commands):
+        """Envoie un lot [(id, commande, valeur), ...] sans attendre ; renvoie son numéro."""
+        self.seq += 1
+        msg = {"seq": self.seq, "commands": [list(c) for c in commands]}
+        self.writer.write(json.dumps(msg, separators=(",", ":")).encode() + b"\n")
+        await self.writer.drain()
+        return self.seq
+
+    async def read_reply(self):
+        line = await self.reader.readline()
+        if not line: raise ConnectionError("Serveur d'ordres déconnecté")
+        return json.loads(line)
+
+    async def execute(self, commands):
+        """Envoie un lot et renvoie sa réponse (les lots précédents doivent déjà avoir été acquittés)."""
+        await self.send(commands)
+        return await self.read_reply()
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
@@ -0,0 +1,79 @@
+# src/net/server.py
+"""
+Socle commun des serveurs locaux (télémétrie, ordres à distance) : une boucle asyncio
+dans un thread dédié, à l'écoute en TCP (host, port ; port 0 = choisi par le système)
+ou sur une socket Unix (path). Les sous-classes ne fournissent que _serve(reader, writer).
+"""
+import asyncio
+import threading
+
+
+class LocalServer:
+    thread_name = "net"
+    stream_limit = 2 ** 16  # tampon de lecture par connexion
+
+    def __init__(self, host="127.0.0.1", port=0, path=None):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.address = None
+        self.loop = None
+        self.writers = set()
+        self._ready = threading.Event()
+        self._stopped = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+
+    def start(self):
+        """Rend la main une fois le serveur à l'écoute ; renvoie l'adresse réelle."""
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        return self.address
+
+    def close(self):
+        if self._thread.is_alive() and self._stopped is not None:
+            self.loop.call_soon_threadsafe(self._stopped.set)
+            self._thread.join(timeout=2.0)
+
+    def _run(self):
+        try:
+            asyncio.run(self._main())
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+
+    async def _main(self):
+        self.loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        if self.path is not None:
+            server = await asyncio.start_unix_server(self._handle, path=self.path, limit=self.stream_limit)
+            self.address = self.path
+        else:
+            server = await asyncio.start_server(self._handle, self.host, self.port, limit=self.stream_limit)
+            self.address = server.sockets[0].getsockname()[:2]
+        self._ready.set()
+        async with server:
+            await self._stopped.wait()
+            for writer in list(self.writers):
+                writer.close()
+
+    async def _handle(self, reader, writer):
+        self.writers.add(writer)
+        try:
+            await self._serve(reader, writer)
+        finally:
+            self.writers.discard(writer)
+            writer.close()
+
+    async def _serve(self, reader, writer):
+        raise NotImplementedError
+
+
+def parse_address(text):
+    """« 8765 », « hôte:8765 » ou un chemin de socket Unix -> arguments d'un LocalServer."""
+    if "/" in text:
+        return {"path": text}
+    host, _, port = text.rpartition(":")
+    return {"host": host or "127.0.0.1", "port": int(port)}
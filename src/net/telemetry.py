@@ -0,0 +1,263 @@
+# src/net/telemetry.py
+"""
+Diffusion locale, par asyncio, de la table des avions à chaque tick (écrans déportés, enregistreurs...).
+
+Le serveur tourne dans son propre thread avec sa boucle asyncio. Le thread de simulation lui confie
+le dernier instantané (publish) sans rien encoder : s'il publie plus vite que la boucle ne diffuse,
+seul le plus récent est envoyé. L'affichage (GameController.game_loop) n'est jamais concerné.
+
+Protocole (little-endian) : à la connexion MAGIC + version, puis des trames
+  FRAME (taille du corps, type, tick, score, niveau, drapeaux, nb d'avions, nb de retraits) + corps.
+  - KEYFRAME : tous les avions, complets.
+  - DELTA : seulement les champs modifiés depuis le tick précédent, plus les identifiants disparus.
+Avion : id, masque des champs présents, (type si nouveau), valeurs dans l'ordre de FIELDS.
+Chaque client a une file bornée : un client trop lent perd ses trames en attente
+et repart d'une trame complète (resynchronisation).
+"""
+import asyncio
+import struct
+from collections import namedtuple
+from src.net.server import LocalServer
+
+MAGIC = b"ATCT"
+VERSION = 1
+HELLO = struct.Struct("<4sB")
+FRAME = struct.Struct("<IBqqBBHH")  # taille, type, tick, score, niveau, drapeaux, avions, retraits
+MASK = struct.Struct("<H")
+
+KEYFRAME, DELTA = 1, 2
+LEVEL_COMPLETE, GAME_OVER = 1, 2
+NEW = 0x8000  # avion inconnu du client : type puis tous les champs
+
+# Champs diffusés (attributs d'AircraftSnapshot) et leur codage
+FIELDS = (("x", "f"), ("y", "f"), ("heading", "f"), ("target_heading", "f"), ("altitude", "f"),
+          ("speed", "f"), ("fuel", "f"), ("state", "b"), ("event", "b"))
+FIELD_NAMES = tuple(name for name, _ in FIELDS)
+ALL_FIELDS = (1 << len(FIELDS)) - 1
+
+TelemetryAircraft = namedtuple("TelemetryAircraft", ("id", "type_label") + FIELD_NAMES)
+Frame = namedtuple("Frame", ("kind", "tick", "score", "level", "level_complete", "game_over", "changed", "removed"))
+
+_structs = {}
+
+
+def _values_struct(mask):
+    """Struct des valeurs présentes pour un masque donné (mis en cache : peu de masques différents)."""
+    st = _structs.get(mask)
+    if st is None:
+        st = _structs[mask] = struct.Struct("<" + "".join(fmt for i, (_, fmt) in enumerate(FIELDS)
+                                                          if mask & (1 << i)))
+    return st
+
+
+def _text(s):
+    b = s.encode()
+    return bytes((len(b),)) + b
+
+
+def _row(ac):
+    return (ac.x, ac.y, ac.heading, ac.target_heading, ac.altitude, ac.speed, ac.fuel, int(ac.state), int(ac.event))
+
+
+def _frame(kind, snap, records, removed):
+    body = b"".join(records) + b"".join(removed)
+    flags = (LEVEL_COMPLETE if snap.level_complete else 0) | (GAME_OVER if snap.game_over else 0)
+    return FRAME.pack(len(body), kind, snap.tick, snap.score, snap.current_level, flags,
+                      len(records), len(removed)) + body
+
+
+class TelemetryEncoder:
+    """Encode les instantanés successifs ; garde la dernière table diffusée pour les deltas."""
+
+    def __init__(self):
+        self.snapshot = None
+        self.table = {}  # id -> valeurs diffusées au dernier tick
+
+    def delta(self, snap):
+        """Trame des changements depuis le dernier instantané encodé, qui devient la référence."""
+        prev = self.table
+        table = {}
+        records = []
+        pack_full = _values_struct(ALL_FIELDS).pack
+        for ac in snap.aircrafts:
+            row = _row(ac)
+            table[ac.id] = row
+            old = prev.get(ac.id)
+            if old is None:
+                records.append(_text(ac.id) + MASK.pack(NEW | ALL_FIELDS) + _text(ac.type_label) + pack_full(*row))
+            elif old != row:
+                mask = 0
+                changed = []
+                for i, v in enumerate(row):
+                    if v != old[i]:
+                        mask |= 1 << i
+                        changed.append(v)
+                records.append(_text(ac.id) + MASK.pack(mask) + _values_struct(mask).pack(*changed))
+        removed = [_text(uid) for uid in prev if uid not in table]
+        self.snapshot = snap
+        self.table = table
+        return _frame(DELTA, snap, records, removed)
+
+    def keyframe(self):
+        """Trame complète du dernier instantané encodé (point de départ d'un client)."""
+        snap = self.snapshot
+        pack_full = _values_struct(ALL_FIELDS).pack
+        records = [_text(ac.id) + MASK.pack(NEW | ALL_FIELDS) + _text(ac.type_label) + pack_full(*self.table[ac.id])
+                   for ac in snap.aircrafts]
+        return _frame(KEYFRAME, snap, records, ())
+
+
+class _Subscriber:
+    def __init__(self, writer, size):
+        self.writer = writer
+        self.queue = asyncio.Queue(size)
+        self.synced = False  # a reçu une trame complète depuis sa dernière perte
+        self.resyncs = 0
+
+
+class TelemetryServer(LocalServer):
+    """Diffuse les instantanés confiés par publish() à tous les clients connectés."""
+    thread_name = "telemetry"
+
+    def __init__(self, host="127.0.0.1", port=0, path=None, queue_size=8):
+        super().__init__(host, port, path)
+        self.queue_size = queue_size
+        self.subscribers = set()
+        self.encoder = TelemetryEncoder()
+        self.frames = 0
+        self._pending = None
+        self._scheduled = False
+
+    # --- Côté appelant (n'importe quel thread) ---
+    def publish(self, snap):
+        """Confie le dernier instantané ; ne bloque pas et n'encode rien dans le thread appelant."""
+        self._pending = snap
+        if not self._scheduled and self.loop is not None:
+            self._scheduled = True
+            self.loop.call_soon_threadsafe(self._broadcast)
+
+    # --- Côté boucle asyncio ---
+    def _broadcast(self):
+        self._scheduled = False
+        snap, self._pending = self._pending, None
+        if snap is None: return
+        self.frames += 1
+        frame = self.encoder.delta(snap)
+        key = None
+        for sub in self.subscribers:
+            q = sub.queue
+            if sub.synced and not q.full():
+                q.put_nowait(frame)
+                continue
+            if sub.synced:
+                # Client trop lent : on jette ce qui attend et on repart d'une trame complète
+                while not q.empty():
+                    q.get_nowait()
+                sub.resyncs += 1
+            if key is None:
+                key = self.encoder.keyframe()
+            q.put_nowait(key)
+            sub.synced = True
+
+    async def _serve(self, reader, writer):
+        sub = _Subscriber(writer, self.queue_size)
+        self.subscribers.add(sub)
+        try:
+            writer.write(HELLO.pack(MAGIC, VERSION))
+            if self.encoder.snapshot is not None:
+                sub.queue.put_nowait(self.encoder.keyframe())
+                sub.synced = True
+            while True:
+                writer.write(await sub.queue.get())
+                await writer.drain()  # contre-pression : la file se remplit pendant l'attente
+        except ConnectionError:
+            pass
+        finally:
+            self.subscribers.discard(sub)
+
+
+class TelemetryMirror:
+    """Table des avions reconstruite à partir des trames (côté client)."""
+
+    def __init__(self):
+        self.rows = {}  # id -> [type, valeurs...]
+        self.frame = None
+        self.keyframes = 0
+
+    @property
+    def aircrafts(self):
+        return {uid: TelemetryAircraft(uid, *row) for uid, row in self.rows.items()}
+
+    def apply(self, header, body):
+        """Applique une trame (en-tête FRAME déjà lu) et renvoie son résumé."""
+        size, kind, tick, score, level, flags, n_records, n_removed = header
+        if kind == KEYFRAME:
+            self.rows = {}
+            self.keyframes += 1
+        rows = self.rows
+        changed = []
+        pos = 0
+        for _ in range(n_records):
+            n = body[pos]
+            uid = body[pos + 1:pos + 1 + n].decode()
+            pos += 1 + n
+            mask, = MASK.unpack_from(body, pos)
+            pos += MASK.size
+            if mask & NEW:
+                n = body[pos]
+                row = rows[uid] = [body[pos + 1:pos + 1 + n].decode()] + [None] * len(FIELDS)
+                pos += 1 + n
+            else:
+                row = rows[uid]
+            st = _values_struct(mask & ALL_FIELDS)
+            values = iter(st.unpack_from(body, pos))
+            pos += st.size
+            for i in range(len(FIELDS)):
+                if mask & (1 << i):
+                    row[i + 1] = next(values)
+            changed.append(uid)
+        removed = []
+        for _ in range(n_removed):
+            n = body[pos]
+            uid = body[pos + 1:pos + 1 + n].decode()
+            pos += 1 + n
+            rows.pop(uid, None)
+            removed.append(uid)
+        self.frame = Frame(kind, tick, score, level, bool(flags & LEVEL_COMPLETE), bool(flags & GAME_OVER),
+                           changed, removed)
+        return self.frame
+
+
+class TelemetryClient:
+    """Client asyncio minimal (bouclage local, tests) : lit les trames et tient un TelemetryMirror."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.mirror = TelemetryMirror()
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=None, path=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        magic, version = HELLO.unpack(await reader.readexactly(HELLO.size))
+        if magic != MAGIC or version != VERSION:
+            writer.close()
+            raise ValueError("Flux de télémétrie non reconnu")
+        return cls(reader, writer)
+
+    async def read_frame(self):
+        """Attend la trame suivante, l'applique au miroir et renvoie son résumé (Frame)."""
+        header = FRAME.unpack(await self.reader.readexactly(FRAME.size))
+        body = await self.reader.readexactly(header[0])
+        return self.mirror.apply(header, body)
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
@@ -0,0 +1,119 @@
+# src/profiler.py
+"""
+Profileur léger des phases d'une frame (simulation, liste, panneau de contrôle, radar).
+
+Les méthodes suivies sont enveloppées sur l'instance uniquement pendant le profilage :
+désactivé, les attributs d'instance sont retirés et les appels reprennent le chemin normal
+(aucun test, aucun chronomètre). Chaque section garde ses dernières durées dans un
+tampon circulaire (p50/p95/max glissants) et le cumul par frame est conservé pour l'export CSV.
+Les sections « sim.* » sont mesurées dans le thread de simulation, les autres dans le thread graphique.
+"""
+import csv
+import time
+from collections import deque
+
+
+class TickProfiler:
+    def __init__(self, window=300, history=20000):
+        self.enabled = False
+        self.window = window
+        self.sections = []                  # ordre d'affichage
+        self.samples = {}                   # section -> dernières durées (s)
+        self.frame = {}                     # section -> cumul de la frame en cours (s)
+        self.rows = deque(maxlen=history)   # (tick, {section: s}) par frame
+        self.targets = []                   # (objet, méthode, section)
+        self._summary = []
+        self._summary_time = 0.0
+
+    # --- Points de mesure ---
+    def add_target(self, obj, attr, section):
+        self.targets.append((obj, attr, section))
+        if section not in self.sections:
+            self.sections.append(section)
+        if self.enabled:
+            self._wrap(obj, attr, section)
+
+    def _wrap(self, obj, attr, section):
+        fn = getattr(obj, attr)
+        record = self.record
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(section, clock() - start)
+
+        setattr(obj, attr, timed)
+
+    def enable(self):
+        if self.enabled: return
+        for obj, attr, section in self.targets:
+            self._wrap(obj, attr, section)
+        self.enabled = True
+
+    def disable(self):
+        if not self.enabled: return
+        for obj, attr, _ in self.targets:
+            delattr(obj, attr)  # on retombe sur la méthode de la classe
+        self.enabled = False
+        self.frame = {}
+
+    def toggle(self):
+        self.disable() if self.enabled else self.enable()
+        return self.enabled
+
+    # --- Mesures ---
+    def record(self, section, seconds):
+        q = self.samples.get(section)
+        if q is None:
+            q = self.samples[section] = deque(maxlen=self.window)
+        q.append(seconds)
+        self.frame[section] = self.frame.get(section, 0.0) + seconds
+
+    def end_frame(self, tick):
+        if self.frame:
+            self.rows.append((tick, self.frame))
+            self.frame = {}
+
+    def summary(self, max_age=0.5):
+        """[(section, p50, p95, max)] en ms, recalculé au plus toutes les max_age secondes."""
+        now = time.perf_counter()
+        if now - self._summary_time >= max_age:
+            out = []
+            for section in self.sections:
+                q = self.samples.get(section)
+                if not q: continue
+                s = sorted(q)
+                n = len(s)
+                out.append((section, s[n // 2] * 1000, s[min(n - 1, int(n * 0.95))] * 1000, s[-1] * 1000))
+            self._summary = out
+            self._summary_time = now
+        return self._summary
+
+    def reset(self):
+        self.samples.clear()
+        self.rows.clear()
+        self.frame = {}
+        self._summary = []
+
+    def export_csv(self, path):
+        """Une ligne par frame : tick de simulation puis durée cumulée (ms) de chaque section."""
+        with open(path, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["tick"] + self.sections)
+            for tick, frame in self.rows:
+                w.writerow([tick] + [f"{frame[s] * 1000:.4f}" if s in frame else "" for s in self.sections])
+        return len(self.rows)
+
+
+def profile_model(profiler, model):
+    """Sections de la simulation ; « sim.update » englobe les phases qui suivent."""
+    profiler.add_target(model, "update", "sim.update")
+    profiler.add_target(model, "_trigger_events", "sim.events")
+    profiler.add_target(model, "_update_aircrafts", "sim.aircrafts")
+    profiler.add_target(model, "_check_collisions", "sim.collisions")
+    if model.conflicts is not None:
+        profiler.add_target(model, "_predict_conflicts", "sim.conflicts")
+    profiler.add_target(model.registry, "sync", "sim.registry")
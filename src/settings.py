@@ -17,6 +17,26 @@ RADAR_WIDTH = 1000
 RADAR_HEIGHT = 1000
 MODEL_CENTER = 500
 
+# --- BOUCLE DE JEU ---
+SIM_DT = 0.03        # pas fixe de la simulation (s)
+FRAME_MS = 16        # période de rafraîchissement de l'affichage (~60 images/s)
+MAX_SIM_STEPS = 5    # rattrapage maximal du thread de simulation quand il a pris du retard
+
+# --- PRÉDICTION DE CONFLITS ---
+CONFLICT_LOOKAHEAD = 20.0  # horizon de prédiction (s)
+CONFLICT_DIST = 45         # séparation horizontale minimale prévue (px)
+CONFLICT_ALT = 300         # séparation verticale minimale (ft)
+
+# --- SIMULATION MULTI-CADENCE (voir SimulationModel, multi_rate) ---
+LOD_PERIOD = 4         # un avion à faible risque n'est intégré qu'un tick sur LOD_PERIOD
+LOD_CLEARANCE = 75     # distance horizontale minimale au trafic le plus proche (px)
+LOD_RUNWAY_DIST = 200  # distance minimale à la piste (px)
+
+# --- SAUVEGARDE (voir src/model/savestate.py) ---
+QUICKSAVE_PATH = "sauvegarde.atcs"  # F5 : sauvegarde rapide, F9 : chargement
+CHECKPOINT_PERIOD = 100             # un point de reprise tous les CHECKPOINT_PERIOD ticks (F8 : retour arrière)
+CHECKPOINT_CAPACITY = 20            # nombre de points de reprise conservés
+
 # --- CONFIG NIVEAUX ---
 LEVELS = {
     1: {"total": 5, "rate": 8.0, "score_min": 300},
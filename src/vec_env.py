@@ -0,0 +1,185 @@
+# src/vec_env.py
+"""
+Environnement vectorisé, façon Gym, pour entraîner ou évaluer des contrôleurs automatiques
+(nécessite NumPy).
+
+N simulations indépendantes (graines seed, seed + 1, ...) avancent ensemble à chaque step().
+Un épisode est un niveau : il se termine sur level_complete ou game_over (ou après
+max_episode_steps) et l'environnement concerné est aussitôt relancé sur le même niveau.
+
+    env = VecEnv(64, seed=0)
+    obs = env.reset()                      # (N, max_aircraft, len(FEATURES)) float32
+    obs, rewards, dones, info = env.step(actions)  # actions : (N, max_aircraft) entiers, voir ACTIONS
+
+Chaque avion occupe un emplacement fixe de son apparition à sa disparition : la ligne k de
+l'observation et la colonne k des actions désignent le même avion d'un pas à l'autre.
+Au-delà de max_aircraft avions, les suivants attendent qu'un emplacement se libère (info["hidden"]).
+La récompense est la variation du score pendant le pas.
+"""
+import numpy as np
+
+from src.settings import SIM_DT
+from src.model.simulation import SimulationModel
+
+# Caractéristiques d'un avion, normalisées (emplacement vide : que des zéros)
+FEATURES = ("present", "x", "y", "heading_sin", "heading_cos", "altitude", "speed", "fuel", "state", "event")
+ALT_SCALE = 10000.0
+SPEED_SCALE = 800.0
+FUEL_SCALE = 100.0
+
+# Actions : mêmes ordres que le panneau de contrôle (GameController.handle_command)
+HEADINGS = 8  # caps absolus, tous les 45°
+ACTIONS = ((None, 0), ("ALTITUDE", 500), ("ALTITUDE", -500), ("SPEED", 50), ("SPEED", -50), ("HOLD", 0),
+           ("LAND", 0)) + tuple(("HEADING", float(k * 360 // HEADINGS)) for k in range(HEADINGS))
+NOOP = 0
+
+
+class VecEnv:
+    def __init__(self, n, seed=0, level=1, max_aircraft=32, frame_skip=1, max_episode_steps=None,
+                 backend="python", levels=None):
+        self.n = n
+        self.level = level
+        self.max_aircraft = max_aircraft
+        self.frame_skip = frame_skip
+        self.max_episode_steps = max_episode_steps
+        seeds = [seed + i for i in range(n)] if isinstance(seed, int) else list(seed)
+        # La prédiction de conflits ne sert qu'à l'affichage : inutile ici
+        self.models = [SimulationModel(1000, 1000, backend=backend, seed=s, levels=levels,
+                                       predict_conflicts=False) for s in seeds]
+        self.observation_shape = (n, max_aircraft, len(FEATURES))
+        self.n_actions = len(ACTIONS)
+        self.slots = [{} for _ in range(n)]            # id -> emplacement, par environnement
+        self.slot_ids = [[None] * max_aircraft for _ in range(n)]
+        self.scores = np.zeros(n, dtype=np.int64)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self.episodes = np.zeros(n, dtype=np.int64)
+        self.hidden = np.zeros(n, dtype=np.int64)
+
+    # --- Épisodes ---
+    def reset(self):
+        for i in range(self.n):
+            self._reset_env(i)
+        return self._observe()
+
+    def _reset_env(self, i):
+        model = self.models[i]
+        model.reset_game(self.level)
+        self.slots[i].clear()
+        self.slot_ids[i] = [None] * self.max_aircraft
+        self.scores[i] = model.score
+        self.steps[i] = 0
+
+    def step(self, actions):
+        """
+        Applique les actions (une par emplacement, NOOP pour rien) puis avance de frame_skip ticks.
+        actions : entiers de forme (N, max_aircraft), dans [0, n_actions[ ; sinon ValueError, rien n'est appliqué.
+        Renvoie (observations, récompenses, épisodes terminés, info) ; les environnements terminés
+        sont relancés, leur dernière observation est dans info["final_observation"].
+        """
+        actions = np.asarray(actions)
+        # Vérifié avant tout ordre : un lot refusé ne laisse aucun environnement à moitié commandé
+        if actions.shape != (self.n, self.max_aircraft):
+            raise ValueError(f"Actions de forme {actions.shape}, attendu {(self.n, self.max_aircraft)}")
+        if not np.issubdtype(actions.dtype, np.integer):
+            raise ValueError(f"Actions de type {actions.dtype}, attendu des entiers (indices dans ACTIONS)")
+        if actions.size and (actions.min() < 0 or actions.max() >= self.n_actions):
+            raise ValueError(f"Actions hors de [0, {self.n_actions - 1}]")
+        refused = np.zeros(self.n, dtype=np.int64)
+        for i, k in zip(*np.nonzero(actions)):
+            ac_id = self.slot_ids[i][k]
+            if ac_id is None: continue
+            cmd_type, value = ACTIONS[actions[i, k]]
+            if self.models[i].apply_command(ac_id, cmd_type, value) == "REFUSED":
+                refused[i] += 1
+
+        for model in self.models:
+            for _ in range(self.frame_skip):
+                model.update(SIM_DT)
+                if model.level_complete or model.game_over: break
+        self.steps += 1
+
+        scores = np.fromiter((m.score for m in self.models), dtype=np.int64, count=self.n)
+        rewards = (scores - self.scores).astype(np.float32)
+        self.scores = scores.copy()  # info["score"] garde le score de fin des épisodes relancés
+        level_complete = np.fromiter((m.level_complete for m in self.models), dtype=bool, count=self.n)
+        game_over = np.fromiter((m.game_over for m in self.models), dtype=bool, count=self.n)
+        truncated = np.zeros(self.n, dtype=bool)
+        if self.max_episode_steps is not None:
+            truncated = (self.steps >= self.max_episode_steps) & ~level_complete & ~game_over
+        dones = level_complete | game_over | truncated
+
+        obs = self._observe()
+        info = {"score": scores, "refused": refused, "level_complete": level_complete, "game_over": game_over,
+                "truncated": truncated, "hidden": self.hidden.copy()}
+        if dones.any():
+            info["final_observation"] = obs.copy()
+            done_idx = np.flatnonzero(dones)
+            for i in done_idx:
+                self._reset_env(i)
+                self.episodes[i] += 1
+            obs[done_idx] = 0.0
+            self._observe(obs, done_idx)
+        return obs, rewards, dones, info
+
+    def close(self):
+        pass
+
+    # --- Observations ---
+    def _assign(self, i, aircrafts):
+        """Emplacements des avions présents ; libère ceux des avions disparus."""
+        slots = self.slots[i]
+        ids = self.slot_ids[i]
+        present = {ac.id for ac in aircrafts}
+        for uid in [uid for uid in slots if uid not in present]:
+            ids[slots.pop(uid)] = None
+        free = (k for k, uid in enumerate(ids) if uid is None)
+        hidden = 0
+        for ac in aircrafts:
+            if ac.id in slots: continue
+            k = next(free, None)
+            if k is None:
+                hidden += 1
+                continue
+            slots[ac.id] = k
+            ids[k] = ac.id
+        self.hidden[i] = hidden
+        return slots
+
+    def _observe(self, obs=None, envs=None):
+        """Remplit (ou crée) le tableau d'observations ; une seule affectation vectorisée pour tous les avions."""
+        if obs is None:
+            obs = np.zeros(self.observation_shape, dtype=np.float32)
+        elif envs is None:
+            obs.fill(0.0)
+        rows, env_idx, slot_idx = [], [], []
+        for i in (range(self.n) if envs is None else envs):
+            model = self.models[i]
+            slots = self._assign(i, model.aircrafts)
+            for ac in model.aircrafts:
+                k = slots.get(ac.id)
+                if k is None: continue
+                rows.append((ac.x, ac.y, ac.heading, ac.altitude, ac.speed, ac.fuel, ac.state, ac.event))
+                env_idx.append(i)
+                slot_idx.append(k)
+        if not rows:
+            return obs
+        raw = np.array(rows, dtype=np.float64)
+        heading = np.radians(raw[:, 2])
+        model = self.models[0]
+        feats = np.empty((len(rows), len(FEATURES)), dtype=np.float32)
+        feats[:, 0] = 1.0
+        feats[:, 1] = raw[:, 0] / model.width
+        feats[:, 2] = raw[:, 1] / model.height
+        feats[:, 3] = np.sin(heading)
+        feats[:, 4] = np.cos(heading)
+        feats[:, 5] = raw[:, 3] / ALT_SCALE
+        feats[:, 6] = raw[:, 4] / SPEED_SCALE
+        feats[:, 7] = raw[:, 5] / FUEL_SCALE
+        feats[:, 8:] = raw[:, 6:]
+        obs[env_idx, slot_idx] = feats
+        return obs
+
+
+def heading_action(heading):
+    """Action HEADING la plus proche d'un cap absolu (degrés)."""
+    return len(ACTIONS) - HEADINGS + round(heading % 360 / (360 / HEADINGS)) % HEADINGS
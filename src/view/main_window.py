@@ -1,11 +1,14 @@
 from PySide6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QApplication
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, Qt
+from PySide6.QtGui import QShortcut, QKeySequence
 import math
 
 from src.view.radar_widget import RadarWidget
 from src.view.dialogs import LevelCompleteDialog, GameOverDialog
 from src.view.panels import StatusPanel, ControlPanel
 from src.settings import BG_DARK, FG_LIGHT, SCREEN_WIDTH, SCREEN_HEIGHT
+from src.model.aircraft.states import CRUISING
+from src.model.registry import SPAWNED, DESPAWNED
 
 
 class MainWindow(QMainWindow):
@@ -15,6 +18,11 @@ class MainWindow(QMainWindow):
     next_level_signal = Signal()
     restart_game_signal = Signal()
     surrender_signal = Signal()
+    toggle_profiler_signal = Signal()
+    export_profile_signal = Signal()
+    quick_save_signal = Signal()
+    quick_load_signal = Signal()
+    rewind_signal = Signal()
 
     def __init__(self):
         super().__init__()
@@ -27,7 +35,7 @@ class MainWindow(QMainWindow):
         self.status_panel = StatusPanel()
         self.control_panel = ControlPanel()
         self.selected_id = None
-        self.current_aircrafts = []
+        self.registry = {}  # id -> avion (instantané courant), fourni par le contrôleur
 
         # --- LAYOUT PRINCIPAL ---
         main = QWidget()
@@ -46,6 +54,14 @@ class MainWindow(QMainWindow):
         self.control_panel.surrender_signal.connect(self.surrender_signal.emit)
         self.control_panel.command_signal.connect(self.relay_command)
 
+        # --- RACCOURCIS (profilage) ---
+        QShortcut(QKeySequence(Qt.Key_F3), self, self.toggle_profiler_signal.emit)
+        QShortcut(QKeySequence(Qt.Key_F4), self, self.export_profile_signal.emit)
+        # --- RACCOURCIS (sauvegarde) ---
+        QShortcut(QKeySequence(Qt.Key_F5), self, self.quick_save_signal.emit)
+        QShortcut(QKeySequence(Qt.Key_F8), self, self.rewind_signal.emit)
+        QShortcut(QKeySequence(Qt.Key_F9), self, self.quick_load_signal.emit)
+
     def relay_command(self, type, val):
         if self.selected_id:
             self.command_signal.emit(self.selected_id, type, val)
@@ -64,7 +80,7 @@ class MainWindow(QMainWindow):
             self.control_panel.update_selection(None, [])
             return
 
-        ac = next((a for a in self.current_aircrafts if a.id == self.selected_id), None)
+        ac = self.registry.get(self.selected_id)
         if not ac: return
 
         # --- LOGIQUE DE VALIDATION ATTERRISSAGE ---
@@ -77,7 +93,7 @@ class MainWindow(QMainWindow):
         if diff > 180: diff = 360 - diff
 
         # 2. Vérifications
-        if ac.state not in ["FLYING", "HOLDING"]:
+        if ac.state not in CRUISING:
             errors.append("Etat Invalide")
 
         if diff >= 20:
@@ -92,9 +108,23 @@ class MainWindow(QMainWindow):
         # On envoie l'avion ET la liste des erreurs au panneau
         self.control_panel.update_selection(ac, errors)
 
-    def update_ui(self, score, stats, info, aircrafts):
-        self.current_aircrafts = aircrafts
-        self.status_panel.update_stats(score, stats, info, aircrafts)
+    def set_registry(self, registry):
+        self.registry = registry
+
+    def on_fleet_event(self, kind, ac, old, new):
+        """
+        Notifications du registre (relayées depuis le thread de simulation) :
+        la liste n'est modifiée qu'à l'apparition/disparition.
+        """
+        if kind == SPAWNED:
+            self.status_panel.model.add(ac)
+        elif kind == DESPAWNED:
+            self.status_panel.model.remove(ac.id)
+            if ac.id == self.selected_id:
+                self.set_selection(None)
+
+    def update_ui(self, score, stats, info, aircrafts, conflicts=frozenset()):
+        self.status_panel.update_stats(score, stats, info, aircrafts, conflicts)
         self.refresh_control_panel()  # Update temps réel pour voir les conditions changer
 
     def reset_ui_state(self):
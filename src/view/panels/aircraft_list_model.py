@@ -0,0 +1,117 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PySide6.QtGui import QColor
+from src.settings import ACCENT_RED, ACCENT_ORANGE, ACCENT_PURPLE, ACCENT_YELLOW
+from src.model.aircraft.states import HOLDING, LANDING, LANDED, CRASHED, OUT_OF_BOUNDS, MAYDAY, URGENCY
+
+STATE_TAGS = {OUT_OF_BOUNDS: "SORTI", CRASHED: "CRASH", LANDED: "SOL", LANDING: "APP", HOLDING: "HOLD"}
+
+
+def describe(ac, conflict=False):
+    """Texte et couleur d'une ligne de la liste (None = couleur par défaut)."""
+    st = STATE_TAGS.get(ac.state, "")
+    evt = "[PANNE]" if ac.event == MAYDAY else ("[URG]" if ac.event == URGENCY else "")
+    text = f"{ac.id} | V:{int(ac.speed)} A:{int(ac.altitude)} F:{int(ac.fuel)}% {st} {evt}"
+    if conflict: text += " [CONFLIT]"
+
+    color = None
+    if ac.state == CRASHED:
+        color = ACCENT_RED
+    elif ac.event == MAYDAY:
+        color = ACCENT_ORANGE
+    elif conflict:
+        color = ACCENT_YELLOW
+    elif ac.state == HOLDING:
+        color = ACCENT_PURPLE
+    return text, color
+
+
+class AircraftListModel(QAbstractListModel):
+    """
+    Liste des avions indexée par identifiant.
+    Les lignes ne sont insérées/retirées qu'à l'apparition/disparition d'un avion,
+    et dataChanged n'est émis que pour les lignes dont le texte ou la couleur a changé.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ids = []      # ordre d'affichage
+        self.rows = {}     # uid -> ligne
+        self.cache = {}    # uid -> (texte, couleur)
+        self.colors = {}   # couleur hexa -> QColor
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.ids):
+            return None
+        uid = self.ids[index.row()]
+        if role == Qt.DisplayRole:
+            return self.cache[uid][0]
+        if role == Qt.ForegroundRole:
+            color = self.cache[uid][1]
+            if color is None: return None
+            if color not in self.colors: self.colors[color] = QColor(color)
+            return self.colors[color]
+        if role == Qt.UserRole:
+            return uid
+        return None
+
+    def row_of(self, uid):
+        return self.rows.get(uid)
+
+    # --- Apparitions / disparitions (notifications du registre) ---
+    def add(self, ac):
+        if ac.id in self.rows: return
+        row = len(self.ids)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows[ac.id] = row
+        self.ids.append(ac.id)
+        self.cache[ac.id] = describe(ac)
+        self.endInsertRows()
+
+    def remove(self, uid):
+        row = self.rows.get(uid)
+        if row is None: return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.ids[row]
+        del self.rows[uid]
+        del self.cache[uid]
+        for r in range(row, len(self.ids)):
+            self.rows[self.ids[r]] = r
+        self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.ids, self.rows, self.cache = [], {}, {}
+        self.endResetModel()
+
+    def refresh(self, aircrafts, conflicts=frozenset()):
+        """
+        Émet dataChanged pour les seules lignes dont le texte ou la couleur a changé.
+        conflicts : identifiants des avions en conflit prévu (mis en évidence).
+        """
+        changed = []
+        rows, cache = self.rows, self.cache
+        for ac in aircrafts:
+            row = rows.get(ac.id)
+            if row is None: continue
+            d = describe(ac, ac.id in conflicts)
+            if cache[ac.id] != d:
+                cache[ac.id] = d
+                changed.append(row)
+        if changed:
+            changed.sort()
+            for first, last in _runs(changed):
+                self.dataChanged.emit(self.index(first), self.index(last), [Qt.DisplayRole, Qt.ForegroundRole])
+
+
+def _runs(rows):
+    """[1, 2, 3, 7, 8] -> [(1, 3), (7, 8)]"""
+    runs = []
+    for r in rows:
+        if runs and runs[-1][1] == r - 1:
+            runs[-1][1] = r
+        else:
+            runs.append([r, r])
+    return [tuple(run) for run in runs]
@@ -2,6 +2,7 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel, QGroupB
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QPushButton, QSpinBox
 from PySide6.QtCore import Qt, Signal
 from src.settings import *
+from src.model.aircraft.states import HOLDING
 
 
 class ControlPanel(QWidget):
@@ -126,7 +127,7 @@ class ControlPanel(QWidget):
             self.last_selected_id = ac.id
 
         # Le reste (boutons) peut être mis à jour en continu
-        self.btn_hold.setText("SORTIR D'ATTENTE" if ac.state == "HOLDING" else "✋ MISE EN ATTENTE")
+        self.btn_hold.setText("SORTIR D'ATTENTE" if ac.state == HOLDING else "✋ MISE EN ATTENTE")
 
         # Gestion bouton Atterrissage
         if not errors:
@@ -1,7 +1,8 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QGroupBox, QGridLayout, QLabel, QListWidget, QListWidgetItem, QFrame
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QGroupBox, QGridLayout, QLabel, QListView, QFrame
 from PySide6.QtGui import QColor, QFont
 from PySide6.QtCore import Qt, Signal
 from src.settings import *
+from src.view.panels.aircraft_list_model import AircraftListModel
 
 
 class StatusPanel(QWidget):
@@ -122,27 +123,27 @@ class StatusPanel(QWidget):
             }
         """)
         v = QVBoxLayout(gb2)
-        self.lst = QListWidget()
+        # Modèle indexé par identifiant : pas de reconstruction complète à chaque tick
+        self.model = AircraftListModel(self)
+        self.lst = QListView()
+        self.lst.setModel(self.model)
+        self.lst.setUniformItemSizes(True)
         self.lst.setStyleSheet("background-color: #1e1e1e; border: 1px solid #444; font-size: 12px;")
-        self.lst.itemClicked.connect(self._on_item_click)
+        self.lst.clicked.connect(self._on_item_click)
         v.addWidget(self.lst)
         self.layout.addWidget(gb2)
 
-    def _on_item_click(self, item):
-        uid = item.text().split(' ')[0]
-        self.selection_changed.emit(uid)
+    def _on_item_click(self, index):
+        self.selection_changed.emit(index.data(Qt.UserRole))
 
     def highlight_aircraft(self, uid):
-        if not uid:
+        row = self.model.row_of(uid) if uid else None
+        if row is None:
             self.lst.clearSelection()
             return
-        items = self.lst.findItems(uid, Qt.MatchFlag.MatchStartsWith)
-        if items:
-            self.lst.setCurrentItem(items[0])
-        else:
-            self.lst.clearSelection()
+        self.lst.setCurrentIndex(self.model.index(row))
 
-    def update_stats(self, score, stats, info, aircrafts):
+    def update_stats(self, score, stats, info, aircrafts, conflicts=frozenset()):
         self.lbl_lvl.setText(str(info["current"]))
         self.lbl_tmr.setText(f"{info['next']}s" if info['next'] > 0 else "---")
         rem = info["total"] - info["spawned"]
@@ -152,25 +153,6 @@ class StatusPanel(QWidget):
         self.lbl_s_land.setText(str(stats["landed"]))
         self.lbl_s_crash.setText(str(stats["crashed"]))
 
-        # Mise à jour liste
-        current_sel = self.lst.currentItem().text().split(' ')[0] if self.lst.currentItem() else None
-        self.lst.clear()
-
-        for ac in aircrafts:
-            st = {"OUT_OF_BOUNDS": "SORTI", "CRASHED": "CRASH", "LANDED": "SOL", "LANDING": "APP",
-                  "HOLDING": "HOLD"}.get(ac.state, "")
-            evt = "[PANNE]" if ac.event == "MAYDAY" else ("[URG]" if ac.event == "URGENCY" else "")
-
-            item_txt = f"{ac.id} | V:{int(ac.speed)} A:{int(ac.altitude)} F:{int(ac.fuel)}% {st} {evt}"
-            it = QListWidgetItem(item_txt)
-
-            if ac.state == "CRASHED":
-                it.setForeground(QColor(ACCENT_RED))
-            elif ac.event == "MAYDAY":
-                it.setForeground(QColor(ACCENT_ORANGE))
-            elif ac.state == "HOLDING":
-                it.setForeground(QColor(ACCENT_PURPLE))
-
-            self.lst.addItem(it)
-            if current_sel and ac.id == current_sel:
-                self.lst.setCurrentItem(it)
\ No newline at end of file
+        # Mise à jour liste : seules les lignes modifiées sont redessinées,
+        # la sélection et le défilement sont conservés
+        self.model.refresh(aircrafts, conflicts)
\ No newline at end of file
@@ -1,9 +1,19 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPixmap
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QFontMetrics, QPixmap, QRegion, QStaticText
+from PySide6.QtCore import Qt, Signal, QPointF, QRect
 import math
 import time
 from src.settings import BG_DARK, MODEL_CENTER
+from src.model.aircraft.states import CRASHED, OUT_OF_BOUNDS, MAYDAY, URGENCY
+from src.model.spatial import AircraftIndex
+from src.view.sprites import SpriteAtlas
+
+# Zone d'un bloc d'étiquettes (px écran) relative à la position de l'avion : textes de y=-35 à y=25, x=25
+LABEL_BOX = (22, -50, 120, 82)
+HUD_RECT = QRect(0, 0, 310, 220)
+PICK_RADIUS = 60  # rayon de sélection au clic (unités du modèle)
+# Au-delà, une seule mise à jour complète coûte moins cher qu'une région trop morcelée
+MAX_DIRTY_ITEMS = 150
 
 
 class RadarWidget(QWidget):
@@ -13,8 +23,15 @@ class RadarWidget(QWidget):
         super().__init__()
         self.setStyleSheet(f"background-color: #1e1e1e;")
         self.aircrafts = []
+        self.index = AircraftIndex(self.aircrafts)  # requêtes de position (clic)
         self.landing_zone = (0, 0, 0, 0)
         self.selected_id = None
+        # Interpolation entre l'état précédent et l'état courant de la simulation
+        self.prev_positions = {}
+        self.alpha = 1.0
+        # Conflits prévus : [(id_a, id_b, t_cpa, d_cpa)] (voir src/model/conflicts.py)
+        self.conflicts = []
+        self.conflict_ids = frozenset()
 
         self.img_runway = QPixmap("assets/runway.png")
         self.plane_images = {
@@ -23,27 +40,155 @@ class RadarWidget(QWidget):
             "FIGHTER": QPixmap("assets/plane_mil.png")
         }
         self.default_plane = QPixmap("assets/plane.png")
-
-    def update_data(self, aircrafts, landing_zone):
+        # Avions pré-tournés tous les 2° (reconstruits quand le zoom change)
+        self.sprites = SpriteAtlas(self.plane_images, self.default_plane)
+
+        # Cache du fond statique (voir _get_background)
+        self._background = None
+        self._background_key = None
+
+        # Profileur fourni par le contrôleur : surimpression des temps quand il est actif
+        self.profiler = None
+
+        # Rectangles écran et aspect de chaque élément au dernier rafraîchissement (voir _repaint_changes)
+        self._items = None
+
+        # Polices partagées et blocs d'étiquettes déjà mis en page (voir _label_block)
+        self.font_label = QFont("Consolas", 9, QFont.Bold)
+        self.font_small = QFont("Consolas", 8)
+        self._label_ascent = QFontMetrics(self.font_label).ascent()
+        self._labels = {}  # id -> (clé, [(couleur, dx, dy, QStaticText)])
+
+    def update_data(self, aircrafts, landing_zone, prev_positions=None, alpha=1.0, conflicts=(), index=None):
+        if index is None and aircrafts is not self.aircrafts:
+            index = AircraftIndex(aircrafts)
+        if index is not None:
+            self.index = index
         self.aircrafts = aircrafts
         self.landing_zone = landing_zone
-        self.update()
+        self.prev_positions = prev_positions or {}
+        self.alpha = alpha
+        if conflicts is not self.conflicts:
+            self.conflicts = conflicts
+            self.conflict_ids = frozenset(c[0] for c in conflicts) | frozenset(c[1] for c in conflicts)
+        if len(self._labels) > len(aircrafts):
+            ids = {ac.id for ac in aircrafts}
+            self._labels = {k: v for k, v in self._labels.items() if k in ids}
+        if self._background_key is not None and tuple(landing_zone) != self._background_key[3]:
+            self._items = None  # la piste a changé : tout le fond est à refaire
+        self._repaint_changes()
+
+    def _item_bounds(self):
+        """
+        {clé: (rectangle écran, aspect)} de chaque avion (sprite, anneau, vecteur cap, étiquettes)
+        et de chaque segment de conflit. L'aspect résume tout ce qui change le dessin.
+        """
+        CX, CY, R, SCALE = self._geometry()
+        half = math.ceil(45 * SCALE * math.sqrt(2) / 2) + 2
+        sel_half = max(half, math.ceil(80 * SCALE) + 3)  # vecteur cap de 80 unités autour de l'avion choisi
+        lx, ly, lw, lh = LABEL_BOX
+        blink = int(time.time() * 5) % 2 == 0
+        items = {}
+        screen = {}
+        for ac in self.aircrafts:
+            x, y, heading = self._interpolated(ac)
+            fx, fy = CX + (x - MODEL_CENTER) * SCALE, CY + (y - MODEL_CENTER) * SCALE
+            sx, sy = int(fx), int(fy)
+            screen[ac.id] = (fx, fy)
+            is_sel = ac.id == self.selected_id
+            r = sel_half if is_sel else half
+            rect = QRect(sx - r, sy - r, 2 * r, 2 * r).united(QRect(sx + lx, sy + ly, lw, lh))
+            look = (fx, fy, round(heading / 2) % 180, ac.state, ac.event, is_sel, ac.id in self.conflict_ids,
+                    int(ac.altitude), int(ac.speed), int(ac.heading) if is_sel else 0,
+                    blink if ac.event else False)
+            items[ac.id] = (rect, look)
+        for a, b, t, d in self.conflicts:
+            if a not in screen or b not in screen: continue
+            (xa, ya), (xb, yb) = screen[a], screen[b]
+            rect = QRect(int(min(xa, xb)) - 3, int(min(ya, yb)) - 3, int(abs(xa - xb)) + 7, int(abs(ya - yb)) + 7)
+            mx, my = int((xa + xb) / 2), int((ya + yb) / 2)
+            rect = rect.united(QRect(mx, my - 18, 44, 20))
+            items[("conflict", a, b)] = (rect, (xa, ya, xb, yb, f"{t:.0f}", t < 5))
+        return items
+
+    def _repaint_changes(self):
+        """
+        Ne redessine que la réunion des anciennes et nouvelles zones des éléments qui ont changé
+        (update(QRegion)). Mise à jour complète au redimensionnement, au changement de piste
+        ou quand il y a trop d'éléments pour que le découpage soit rentable.
+        """
+        items = self._item_bounds()
+        old, self._items = self._items, items
+        if old is None or len(items) + len(old) > MAX_DIRTY_ITEMS:
+            self.update()
+            return
+        region = QRegion()
+        for key, (rect, look) in items.items():
+            prev = old.get(key)
+            if prev is None:
+                region += rect
+            elif prev[1] != look:
+                region += rect
+                region += prev[0]
+        for key, (rect, _) in old.items():
+            if key not in items:
+                region += rect
+        if self.profiler is not None and self.profiler.enabled:
+            region += HUD_RECT
+        if not region.isEmpty():
+            self.update(region)
+
+    def _interpolated(self, ac):
+        """Position et cap affichés : mélange de l'état précédent et de l'état courant."""
+        prev = self.prev_positions.get(ac.id)
+        if prev is None or self.alpha >= 1.0:
+            return ac.x, ac.y, ac.heading
+        a = self.alpha
+        px, py, ph = prev
+        dh = (ac.heading - ph + 180) % 360 - 180  # plus court chemin angulaire
+        return px + (ac.x - px) * a, py + (ac.y - py) * a, (ph + dh * a) % 360
 
     def set_selected(self, ac_id):
         self.selected_id = ac_id
-        self.update()
-
-    def paintEvent(self, event):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
-        p.setRenderHint(QPainter.SmoothPixmapTransform)
+        self._repaint_changes()
 
+    def _geometry(self):
+        """Centre, rayon et facteur d'échelle modèle -> écran."""
         W, H = self.width(), self.height()
         CX, CY = W / 2, H / 2
         R = min(W, H) / 2 - 35
 
         SCALE = R / 520.0
         if SCALE <= 0: SCALE = 0.01
+        return CX, CY, R, SCALE
+
+    def _get_background(self):
+        """
+        Fond statique (cercles, rose des vents, piste) rendu une seule fois dans un QPixmap.
+        Il n'est redessiné que si la taille, la densité de pixels ou la piste changent.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr, tuple(self.landing_zone))
+        if self._background is None or self._background_key != key:
+            pix = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.transparent)
+            p = QPainter(pix)
+            self._paint_background(p)
+            p.end()
+            self._background = pix
+            self._background_key = key
+        return self._background
+
+    def resizeEvent(self, event):
+        self._background = None
+        self._items = None
+        super().resizeEvent(event)
+
+    def _paint_background(self, p):
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setRenderHint(QPainter.SmoothPixmapTransform)
+        CX, CY, R, SCALE = self._geometry()
 
         # --- 1. RADAR (Fond) ---
         p.setPen(QPen(QColor(50, 50, 50), 2))
@@ -81,15 +226,11 @@ class RadarWidget(QWidget):
                 p.drawLine(int(CX + (R - 3) * math.cos(rad)), int(CY + (R - 3) * math.sin(rad)), int(x_edge),
                            int(y_edge))
 
-        # --- 3. MONDE VIRTUEL ---
-        p.save()  # SAUVEGARDE DE L'ÉTAT INITIAL (ÉCRAN)
-
-        # Application du Zoom et du Centrage
+        # --- 3. PISTE (dans le repère du monde virtuel) ---
         p.translate(CX, CY)
         p.scale(SCALE, SCALE)
         p.translate(-MODEL_CENTER, -MODEL_CENTER)
 
-        # Dessin Piste
         lx, ly, lw, lh = self.landing_zone
         if not self.img_runway.isNull():
             p.drawPixmap(int(lx), int(ly), int(lw), int(lh), self.img_runway)
@@ -97,42 +238,104 @@ class RadarWidget(QWidget):
             p.setBrush(QColor(80, 80, 80))
             p.drawRect(lx, ly, lw, lh)
 
+    def paintEvent(self, event):
+        p = QPainter(self)
+        # Couches statiques : simple copie du cache
+        p.drawPixmap(0, 0, self._get_background())
+
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setRenderHint(QPainter.SmoothPixmapTransform)
+        CX, CY, R, SCALE = self._geometry()
+
+        # --- MONDE VIRTUEL ---
+        p.save()  # SAUVEGARDE DE L'ÉTAT INITIAL (ÉCRAN)
+
+        # Application du Zoom et du Centrage
+        p.translate(CX, CY)
+        p.scale(SCALE, SCALE)
+        p.translate(-MODEL_CENTER, -MODEL_CENTER)
+
         # Dessin Avions
+        self.sprites.set_scale(SCALE, self.devicePixelRatioF())
         blink = int(time.time() * 5) % 2 == 0
+        if self.conflicts:
+            self._draw_conflicts(p, SCALE)
+        # Seuls les avions qui touchent la zone à redessiner sont tracés
+        region = event.region()
+        items = self._items or {}
         for ac in self.aircrafts:
+            item = items.get(ac.id)
+            if item is not None and not region.intersects(item[0]): continue
             self._draw_aircraft(p, ac, blink, SCALE)
 
         p.restore()  # RESTAURATION DE L'ÉTAT INITIAL (FIN DU ZOOM)
 
+        if self.profiler is not None and self.profiler.enabled:
+            self._paint_hud(p)
+
+    def _paint_hud(self, p):
+        """Temps glissants par section (ms), en haut à gauche du radar."""
+        rows = self.profiler.summary()
+        p.setFont(self.font_small)
+        line = 13
+        p.setPen(Qt.NoPen)
+        p.setBrush(QColor(0, 0, 0, 170))
+        p.drawRect(5, 5, 300, line * (len(rows) + 1) + 8)
+        p.setPen(QColor(0, 255, 0))
+        p.drawText(10, 5 + line, f"{'section':<16}{'p50':>7}{'p95':>7}{'max':>7}")
+        for i, (name, p50, p95, peak) in enumerate(rows, 2):
+            p.setPen(QColor(255, 140, 0) if p95 > 16 else QColor(200, 200, 200))
+            p.drawText(10, 5 + line * i, f"{name:<16}{p50:7.2f}{p95:7.2f}{peak:7.2f}")
+
+    def _draw_conflicts(self, p, global_scale):
+        """Segment pointillé entre les avions d'une paire en conflit, avec le délai avant le CPA."""
+        positions = {ac.id: self._interpolated(ac) for ac in self.aircrafts if ac.id in self.conflict_ids}
+        p.setFont(self.font_small)
+        for a, b, t, d in self.conflicts:
+            if a not in positions or b not in positions: continue
+            (xa, ya, _), (xb, yb, _) = positions[a], positions[b]
+            urgent = t < 5
+            p.setPen(QPen(QColor(255, 60, 60) if urgent else QColor(255, 200, 0), 1.5 / global_scale, Qt.DashLine))
+            p.drawLine(QPointF(xa, ya), QPointF(xb, yb))
+            p.save()
+            p.translate((xa + xb) / 2, (ya + yb) / 2)
+            p.scale(1 / global_scale, 1 / global_scale)
+            p.drawText(4, -4, f"{t:.0f}s")
+            p.restore()
+
     def _draw_aircraft(self, p, ac, blink, global_scale):
         is_sel = (ac.id == self.selected_id)
 
         color = QColor(0, 255, 255)
-        if ac.state == "CRASHED":
+        if ac.state == CRASHED:
             color = QColor(255, 0, 0)
-        elif ac.state == "OUT_OF_BOUNDS":
+        elif ac.state == OUT_OF_BOUNDS:
             color = QColor(80, 80, 80)
-        elif ac.event == "MAYDAY":
+        elif ac.event == MAYDAY:
             color = QColor(255, 0, 0) if blink else QColor(255, 255, 0)
-        elif ac.event == "URGENCY":
+        elif ac.event == URGENCY:
             color = QColor(255, 140, 0) if blink else QColor(255, 255, 0)
         elif is_sel:
             color = QColor(255, 255, 0)
 
-        # 1. On se déplace à la position de l'avion
-        p.save()
-        p.translate(ac.x, ac.y)
-
-        # 2. Rotation pour l'image de l'avion
-        p.save()
-        p.rotate(ac.heading)
+        x, y, heading = self._interpolated(ac)
 
+        # 1. Image de l'avion : sprite déjà orienté, copié tel quel dans le repère écran
         sz = 45
-        img = self.plane_images.get(ac.type_label, self.default_plane)
+        pos = p.transform().map(QPointF(x, y))
+        sprite = self.sprites.get(ac.type_label, heading)
+        if sprite is not None:
+            side = sprite.width() / sprite.devicePixelRatio()
+            p.save()
+            p.resetTransform()
+            p.drawPixmap(QPointF(pos.x() - side / 2, pos.y() - side / 2), sprite)
+            p.restore()
+
+        # 2. On se déplace à la position de l'avion
+        p.save()
+        p.translate(x, y)
 
-        if img and not img.isNull():
-            p.drawPixmap(-sz // 2, -sz // 2, sz, sz, img)
-        else:
+        if sprite is None:
             p.setBrush(color)
             p.drawEllipse(-10, -10, 20, 20)
 
@@ -140,55 +343,75 @@ class RadarWidget(QWidget):
             p.setPen(QPen(color, 2, Qt.DashLine))
             p.setBrush(Qt.NoBrush)
             p.drawEllipse(-sz // 2 - 5, -sz // 2 - 5, sz + 10, sz + 10)
-
-        p.restore()  # Fin de la rotation
+        elif ac.id in self.conflict_ids:
+            p.setPen(QPen(QColor(255, 200, 0), 2))
+            p.setBrush(Qt.NoBrush)
+            p.drawEllipse(-sz // 2, -sz // 2, sz, sz)
 
         # 3. Vecteur CAP (Indépendant de la rotation de l'image)
         if is_sel:
             p.setPen(QPen(color, 2))
-            rad = math.radians(ac.heading - 90)
+            rad = math.radians(heading - 90)
             p.drawLine(0, 0, int(80 * math.cos(rad)), int(80 * math.sin(rad)))
 
-        # 4. Textes (On annule le zoom global pour que le texte reste lisible)
-        p.scale(1 / global_scale, 1 / global_scale)
-        p.setFont(QFont("Consolas", 9, QFont.Bold))
-
-        if ac.event == "MAYDAY":
-            p.setPen(QColor(255, 0, 0)); p.drawText(25, -35, "⚠️ PANNE")
-        elif ac.event == "URGENCY":
-            p.setPen(QColor(255, 0, 255)); p.drawText(25, -35, "✚ URGENCE")
-
-        p.setPen(Qt.white);
-        p.drawText(25, -20, ac.id)
-        p.setPen(QColor(255, 100, 100) if ac.altitude < 500 else QColor(200, 200, 200))
-        p.drawText(25, -5, f"A:{int(ac.altitude)}")
-        p.setPen(QColor(200, 200, 200))
-        p.drawText(25, 10, f"V:{int(ac.speed)}")
-        if is_sel: p.setPen(Qt.yellow); p.drawText(25, 25, f"C:{int(ac.heading)}°")
-
         # C'ÉTAIT ICI L'ERREUR : Il y avait deux p.restore() !
         p.restore()  # Fin de la translation (Retour à l'origine du monde virtuel)
 
+        # 4. Textes : bloc déjà mis en page, posé en repère écran pour rester lisible quel que soit le zoom
+        p.save()
+        p.resetTransform()
+        p.setFont(self.font_label)
+        px, py = pos.x(), pos.y()
+        for pen, dx, dy, text in self._label_block(ac, is_sel):
+            p.setPen(pen)
+            p.drawStaticText(QPointF(px + dx, py + dy), text)
+        p.restore()
+
+    def _label_block(self, ac, is_sel):
+        """
+        Lignes d'étiquette de l'avion : (couleur, décalage écran, QStaticText).
+        La mise en page n'est refaite que si l'incident ou les valeurs arrondies changent ;
+        les lignes dont le texte n'a pas bougé (l'identifiant, typiquement) sont reprises telles quelles.
+        """
+        key = (ac.event, int(ac.altitude), int(ac.speed), int(ac.heading) if is_sel else None)
+        entry = self._labels.get(ac.id)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        lines = []
+        if ac.event == MAYDAY:
+            lines.append((QColor(255, 0, 0), -35, "⚠️ PANNE"))
+        elif ac.event == URGENCY:
+            lines.append((QColor(255, 0, 255), -35, "✚ URGENCE"))
+        lines.append((QColor(Qt.white), -20, ac.id))
+        lines.append((QColor(255, 100, 100) if ac.altitude < 500 else QColor(200, 200, 200), -5, f"A:{int(ac.altitude)}"))
+        lines.append((QColor(200, 200, 200), 10, f"V:{int(ac.speed)}"))
+        if is_sel:
+            lines.append((QColor(Qt.yellow), 25, f"C:{int(ac.heading)}°"))
+
+        reuse = {line[3].text(): line[3] for line in entry[1]} if entry is not None else {}
+        block = []
+        for pen, baseline, s in lines:
+            text = reuse.get(s)
+            if text is None:
+                text = QStaticText(s)
+                text.prepare(font=self.font_label)
+            # drawStaticText place le coin haut-gauche, drawText la ligne de base
+            block.append((pen, 25, baseline - self._label_ascent, text))
+        self._labels[ac.id] = (key, block)
+        return block
+
     def mousePressEvent(self, event):
-        W, H = self.width(), self.height()
-        CX, CY = W / 2, H / 2
-        R = min(W, H) / 2 - 35
-        SCALE = R / 520.0
-        if SCALE <= 0: SCALE = 0.01
+        CX, CY, R, SCALE = self._geometry()
 
         mx = (event.position().x() - CX) / SCALE + MODEL_CENTER
         my = (event.position().y() - CY) / SCALE + MODEL_CENTER
 
-        clicked = False
-        for ac in self.aircrafts:
-            if abs(ac.x - mx) < 60 and abs(ac.y - my) < 60:
-                self.selected_id = ac.id
-                self.aircraft_clicked.emit(ac.id)
-                self.update()
-                clicked = True
-                break
-
-        if not clicked:
+        ac = self.index.nearest(mx, my, PICK_RADIUS)
+        if ac is not None:
+            self.selected_id = ac.id
+            self.aircraft_clicked.emit(ac.id)
+        else:
             self.selected_id = None
             self.aircraft_clicked.emit("")
-            self.update()
\ No newline at end of file
+        self._repaint_changes()
\ No newline at end of file
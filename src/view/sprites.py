@@ -0,0 +1,56 @@
+from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtCore import Qt, QRectF
+import math
+
+
+class SpriteAtlas:
+    """
+    Images d'avions pré-tournées tous les `step` degrés, à l'échelle d'affichage courante.
+    Chaque image est calculée à la première demande puis simplement copiée à l'écran.
+    Mémoire bornée : au plus (nb de types + 1) x 360 / step images, vidées à chaque changement de zoom.
+    """
+
+    def __init__(self, images, default, size=45, step=2):
+        self.images = images
+        self.default = default
+        self.size = size
+        self.step = step
+        self.scale = None
+        self.dpr = None
+        self.cache = {}
+
+    def set_scale(self, scale, dpr):
+        if scale != self.scale or dpr != self.dpr:
+            self.scale = scale
+            self.dpr = dpr
+            self.cache.clear()
+
+    def get(self, type_label, heading):
+        """Renvoie le sprite le plus proche du cap demandé (None si l'image est absente)."""
+        label = type_label if type_label in self.images else None
+        idx = int(round(heading / self.step)) % int(360 / self.step)
+        key = (label, idx)
+        sprite = self.cache.get(key, False)
+        if sprite is False:
+            sprite = self.cache[key] = self._render(self.images.get(label, self.default), idx * self.step)
+        return sprite
+
+    def _render(self, img, angle):
+        if not img or img.isNull():
+            return None
+        # Côté = diagonale de l'image à l'échelle, pour que la rotation ne soit jamais rognée
+        s = self.size * self.scale
+        side = math.ceil(s * math.sqrt(2)) + 2
+        pix = QPixmap(math.ceil(side * self.dpr), math.ceil(side * self.dpr))
+        pix.setDevicePixelRatio(self.dpr)
+        pix.fill(Qt.transparent)
+
+        p = QPainter(pix)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setRenderHint(QPainter.SmoothPixmapTransform)
+        p.translate(side / 2, side / 2)
+        p.rotate(angle)
+        half = (self.size // 2) * self.scale
+        p.drawPixmap(QRectF(-half, -half, s, s), img, QRectF(img.rect()))
+        p.end()
+        return pix
@@ -0,0 +1,184 @@
+"""
+Balayage Monte-Carlo des paramètres de niveau (LEVELS), joué par le pilote automatique.
+
+Chaque combinaison (niveau, total, cadence) est jouée sur N graines, en parallèle sur
+tous les cœurs. Chaque partie est écrite dès qu'elle se termine (JSON Lines) et seuls des
+agrégats de taille fixe restent en mémoire : un balayage de 100 000 parties coûte
+autant de mémoire qu'un balayage de 100.
+
+    python sweep.py --levels 1 2 --total 5 8 12 --rate 8 6 4 --seeds 500
+    python sweep.py --levels 3 --score-min 1500 2000 2500 --output sweep.jsonl
+
+Les seuils --score-min n'influent pas sur la partie : le taux de réussite de chaque
+seuil est calculé à partir des mêmes scores.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from src.settings import LEVELS, SIM_DT
+from src.model.simulation import SimulationModel
+from src.model.policies import AutopilotPolicy
+
+# Largeur des classes de l'histogramme des scores : tous les gains/pénalités sont des
+# multiples de 10, percentiles et taux de réussite restent donc exacts
+SCORE_BIN = 10
+
+
+def play_level(level, total, rate, seed, backend="python", max_ticks=200000):
+    """Joue un seul niveau avec ces paramètres ; renvoie le bilan de la partie."""
+    cfg = {"total": total, "rate": rate, "score_min": 0}
+    levels = dict(LEVELS)
+    levels[level] = cfg
+    # La prédiction de conflits ne sert qu'à l'affichage : inutile ici
+    model = SimulationModel(1000, 1000, backend=backend, seed=seed, levels=levels, predict_conflicts=False)
+    model.reset_game(level)
+    policy = AutopilotPolicy()
+
+    ticks = 0
+    while model.planes_spawned < total or model.aircrafts:
+        if ticks >= max_ticks: break
+        for ac_id, cmd_type, value in policy(model, ticks):
+            model.apply_command(ac_id, cmd_type, value)
+        model.update(SIM_DT)
+        ticks += 1
+    return {"level": level, "total": total, "rate": rate, "seed": seed, "ticks": ticks,
+            "score": model.score, **model.stats}
+
+
+def play_batch(point, seeds, backend):
+    """Tâche d'un processus : plusieurs graines d'un même point (moins d'allers-retours)."""
+    level, total, rate = point
+    return [play_level(level, total, rate, seed, backend) for seed in seeds]
+
+
+class Aggregate:
+    """Agrégats d'un point de la grille : compteurs et histogramme des scores (taille fixe)."""
+
+    def __init__(self):
+        self.sessions = 0
+        self.spawned = 0
+        self.landed = self.crashed = self.out = 0
+        self.score_sum = 0
+        self.histogram = {}  # classe de score -> nombre de parties
+
+    def add(self, r):
+        self.sessions += 1
+        self.spawned += r["total"]
+        self.landed += r["landed"]
+        self.crashed += r["crashed"]
+        self.out += r["out"]
+        self.score_sum += r["score"]
+        b = r["score"] // SCORE_BIN
+        self.histogram[b] = self.histogram.get(b, 0) + 1
+
+    def percentile(self, q):
+        """Score au quantile q (borne basse de sa classe)."""
+        rank = q * (self.sessions - 1)
+        seen = 0
+        for b in sorted(self.histogram):
+            seen += self.histogram[b]
+            if seen > rank: return b * SCORE_BIN
+        return None
+
+    def pass_rate(self, score_min):
+        ok = sum(n for b, n in self.histogram.items() if b * SCORE_BIN >= score_min)
+        return ok / self.sessions if self.sessions else 0.0
+
+    def summary(self, score_mins):
+        n = max(1, self.spawned)
+        return {
+            "sessions": self.sessions,
+            "landed_rate": round(self.landed / n, 4),
+            "crash_rate": round(self.crashed / n, 4),
+            "out_rate": round(self.out / n, 4),
+            "score_mean": round(self.score_sum / max(1, self.sessions), 1),
+            "score_p10": self.percentile(0.10),
+            "score_p50": self.percentile(0.50),
+            "score_p90": self.percentile(0.90),
+            "pass_rate": {str(s): round(self.pass_rate(s), 4) for s in score_mins},
+        }
+
+
+def tasks(points, n_seeds, first_seed, batch):
+    for point in points:
+        for start in range(0, n_seeds, batch):
+            yield point, list(range(first_seed + start, first_seed + min(n_seeds, start + batch)))
+
+
+def run_sweep(points, n_seeds, output, first_seed=0, batch=20, workers=None, backend="python"):
+    aggregates = {p: Aggregate() for p in points}
+    todo = tasks(points, n_seeds, first_seed, batch)
+    workers = workers or os.cpu_count() or 1
+    done_sessions = 0
+    total_sessions = len(points) * n_seeds
+    start = time.perf_counter()
+
+    with open(output, "w") as out, ProcessPoolExecutor(workers) as pool:
+        pending = set()
+        while True:
+            # Au plus 2 tâches en attente par processus : la file ne grossit pas avec le balayage
+            while len(pending) < 2 * workers:
+                task = next(todo, None)
+                if task is None: break
+                pending.add(pool.submit(play_batch, *task, backend))
+            if not pending: break
+
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                for r in fut.result():
+                    out.write(json.dumps(r, separators=(",", ":")) + "\n")
+                    aggregates[(r["level"], r["total"], r["rate"])].add(r)
+                    done_sessions += 1
+            out.flush()
+            elapsed = time.perf_counter() - start
+            print(f"\r  {done_sessions}/{total_sessions} parties ({done_sessions / elapsed:.0f}/s)",
+                  end="", file=sys.stderr)
+    print(file=sys.stderr)
+    return aggregates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Balayage Monte-Carlo des paramètres de niveau")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1], help="niveaux (influe sur la fréquence des pannes)")
+    parser.add_argument("--total", type=int, nargs="+", default=None, help="nombres d'avions (défaut : valeur de LEVELS)")
+    parser.add_argument("--rate", type=float, nargs="+", default=None, help="cadences d'apparition en s (défaut : LEVELS)")
+    parser.add_argument("--score-min", type=int, nargs="+", default=None, help="seuils de réussite évalués (défaut : LEVELS)")
+    parser.add_argument("--seeds", type=int, default=200, help="parties par point de la grille")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--batch", type=int, default=20, help="parties par tâche envoyée à un processus")
+    parser.add_argument("--workers", type=int, default=None, help="processus (défaut : tous les cœurs)")
+    parser.add_argument("--backend", choices=["python", "numpy"], default="python")
+    parser.add_argument("--output", default="sweep.jsonl", help="résultats partie par partie (JSON Lines)")
+    parser.add_argument("--summary", metavar="FICHIER", help="agrégats au format JSON")
+    args = parser.parse_args(argv)
+
+    points = []
+    for level in args.levels:
+        cfg = LEVELS[min(level, max(LEVELS))]
+        for total, rate in itertools.product(args.total or [cfg["total"]], args.rate or [cfg["rate"]]):
+            points.append((level, total, rate))
+    score_mins = args.score_min or sorted({LEVELS[min(l, max(LEVELS))]["score_min"] for l in args.levels})
+
+    aggregates = run_sweep(points, args.seeds, args.output, args.first_seed, args.batch, args.workers, args.backend)
+
+    report = []
+    print(f"{'niv':>3} {'total':>5} {'cadence':>7} {'posés':>6} {'crash':>6} {'sortis':>6} {'p10':>6} {'p50':>6} {'p90':>6}  réussite")
+    for (level, total, rate), agg in aggregates.items():
+        s = agg.summary(score_mins)
+        report.append({"level": level, "total": total, "rate": rate, **s})
+        passes = " ".join(f"{k}:{v:.0%}" for k, v in s["pass_rate"].items())
+        print(f"{level:>3} {total:>5} {rate:>7} {s['landed_rate']:>6.1%} {s['crash_rate']:>6.1%} {s['out_rate']:>6.1%} "
+              f"{s['score_p10']:>6} {s['score_p50']:>6} {s['score_p90']:>6}  {passes}")
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.settings import SIM_DT
+from src.model.simulation import SimulationModel
+
+COMMANDS = ("HEADING", "ALTITUDE", "SPEED", "HOLD", "LAND")
+
+
+def _state(model):
+    return (model.tick, model.score, dict(model.stats), model.current_level, model.level_complete, model.game_over,
+            [(ac.id, ac.type_label, ac.state, ac.event) for ac in model.aircrafts])
+
+
+def _values(model):
+    return [v for ac in model.aircrafts for v in (ac.x, ac.y, ac.heading, ac.altitude, ac.speed, ac.fuel)]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_numpy_fleet_matches_python(seed):
+    models = [SimulationModel(1000, 1000, backend=backend, seed=seed) for backend in ("python", "numpy")]
+    orders = random.Random(seed + 1)
+    for model in models:
+        model.reset_game(1 + seed % 5)
+    for _ in range(3000):
+        if models[0].game_over: break
+        for model in models:
+            if model.level_complete: model.start_next_level()
+            model.update(SIM_DT)
+        python, vector = models
+        if python.aircrafts and orders.random() < 0.05:
+            # Mêmes ordres au même tick pour les deux moteurs
+            ac_id = orders.choice(python.aircrafts).id
+            cmd = orders.choice(COMMANDS)
+            value = orders.randint(0, 359) if cmd == "HEADING" else orders.choice((-500, 500, 50, -50))
+            assert python.apply_command(ac_id, cmd, value) == vector.apply_command(ac_id, cmd, value)
+        assert _state(vector) == _state(python)
+        assert _values(vector) == pytest.approx(_values(python), abs=1e-6)
+    assert python.stats["landed"] + python.stats["crashed"] + python.stats["out"] > 0
@@ -0,0 +1,68 @@
+import math
+import random
+
+import pytest
+
+from src.settings import SIM_DT
+from src.model.simulation import SimulationModel, COLLISION_DIST, COLLISION_ALT
+from src.model.aircraft import CommercialAircraft, PrivateJet, FighterJet
+from src.model.aircraft.states import AIRBORNE, HOLDING, LANDING, CRASHED
+
+KINDS = (CommercialAircraft, PrivateJet, FighterJet)
+
+
+def _pairwise(model):
+    """Référence : toutes les paires (i < j) dans l'ordre de la liste, comme avant la grille."""
+    acs = model.aircrafts
+    for i, a1 in enumerate(acs):
+        for a2 in acs[i + 1:]:
+            if a1.state in AIRBORNE and a2.state in AIRBORNE:
+                d = math.sqrt((a1.x - a2.x) ** 2 + (a1.y - a2.y) ** 2)
+                if d < COLLISION_DIST and abs(a1.altitude - a2.altitude) < COLLISION_ALT:
+                    a1.state = CRASHED
+                    a2.state = CRASHED
+
+
+def _fleet(seed, backend):
+    rng = random.Random(seed)
+    model = SimulationModel(1000, 1000, backend=backend, seed=seed)
+    model.reset_game()
+    model.scheduler.clear()  # pas d'apparitions : seulement les avions ci-dessous
+    for i in range(250):
+        # Trafic dense (250 avions sur 600 px, 1000 ft) : beaucoup de paires à la limite des cases
+        x, y = rng.uniform(200, 800), rng.uniform(200, 800)
+        ac = model.add_aircraft(rng.choice(KINDS)(f"T{i:03d}", x, y, rng.uniform(0, 360),
+                                                  rng.uniform(2000, 3000), rng))
+        ac.target_heading = rng.uniform(0, 360)
+        r = rng.random()
+        if r < 0.15: ac.state = HOLDING
+        elif r < 0.25: ac.state = LANDING
+    model.registry.sync(model.aircrafts)
+    return model
+
+
+def _table(model):
+    return [(ac.id, ac.state, ac.x, ac.y, ac.altitude) for ac in model.aircrafts]
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+@pytest.mark.parametrize("seed", range(3))
+def test_grid_matches_pairwise_check(seed, backend):
+    if backend == "numpy": pytest.importorskip("numpy")
+    grid, reference = _fleet(seed, backend), _fleet(seed, backend)
+    reference._check_collisions = lambda: _pairwise(reference)
+    rng = random.Random(seed)
+    crashed, crash_ticks = 0, 0
+    for _ in range(80):
+        # Changements de tranche d'altitude en cours de route
+        for ac in rng.sample(grid.aircrafts, 10):
+            delta = rng.choice((-150, -60, 60, 150))
+            grid.apply_command(ac.id, "ALTITUDE", delta)
+            reference.apply_command(ac.id, "ALTITUDE", delta)
+        grid.update(SIM_DT)
+        reference.update(SIM_DT)
+        assert _table(grid) == _table(reference)
+        now = sum(ac.state == CRASHED for ac in grid.aircrafts)
+        crash_ticks += now > crashed
+        crashed = now
+    assert crash_ticks > 10  # des collisions tout au long du parcours, pas seulement au départ
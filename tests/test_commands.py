@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from src.settings import SIM_DT
+from src.model.simulation import SimulationModel
+from src.model.aircraft.fighter import FighterJet
+from src.model.aircraft.states import LANDING, MAYDAY
+from src.net.commands import _parse, CommandServer, CommandClient, MAX_ALTITUDE_STEP, MAX_SPEED_STEP
+
+
+@pytest.mark.parametrize("cmd", [
+    ["AF1", "HEADING", 0], ["AF1", "HEADING", 359.5], ["AF1", "ALTITUDE", -500], ["AF1", "ALTITUDE", MAX_ALTITUDE_STEP],
+    ["AF1", "SPEED", 50], ["AF1", "SPEED", -MAX_SPEED_STEP], ["AF1", "HOLD", 0], ["AF1", "LAND"],
+])
+def test_accepts_panel_commands(cmd):
+    assert _parse(cmd) == (cmd[0], cmd[1], cmd[2] if len(cmd) == 3 else 0)
+
+
+@pytest.mark.parametrize("cmd", [
+    ["AF1", "HEADING", float("nan")], ["AF1", "HEADING", float("inf")], ["AF1", "HEADING", 360], ["AF1", "HEADING", -1],
+    ["AF1", "ALTITUDE", 1e300], ["AF1", "ALTITUDE", 10 ** 400], ["AF1", "ALTITUDE", float("-inf")],
+    ["AF1", "SPEED", MAX_SPEED_STEP + 1], ["AF1", "SPEED", float("nan")], ["AF1", "HOLD", 1], ["AF1", "LAND", float("nan")],
+    ["AF1", "HEADING", True], ["AF1", "HEADING", "90"], ["AF1", "FLY", 0], [1, "HOLD", 0], ["AF1"], "AF1 HOLD",
+])
+def test_rejects_malformed_or_out_of_range(cmd):
+    assert _parse(cmd) is None
+
+
+# --- Bouclage local : CommandServer + CommandClient ---
+
+def _model():
+    model = SimulationModel(1000, 1000, seed=0)
+    model.reset_game()
+    model.scheduler.clear()
+    model.add_aircraft(FighterJet("MIL001", 500, 500, 0, 5000))
+    model.add_aircraft(FighterJet("MIL002", 300, 300, 90, 5000)).event = MAYDAY
+    return model
+
+
+async def _until(cond, timeout=5.0):
+    loop = asyncio.get_running_loop()
+    end = loop.time() + timeout
+    while not cond():
+        assert loop.time() < end, "délai dépassé"
+        await asyncio.sleep(0.005)
+
+
+def _loopback(test, **kw):
+    server = CommandServer(**kw)
+    host, port = server.start()
+
+    async def main():
+        client = await CommandClient.connect(host, port)
+        try:
+            await test(server, client)
+        finally:
+            await client.close()
+
+    try:
+        asyncio.run(main())
+    finally:
+        server.close()
+
+
+def test_batches_apply_at_one_tick_boundary_in_order():
+    model = _model()
+
+    async def test(server, client):
+        await client.send([("MIL001", "HEADING", 90), ("MIL001", "ALTITUDE", -500), ("MIL001", "SPEED", 50)])
+        await client.send([("MIL002", "ALTITUDE", 500), ("NOPE", "HOLD"), ("MIL001", "HEADING", float("nan"))])
+        await client.send([("MIL001", "LAND", 0)])
+        await _until(lambda: server.batches == 3)
+        ac = model.registry.get("MIL001")
+        assert (ac.target_heading, ac.altitude) == (0, 5000)  # rien avant la frontière de tick
+        model.update(SIM_DT)
+        assert server.apply_pending(model) == 3
+        assert (ac.target_heading, ac.altitude, ac.state) == (90, 4500, LANDING)
+        replies = [await client.read_reply() for _ in range(3)]
+        assert [r["seq"] for r in replies] == [1, 2, 3]
+        assert {r["tick"] for r in replies} == {model.tick}
+        assert [r["results"] for r in replies] == [["OK", "OK", "OK"], ["REFUSED", "UNKNOWN", "INVALID"], ["OK"]]
+
+    _loopback(test)
+
+
+def test_reading_stops_at_max_inflight():
+    model = _model()
+
+    async def test(server, client):
+        for _ in range(5):
+            await client.send([("MIL001", "HEADING", 10)])
+        await _until(lambda: server.batches == 2)
+        await asyncio.sleep(0.1)
+        assert server.batches == 2  # lots suivants laissés dans la socket
+        applied = 0
+
+        def drain():
+            nonlocal applied
+            assert server.batches - applied <= 2  # jamais plus de max_inflight lots en attente
+            applied += server.apply_pending(model)
+            return applied == 5
+
+        await _until(drain)
+        assert [(await client.read_reply())["seq"] for _ in range(5)] == [1, 2, 3, 4, 5]
+
+    _loopback(test, max_inflight=2)
@@ -0,0 +1,87 @@
+"""
+Multi-cadence (SimulationModel(multi_rate=True)) : un avion n'est intégré qu'une fois par fenêtre
+de LOD_PERIOD ticks s'il est en vol rectiligne (FLYING, cap atteint, sans incident) : sa trajectoire
+est une droite, un pas de LOD_PERIOD * dt donne la même position qu'autant de petits pas (aux arrondis
+près). Il faut en plus que rien ne puisse arriver pendant la fenêtre (_low_risk) :
+- la limite de 510 px ne peut pas être franchie (sortie détectée au même tick) ;
+- il est loin de la piste (zone des ordres d'atterrissage) ;
+- aucun avion en vol à moins de LOD_CLEARANCE px. À 85 px/s au plus chacun, positions des autres
+  lues avec deux fenêtres de retard, puis la fenêtre à venir pour les deux :
+  30 + 4 x 85 x 0.12 < 71 px, aucune collision ne peut donc être manquée.
+  Un avion qui apparaît (add_aircraft) repasse à pleine cadence ceux à moins de LOD_CLEARANCE px
+  et invalide les cases de trafic : la règle vaut aussi pour lui.
+Positions vues entre deux intégrations (collisions, conflits) : en retard d'au plus
+vitesse x (LOD_PERIOD - 1) x dt, soit 7.7 px à 85 px/s. Les instantanés d'affichage extrapolent
+ce retard (snapshot.py) ; ordres, pannes et panne sèche l'intègrent d'abord (_catch_up) et repassent
+l'avion à pleine cadence. Un contrôleur externe lit donc position() ou un instantané, pas ac.x / ac.y.
+Résultat, vérifié ici : mêmes états, score et tick de fin qu'à pleine cadence ; positions publiées
+à 1e-9 px près ; cap, altitude, vitesse et carburant aux arrondis près.
+"""
+import pytest
+
+from headless import run_session
+from src.settings import SIM_DT
+from src.model.simulation import SimulationModel
+from src.model.policies import AutopilotPolicy
+from src.model.snapshot import take_snapshot
+from src.model.aircraft.fighter import FighterJet
+from src.model.aircraft.states import CRASHED
+
+POSITION_BOUND = 1e-9  # px
+
+
+def _pair(seed, level):
+    models = [SimulationModel(1000, 1000, seed=seed, multi_rate=multi_rate) for multi_rate in (False, True)]
+    for model in models:
+        model.reset_game(level)
+    return models
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_snapshots_match_full_rate(seed):
+    full, multi = _pair(seed, 1 + seed % 5)
+    policies = AutopilotPolicy(), AutopilotPolicy()
+    lagging = 0
+    for tick in range(3000):
+        if full.game_over or full.level_complete: break
+        for model, policy in zip((full, multi), policies):
+            for order in policy(model, tick):
+                model.apply_command(*order)
+            model.update(SIM_DT)
+        lagging += len(multi.lod)
+        a, b = take_snapshot(full), take_snapshot(multi)
+        assert [(x.id, x.state, x.event) for x in a.aircrafts] == [(x.id, x.state, x.event) for x in b.aircrafts]
+        for x, y in zip(a.aircrafts, b.aircrafts):
+            assert abs(x.x - y.x) <= POSITION_BOUND and abs(x.y - y.y) <= POSITION_BOUND
+            assert abs((x.heading - y.heading + 180) % 360 - 180) <= 1e-9
+            assert x.target_heading == y.target_heading
+            for name in ("altitude", "speed", "fuel"):
+                assert getattr(x, name) == pytest.approx(getattr(y, name), abs=1e-9)
+        assert (a.score, a.stats) == (b.score, b.stats)
+    assert lagging > 0  # le mode multi-cadence a bien servi
+
+
+@pytest.mark.parametrize("seed", [0, 6])
+def test_sessions_end_identically(seed):
+    # Graine 6 : l'autopilote lisait des positions en retard et finissait un tick plus tôt
+    reports = [run_session(SimulationModel(1000, 1000, seed=seed, multi_rate=multi_rate), AutopilotPolicy(),
+                           max_ticks=30000) for multi_rate in (False, True)]
+    for report in reports:
+        del report["wall_time"], report["ticks_per_second"]
+    assert reports[0] == reports[1]
+
+
+def test_spawn_next_to_reduced_rate_aircraft():
+    full, multi = _pair(0, 1)
+    while not multi.lod:
+        for model in (full, multi):
+            model.update(SIM_DT)
+    uid = next(iter(multi.lod))
+    for model in (full, multi):
+        ac = model.registry.get(uid)
+        x, y = model.position(ac)
+        model.add_aircraft(FighterJet("MIL999", x + 5, y, ac.heading, ac.altitude))
+    assert uid not in multi.lod  # repassé à pleine cadence
+    for model in (full, multi):
+        model.update(SIM_DT)
+        assert model.registry.get(uid).state == CRASHED and model.registry.get("MIL999").state == CRASHED
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from src.settings import SIM_DT
+from src.model.simulation import SimulationModel
+from src.model.recorder import state_digest
+
+
+def _run(model, ticks):
+    for _ in range(ticks):
+        if model.level_complete: model.start_next_level()
+        model.update(SIM_DT)
+
+
+@pytest.mark.parametrize("backend, multi_rate", [("python", False), ("numpy", False), ("python", True)])
+def test_load_resumes_identically(backend, multi_rate):
+    if backend == "numpy": pytest.importorskip("numpy")
+    a = SimulationModel(1000, 1000, backend=backend, seed=3, multi_rate=multi_rate)
+    a.reset_game(2)
+    _run(a, 1500)
+    data = a.save_state()
+
+    b = SimulationModel(1000, 1000, backend=backend, seed=99, multi_rate=multi_rate)
+    b.reset_game(4)
+    _run(b, 100)
+    b.load_state(data)
+    assert b.save_state() == data
+
+    _run(a, 2000)
+    _run(b, 2000)
+    assert state_digest(b) == state_digest(a)
+
+
+@pytest.mark.parametrize("backend, multi_rate", [("python", False), ("numpy", False), ("python", True)])
+def test_corrupt_data_leaves_model_untouched(backend, multi_rate):
+    if backend == "numpy": pytest.importorskip("numpy")
+    source = SimulationModel(1000, 1000, backend=backend, seed=1, multi_rate=multi_rate)
+    source.reset_game(3)
+    _run(source, 1500)
+    data = source.save_state()
+    model = SimulationModel(1000, 1000, backend=backend, seed=2, multi_rate=multi_rate)
+    model.reset_game(2)
+    _run(model, 500)
+    before = model.save_state()
+
+    rng = random.Random(0)
+    rejected = 0
+    for _ in range(400):
+        corrupt = bytearray(data)
+        for _ in range(rng.randint(1, 3)):
+            corrupt[rng.randrange(len(corrupt))] = rng.randrange(256)
+        if rng.random() < 0.2:
+            corrupt = corrupt[:rng.randrange(len(corrupt))]
+        try:
+            model.load_state(bytes(corrupt))
+        except ValueError:
+            rejected += 1
+            assert model.save_state() == before
+        else:
+            model.load_state(before)
+    assert rejected > 0
@@ -0,0 +1,39 @@
+from src.settings import SIM_DT
+from src.model.simulation import SimulationModel
+from src.model.aircraft.fighter import FighterJet
+from src.model.aircraft.states import CRASHED
+
+
+def _model_with_fighter(fuel):
+    model = SimulationModel(1000, 1000, seed=0, predict_conflicts=False)
+    model.reset_game()
+    model.scheduler.clear()  # pas d'apparitions : un seul avion
+    ac = model.add_aircraft(FighterJet("MIL001", 500, 500, 0, 5000))
+    ac.fuel = fuel
+    model.fuel_watch.clear()
+    model._on_state(ac)  # échéance de panne sèche recalculée avec ce carburant
+    return model, ac
+
+
+def test_residual_fuel_does_not_hang():
+    # Reste d'arrondi infime au moment de l'échéance : la panne est reprogrammée au tick suivant
+    model, ac = _model_with_fighter(0.024 * 100 + 1e-13)
+    model.apply_command(ac.id, "HOLD", 0)
+    for _ in range(110):
+        model.update(SIM_DT)
+    assert ac.state == CRASHED
+
+
+def test_fuel_out_matches_per_tick_check():
+    # Même tick de crash que le test « carburant <= 0 » fait au début de chaque tick
+    model, ac = _model_with_fighter(1.0)
+    ticks = 0
+    fuel = 1.0
+    while fuel > 0:
+        fuel -= ac.consumption * SIM_DT
+        ticks += 1
+    for _ in range(ticks):
+        model.update(SIM_DT)
+    assert ac.state != CRASHED
+    model.update(SIM_DT)
+    assert ac.state == CRASHED
@@ -0,0 +1,98 @@
+import asyncio
+import struct
+
+from src.settings import SIM_DT
+from src.model.simulation import SimulationModel
+from src.model.snapshot import take_snapshot
+from src.net.telemetry import (TelemetryEncoder, TelemetryMirror, TelemetryServer, TelemetryClient, FRAME,
+                               KEYFRAME, DELTA, FIELDS, _Subscriber)
+
+_F32 = struct.Struct("<f")
+
+
+def _wire(v, fmt):
+    """Valeur telle que reçue : flottants réduits en simple précision, codes en entiers."""
+    return _F32.unpack(_F32.pack(v))[0] if fmt == "f" else int(v)
+
+
+def _table(snap):
+    return {ac.id: (ac.type_label,) + tuple(_wire(getattr(ac, name), fmt) for name, fmt in FIELDS)
+            for ac in snap.aircrafts}
+
+
+def _rows(mirror):
+    return {uid: tuple(row) for uid, row in mirror.rows.items()}
+
+
+def _apply(mirror, frame):
+    return mirror.apply(FRAME.unpack_from(frame), frame[FRAME.size:])
+
+
+def _snapshots(ticks, seed=0):
+    """Instantanés d'une partie accélérée : apparitions, crashs, sorties et disparitions."""
+    model = SimulationModel(1000, 1000, seed=seed, levels={1: {"total": 40, "rate": 0.3, "score_min": 0}})
+    model.reset_game()
+    for _ in range(ticks):
+        model.update(SIM_DT)
+        yield take_snapshot(model)
+
+
+def test_keyframe_and_deltas_rebuild_the_table():
+    encoder = TelemetryEncoder()
+    mirror, late = TelemetryMirror(), None
+    removed = 0
+    for tick, snap in enumerate(_snapshots(1500)):
+        data = encoder.delta(snap)
+        frame = _apply(mirror, data)
+        assert (frame.kind, frame.tick, frame.score) == (DELTA, snap.tick, snap.score)
+        assert _rows(mirror) == _table(snap)
+        removed += len(frame.removed)
+        if late is not None:
+            _apply(late, data)
+            assert _rows(late) == _table(snap)
+        elif tick == 300:
+            # Client arrivé en cours de partie : trame complète, puis les mêmes deltas que les autres
+            late = TelemetryMirror()
+            assert _apply(late, encoder.keyframe()).kind == KEYFRAME
+            assert _rows(late) == _table(snap)
+    assert removed > 0
+
+
+def test_slow_subscriber_resyncs_from_a_keyframe():
+    server = TelemetryServer(queue_size=2)  # non démarré : _broadcast appelé directement
+    sub = _Subscriber(None, server.queue_size)
+    server.subscribers.add(sub)
+    snaps = list(_snapshots(400))[-6:]
+    for snap in snaps:
+        server._pending = snap
+        server._broadcast()  # personne ne vide la file
+    assert sub.resyncs == 2
+    mirror = TelemetryMirror()
+    kinds = []
+    while not sub.queue.empty():
+        kinds.append(_apply(mirror, sub.queue.get_nowait()).kind)
+    assert kinds == [KEYFRAME, DELTA]  # les trames en retard ont été jetées
+    assert _rows(mirror) == _table(snaps[-1])
+
+
+def test_loopback_client_follows_the_stream():
+    server = TelemetryServer()
+    host, port = server.start()
+    snaps = list(_snapshots(600))
+    by_tick = {snap.tick: snap for snap in snaps}
+
+    async def main():
+        client = await TelemetryClient.connect(host, port)
+        try:
+            for snap in snaps:
+                server.publish(snap)
+                frame = await asyncio.wait_for(client.read_frame(), 5.0)
+                assert _rows(client.mirror) == _table(by_tick[frame.tick])
+            assert client.mirror.keyframes == 1
+        finally:
+            await client.close()
+
+    try:
+        asyncio.run(main())
+    finally:
+        server.close()
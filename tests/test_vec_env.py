@@ -0,0 +1,87 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.vec_env import VecEnv, NOOP, heading_action
+
+
+def _random_actions(env, rng):
+    return rng.integers(0, env.n_actions, size=(env.n, env.max_aircraft))
+
+
+def test_aircraft_keep_their_slot():
+    env = VecEnv(2, seed=0, max_aircraft=8, frame_skip=5)
+    obs = env.reset()
+    known = [{} for _ in range(env.n)]  # id -> emplacement vu au premier pas
+    for _ in range(300):
+        obs, _, dones, _ = env.step(np.full((env.n, env.max_aircraft), NOOP))
+        for i, model in enumerate(env.models):
+            if dones[i]:
+                known[i].clear()
+                continue
+            ids = env.slot_ids[i]
+            for k, uid in enumerate(ids):
+                if uid is None:
+                    assert not obs[i, k].any()
+                    continue
+                assert known[i].setdefault(uid, k) == k
+                ac = model.registry.get(uid)
+                assert obs[i, k, 0] == 1.0
+                assert obs[i, k, 1] == pytest.approx(ac.x / model.width, abs=1e-6)
+            assert sum(uid is not None for uid in ids) == min(len(model.aircrafts), env.max_aircraft)
+    assert max(map(len, known)) > 1
+
+
+def test_done_environments_are_reset():
+    env = VecEnv(3, seed=0, frame_skip=200, max_episode_steps=4)  # 1re apparition après 8 s
+    env.reset()
+    for _ in range(3):
+        _, _, dones, info = env.step(np.zeros((3, 32), dtype=int))
+        assert not dones.any() and "final_observation" not in info
+    final_scores = [m.score for m in env.models]
+    obs, _, dones, info = env.step(np.zeros((3, 32), dtype=int))
+    assert dones.all() and info["truncated"].all()
+    assert info["final_observation"][:, :, 0].any()
+    assert list(info["score"]) == final_scores  # score de fin d'épisode, pas celui du nouveau
+    assert (env.episodes == 1).all() and (env.steps == 0).all()
+    for i, model in enumerate(env.models):
+        assert model.planes_spawned == 0 and model.score == 0
+        assert obs[i, :, 0].sum() == len(model.aircrafts)
+
+
+def test_reward_is_score_change():
+    env = VecEnv(4, seed=3, max_aircraft=16, frame_skip=10, max_episode_steps=300)
+    env.reset()
+    rng = np.random.default_rng(0)
+    before = env.scores.copy()
+    rewarded = 0
+    for _ in range(600):
+        _, rewards, dones, info = env.step(_random_actions(env, rng))
+        np.testing.assert_array_equal(rewards, info["score"] - before)
+        rewarded += np.count_nonzero(rewards)
+        # Épisode relancé : la récompense suivante part du score de départ du nouveau niveau
+        before = np.array([m.score for m in env.models])
+    assert rewarded > 0
+
+
+def _heading_then(bad):
+    actions = np.full((2, 32), heading_action(90))
+    actions[-1, -1] = bad  # seul le dernier ordre est hors limites
+    return actions
+
+
+@pytest.mark.parametrize("actions", [
+    np.zeros((2, 31), dtype=int), np.zeros((32,), dtype=int), np.zeros((2, 32)), np.zeros((2, 32), dtype=bool),
+    _heading_then(-1), _heading_then(15),
+])
+def test_invalid_actions_apply_nothing(actions):
+    env = VecEnv(2, seed=0)
+    env.reset()
+    for _ in range(50):
+        env.step(np.zeros((2, 32), dtype=int))
+    headings = [[ac.target_heading for ac in m.aircrafts] for m in env.models]
+    ticks = [m.tick for m in env.models]
+    with pytest.raises(ValueError):
+        env.step(actions)
+    assert [[ac.target_heading for ac in m.aircrafts] for m in env.models] == headings
+    assert [m.tick for m in env.models] == ticks